@@ -1,6 +1,8 @@
 """Entry point for the Terminal Solar System simulation."""
 
 import argparse
+from terminal_solar_system.config import SPRITE_RADIUS_QUANTUM
+from terminal_solar_system.governor import QUALITY_LEVELS
 from terminal_solar_system.main import main
 
 
@@ -11,6 +13,10 @@ if __name__ == "__main__":
     parser.add_argument(
         "--random", action="store_true", help="randomise planets"
     )
+    parser.add_argument(
+        "--scene", metavar="FILE", default=None,
+        help="load the bodies from FILE (.json, .toml or .npy)"
+    )
     parser.add_argument(
         "--color", action="store_true", help="enable color output"
     )
@@ -23,5 +29,235 @@ if __name__ == "__main__":
     parser.add_argument(
         "--x-scale", type=float, default=2.2, help="font height/width ratio"
     )
+    parser.add_argument(
+        "--backend", choices=["python", "numpy", "parallel"],
+        default="python", help="frame renderer"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="worker processes for the parallel backend (default: CPUs)"
+    )
+    parser.add_argument(
+        "--sprite-cache", nargs="?", type=float, metavar="QUANTUM",
+        const=SPRITE_RADIUS_QUANTUM, default=None, dest="sprite_quantum",
+        help="stamp planets from cached discs quantized to QUANTUM "
+        f"(default: {SPRITE_RADIUS_QUANTUM})"
+    )
+    parser.add_argument(
+        "--output", choices=["ansi", "rich"], default=None,
+        help="terminal writer (default: rich with --color, ansi without)"
+    )
+    parser.add_argument(
+        "--diff-output", action="store_true",
+        help="same as --output ansi"
+    )
+    parser.add_argument(
+        "--lod", action="store_true",
+        help="draw small planets as points and mid-size ones from sprites"
+    )
+    parser.add_argument(
+        "--governor", action="store_true",
+        help="lower quality when frames run over budget, raise it again "
+        "when there is headroom"
+    )
+    parser.add_argument(
+        "--quality", type=int, choices=range(len(QUALITY_LEVELS)),
+        default=0, metavar="LEVEL",
+        help="starting quality level with --governor, fixed level without "
+        "(0 full, 1 fewer stars, 2 coarse discs, 3 no rings, "
+        "4 point planets)"
+    )
+    parser.add_argument(
+        "--gravity", nargs="?", choices=["tree", "direct"], const="tree",
+        default=None,
+        help="bodies attract each other, with forces from a Barnes-Hut "
+        "octree (default) or summed directly over every pair"
+    )
+    parser.add_argument(
+        "--particles", type=int, default=0, metavar="N",
+        help="add a cloud of N particles that collapses under --gravity"
+    )
+    parser.add_argument(
+        "--zoom", type=float, default=None,
+        help="starting camera magnification (default: 1); bodies outside "
+        "the view are culled before drawing"
+    )
+    parser.add_argument(
+        "--zbuffer", action="store_true",
+        help="composite planets per cell by depth instead of painting them "
+        "back to front, so rings pass behind their planets"
+    )
+    parser.add_argument(
+        "--pipeline", action="store_true",
+        help="write frames on a separate thread while the next is simulated"
+    )
+    parser.add_argument(
+        "--runtime", choices=["threads", "asyncio"], default="threads",
+        help="event loop; asyncio adds keys: space pause, +/- speed, "
+        "c color, z/x zoom, w/a/s/d pan, 0 reset view"
+    )
+    parser.add_argument(
+        "--stats", action="store_true",
+        help="show fps and per-stage frame times in a HUD"
+    )
+    parser.add_argument(
+        "--stats-out", metavar="FILE", default=None,
+        help="append per-frame stage timings to FILE (.csv or JSON lines)"
+    )
+    parser.add_argument(
+        "--record", metavar="FILE", default=None,
+        help="stream the session to FILE as an asciicast v2 recording"
+    )
+    parser.add_argument(
+        "--play", metavar="FILE", default=None,
+        help="replay an asciicast recording without simulating"
+    )
+    benchmark_group = parser.add_argument_group(
+        "off-screen",
+        "benchmark or pre-render frames without a terminal or sleeping"
+    )
+    benchmark_group.add_argument(
+        "--benchmark", action="store_true", help="run the benchmark"
+    )
+    benchmark_group.add_argument(
+        "--kepler", action="store_true",
+        help="with --benchmark, time the Kepler solver on --bodies "
+        "elliptical orbits (default: 10000) instead of the renderer"
+    )
+    benchmark_group.add_argument(
+        "--check-gravity", action="store_true",
+        help="with --benchmark, check Barnes-Hut forces against direct "
+        "summation on a cloud of --bodies particles (default: 2000)"
+    )
+    benchmark_group.add_argument(
+        "--render-out", metavar="FILE", default=None,
+        help="render --duration seconds at --fps to FILE (.cast or text)"
+    )
+    benchmark_group.add_argument(
+        "--duration", type=float, default=10.0,
+        help="seconds of animation to render"
+    )
+    benchmark_group.add_argument(
+        "--frames", type=int, default=300, help="frames to render"
+    )
+    benchmark_group.add_argument(
+        "--bodies", type=int, default=None,
+        help="planets in a random system (default: the solar system)"
+    )
+    benchmark_group.add_argument(
+        "--width", type=int, default=200, help="off-screen terminal width"
+    )
+    benchmark_group.add_argument(
+        "--height", type=int, default=60, help="off-screen terminal height"
+    )
+    benchmark_group.add_argument(
+        "--seed", type=int, default=None, help="random seed"
+    )
+    benchmark_group.add_argument(
+        "--json", metavar="FILE", default=None,
+        help="write the results to FILE as JSON"
+    )
     args = parser.parse_args()
-    main(args.fps, args.color, args.stars, args.x_scale, args.random)
+    if args.backend == "parallel" and (
+        args.lod or args.sprite_quantum is not None
+    ):
+        parser.error("the parallel backend does not support --lod or sprites")
+    if args.backend == "parallel" and (args.governor or args.quality):
+        parser.error("the parallel backend does not support --governor")
+    if args.backend == "parallel" and args.zbuffer:
+        parser.error("the parallel backend does not support --zbuffer")
+    if args.backend == "parallel" and args.render_out is not None:
+        parser.error("--render-out already renders frames in parallel")
+    if args.render_out is not None and args.gravity is not None:
+        parser.error("--render-out needs closed-form orbits, not --gravity")
+    if args.zoom is not None and args.zoom <= 0:
+        parser.error("--zoom must be positive")
+    if args.kepler and args.check_gravity:
+        parser.error("--kepler and --check-gravity are separate benchmarks")
+    if args.play is not None:
+        from terminal_solar_system.main import replay
+        replay(args.play)
+    elif args.render_out is not None:
+        from terminal_solar_system.offline import render_offline
+        render_offline(
+            args.render_out,
+            args.duration,
+            args.fps,
+            args.width,
+            args.height,
+            args.stars,
+            random_planets=args.random,
+            print_color=args.color,
+            terminal_x_scale=args.x_scale,
+            backend=args.backend,
+            workers=args.workers,
+            seed=args.seed,
+            scene_path=args.scene
+        )
+    elif args.benchmark and args.kepler:
+        from terminal_solar_system.benchmark import kepler_benchmark
+        kepler_benchmark(
+            10000 if args.bodies is None else args.bodies,
+            args.frames,
+            args.fps,
+            seed=args.seed,
+            json_path=args.json
+        )
+    elif args.benchmark and args.check_gravity:
+        from terminal_solar_system.benchmark import gravity_benchmark
+        gravity_benchmark(
+            2000 if args.bodies is None else args.bodies,
+            args.frames,
+            seed=args.seed,
+            json_path=args.json
+        )
+    elif args.benchmark:
+        from terminal_solar_system.benchmark import benchmark
+        benchmark(
+            args.frames,
+            args.width,
+            args.height,
+            args.stars,
+            planet_count=args.bodies,
+            random_planets=args.random,
+            print_color=args.color,
+            terminal_x_scale=args.x_scale,
+            backend=args.backend,
+            sprite_quantum=args.sprite_quantum,
+            level_of_detail=args.lod,
+            workers=args.workers,
+            seed=args.seed,
+            json_path=args.json,
+            scene_path=args.scene,
+            zoom=args.zoom,
+            zbuffer=args.zbuffer
+        )
+    else:
+        main(
+            args.fps,
+            args.color,
+            args.stars,
+            args.x_scale,
+            args.random,
+            backend=args.backend,
+            sprite_quantum=args.sprite_quantum,
+            diff_output=(
+                args.diff_output
+                or args.output == "ansi"
+                or (args.output is None and not args.color)
+            ),
+            level_of_detail=args.lod,
+            workers=args.workers,
+            pipelined=args.pipeline,
+            record_path=args.record,
+            show_stats=args.stats,
+            metrics_path=args.stats_out,
+            runtime=args.runtime,
+            governed=args.governor,
+            quality=args.quality,
+            scene_path=args.scene,
+            gravity=args.gravity,
+            particle_count=args.particles,
+            zoom=1.0 if args.zoom is None else args.zoom,
+            zbuffer=args.zbuffer
+        )
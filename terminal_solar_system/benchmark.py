@@ -0,0 +1,501 @@
+import io
+import json
+import math
+import platform
+import random
+import time
+
+import numpy as np
+from rich.console import Console
+
+from terminal_solar_system.camera import Camera
+from terminal_solar_system.framebuffer import DepthBuffer, FrameBuffer
+from terminal_solar_system.lod import LevelOfDetail
+from terminal_solar_system.main import (
+    add_particle_cloud,
+    add_random_solar_system,
+    add_scene,
+    add_solar_system,
+    get_renderer,
+)
+from terminal_solar_system.config import MAX_PERIOD, MIN_PERIOD, NBODY_THETA
+from terminal_solar_system.nbody import GravitySystem, direct_accelerations
+from terminal_solar_system.planets import BODY_DTYPE, PlanetSystem, StarField
+from terminal_solar_system.renderer import serialize_frame
+from terminal_solar_system.sprites import SpriteCache
+from terminal_solar_system.utils import solve_kepler
+
+STAGES = ("update", "rasterize", "serialize", "total")
+KEPLER_STAGES = ("update", "warm", "cold")
+GRAVITY_STAGES = ("tree", "direct", "update")
+PERCENTILES = (50, 95, 99, 100)
+
+
+def benchmark(
+    frames,
+    width,
+    height,
+    star_count,
+    planet_count=None,
+    random_planets=False,
+    print_color=False,
+    terminal_x_scale=2.2,
+    backend="python",
+    sprite_quantum=None,
+    level_of_detail=False,
+    workers=None,
+    seed=None,
+    json_path=None,
+    scene_path=None,
+    zoom=None,
+    zbuffer=False,
+):
+    """Renders frames off-screen as fast as possible and prints frame time
+    percentiles for each stage.
+
+    Args:
+        frames (int): Number of frames to render.
+        width (int): Width of the off-screen terminal.
+        height (int): Height of the off-screen terminal.
+        star_count (int): Stars in the background.
+        planet_count (int, optional): If given, a random system with exactly
+            this many planets is used. Defaults to None.
+        random_planets (bool, optional): Randomised planets.
+            Defaults to False.
+        print_color (bool, optional): Enabled color. Defaults to False.
+        terminal_x_scale (float, optional): Font height/width ratio.
+            Defaults to 2.2.
+        backend (str, optional): Frame renderer, "python", "numpy" or
+            "parallel". Defaults to "python".
+        sprite_quantum (float, optional): If given, planets are stamped from
+            a sprite cache with this radius step. Defaults to None.
+        level_of_detail (bool, optional): Draw small planets as points and
+            mid-size planets from cached sprites. Defaults to False.
+        workers (int, optional): Worker processes for the parallel backend.
+            Defaults to the number of CPUs.
+        seed (int, optional): Seed for the random scene. Defaults to None.
+        json_path (str, optional): File to write the results to as JSON.
+            Defaults to None.
+        scene_path (str, optional): Scene file to load the bodies from.
+            Overrides `planet_count`. Defaults to None.
+        zoom (float, optional): If given, frames are drawn through a
+            camera at this magnification, which culls the bodies outside
+            the frame. Defaults to None.
+        zbuffer (bool, optional): Composite planets with a depth buffer
+            instead of painting them back to front. Defaults to False.
+
+    Returns:
+        dict: The benchmark results.
+    """
+    if seed is not None:
+        random.seed(seed)
+    console = Console(
+        file=io.StringIO(),
+        width=width,
+        height=height,
+        force_terminal=True,
+        color_system="truecolor",
+    )
+    sprite_cache = None
+    if sprite_quantum is not None:
+        sprite_cache = SpriteCache(quantum=sprite_quantum)
+    lod = None
+    if level_of_detail:
+        lod = LevelOfDetail(sprite_cache=sprite_cache)
+    camera = None if zoom is None else Camera(zoom)
+    depth_buffer = DepthBuffer() if zbuffer else None
+    stars = StarField(console, star_count, np.random.default_rng(seed))
+    planets = PlanetSystem()
+    loading = time.perf_counter()
+    if planet_count is not None and scene_path is None:
+        add_random_solar_system(planets, planet_count, planet_count)
+    else:
+        add_scene(planets, scene_path, random_planets)
+    load_time = time.perf_counter() - loading
+
+    frame_buffer = FrameBuffer()
+    samples = {stage: [] for stage in STAGES}
+    renderer = get_renderer(backend, workers)
+    try:
+        for _ in range(frames):
+            start = time.perf_counter()
+            stars.update()
+            planets.update()
+            updated = time.perf_counter()
+            if backend != "python":
+                renderer.rasterize(
+                    planets,
+                    stars,
+                    width,
+                    height,
+                    terminal_x_scale,
+                    sprite_cache,
+                    lod,
+                    camera,
+                    depth_buffer
+                )
+                rasterized = time.perf_counter()
+                text = renderer.serialize(print_color)
+            else:
+                buffer = renderer.rasterize_frame(
+                    planets,
+                    stars,
+                    width,
+                    height,
+                    terminal_x_scale,
+                    sprite_cache,
+                    lod,
+                    frame_buffer,
+                    camera,
+                    depth_buffer
+                )
+                rasterized = time.perf_counter()
+                text = serialize_frame(buffer, print_color)
+            console.print(text)
+            console.file.seek(0)
+            console.file.truncate()
+            end = time.perf_counter()
+            samples["update"].append(updated - start)
+            samples["rasterize"].append(rasterized - updated)
+            samples["serialize"].append(end - rasterized)
+            samples["total"].append(end - start)
+    finally:
+        close_renderer = getattr(renderer, "close", None)
+        if close_renderer is not None:
+            close_renderer()
+
+    results = {
+        "config": {
+            "frames": frames,
+            "width": width,
+            "height": height,
+            "stars": star_count,
+            "planets": len(planets),
+            "color": print_color,
+            "x_scale": terminal_x_scale,
+            "backend": backend,
+            "workers": getattr(renderer, "workers", None),
+            "sprite_quantum": sprite_quantum,
+            "level_of_detail": level_of_detail,
+            "seed": seed,
+            "scene": scene_path,
+            "zoom": zoom,
+            "zbuffer": zbuffer,
+        },
+        "machine": machine(),
+        "timestamp": time.time(),
+        "load_ms": load_time * 1000,
+        "stages_ms": stage_percentiles(samples),
+    }
+    if camera is not None:
+        results["culled_per_frame"] = camera.total_culled / max(frames, 1)
+    print(format_results(results))
+    if json_path is not None:
+        with open(json_path, "w") as file:
+            json.dump(results, file, indent=2)
+    return results
+
+
+def kepler_benchmark(
+    body_count=10000,
+    frames=300,
+    framerate=30,
+    seed=None,
+    json_path=None,
+):
+    """Times the Kepler solver on a belt of elliptical orbits and prints
+    per-frame percentiles.
+
+    Each frame advances the belt by 1 / framerate seconds. "update" is the
+    whole PlanetSystem update, "warm" the solver started from the previous
+    frame's eccentric anomalies, and "cold" the solver started from scratch.
+
+    Args:
+        body_count (int, optional): Bodies on elliptical orbits.
+            Defaults to 10000.
+        frames (int, optional): Number of frames to time. Defaults to 300.
+        framerate (float, optional): Frames per second of simulated time.
+            Defaults to 30.
+        seed (int, optional): Seed for the belt. Defaults to None.
+        json_path (str, optional): File to write the results to as JSON.
+            Defaults to None.
+
+    Returns:
+        dict: The benchmark results.
+    """
+    rng = np.random.default_rng(seed)
+    records = np.zeros(body_count, dtype=BODY_DTYPE)
+    records["radius"] = 0.5
+    records["orbit_radius"] = rng.uniform(20, 150, body_count)
+    records["period"] = rng.uniform(MIN_PERIOD, MAX_PERIOD, body_count)
+    records["angle"] = rng.uniform(0, 2 * math.pi, body_count)
+    records["eccentricity"] = rng.uniform(0, 0.9, body_count)
+    records["periapsis"] = rng.uniform(0, 2 * math.pi, body_count)
+    records["line_width"] = 1
+    records["symbol"] = "."
+    records["color"] = "white"
+    records["parent"] = -1
+    planets = PlanetSystem(clock=lambda: 0.0)
+    planets.extend_records(records)
+    planets.update(0.0)
+
+    samples = {stage: [] for stage in KEPLER_STAGES}
+    steps = {"warm": 0, "cold": 0}
+    for frame in range(1, frames + 1):
+        previous = planets.anomaly.copy()
+        start = time.perf_counter()
+        planets.update(frame / framerate)
+        updated = time.perf_counter()
+        steps["warm"] += planets.kepler_steps
+        mean, eccentricity = planets.angle, planets.eccentricity
+        solve_start = time.perf_counter()
+        solve_kepler(mean, eccentricity, previous)
+        solved = time.perf_counter()
+        steps["cold"] += solve_kepler(mean, eccentricity)[1]
+        end = time.perf_counter()
+        samples["update"].append(updated - start)
+        samples["warm"].append(solved - solve_start)
+        samples["cold"].append(end - solved)
+
+    results = {
+        "config": {
+            "bodies": body_count,
+            "frames": frames,
+            "framerate": framerate,
+            "seed": seed,
+        },
+        "machine": machine(),
+        "timestamp": time.time(),
+        "stages_ms": stage_percentiles(samples),
+        "steps_per_body": {
+            start: total / (frames * body_count)
+            for start, total in steps.items()
+        },
+    }
+    print(format_kepler_results(results))
+    if json_path is not None:
+        with open(json_path, "w") as file:
+            json.dump(results, file, indent=2)
+    return results
+
+
+def gravity_benchmark(
+    particle_count=2000,
+    frames=100,
+    theta=NBODY_THETA,
+    seed=None,
+    json_path=None,
+):
+    """Checks the Barnes-Hut forces against direct summation on a
+    collapsing particle cloud and prints timings and errors.
+
+    Each frame takes one physics step. "tree" is the Barnes-Hut force
+    evaluation, "direct" the O(n²) sum over every pair of bodies on the
+    same positions, and "update" the whole physics step. The force error is
+    the distance between the two accelerations of each body relative to the
+    exact one, over every body and frame, and the energy drift is the
+    relative change in total energy over the run.
+
+    Args:
+        particle_count (int, optional): Particles in the cloud around the
+            solar system. Defaults to 2000.
+        frames (int, optional): Number of frames to time. Defaults to 100.
+        theta (float, optional): Barnes-Hut opening angle.
+            Defaults to NBODY_THETA.
+        seed (int, optional): Seed for the cloud. Defaults to None.
+        json_path (str, optional): File to write the results to as JSON.
+            Defaults to None.
+
+    Returns:
+        dict: The benchmark results.
+    """
+    if seed is not None:
+        random.seed(seed)
+    planets = GravitySystem(clock=lambda: 0.0, theta=theta, max_steps=1)
+    add_solar_system(planets)
+    add_particle_cloud(planets, particle_count)
+    planets.update(0.0)
+    initial_energy = planets.energy()
+
+    samples = {stage: [] for stage in GRAVITY_STAGES}
+    errors = []
+    for frame in range(1, frames + 1):
+        start = time.perf_counter()
+        tree = planets.accelerations()
+        treed = time.perf_counter()
+        exact = direct_accelerations(
+            planets.position, planets.mass, planets.gravity,
+            planets.softening
+        )
+        summed = time.perf_counter()
+        planets.update(frame * planets.timestep)
+        end = time.perf_counter()
+        samples["tree"].append(treed - start)
+        samples["direct"].append(summed - treed)
+        samples["update"].append(end - summed)
+        errors.extend(
+            (
+                np.linalg.norm(tree - exact, axis=1)
+                / np.maximum(np.linalg.norm(exact, axis=1), 1e-12)
+            ).tolist()
+        )
+
+    results = {
+        "config": {
+            "bodies": len(planets),
+            "particles": particle_count,
+            "frames": frames,
+            "theta": theta,
+            "timestep": planets.timestep,
+            "seed": seed,
+        },
+        "machine": machine(),
+        "timestamp": time.time(),
+        "stages_ms": stage_percentiles(samples),
+        "force_error": {
+            f"p{p}" if p < 100 else "max": percentile(errors, p)
+            for p in PERCENTILES
+        },
+        "energy_drift": (
+            (planets.energy() - initial_energy) / abs(initial_energy)
+        ),
+    }
+    print(format_gravity_results(results))
+    if json_path is not None:
+        with open(json_path, "w") as file:
+            json.dump(results, file, indent=2)
+    return results
+
+
+def machine():
+    """Returns a description of the machine running the benchmark.
+
+    Returns:
+        dict: Python version and implementation, platform and processor.
+    """
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+    }
+
+
+def stage_percentiles(samples):
+    """Returns the percentiles of each stage's frame times in milliseconds.
+
+    Args:
+        samples (dict[str, list[float]]): Seconds per frame for each stage.
+
+    Returns:
+        dict: PERCENTILES of each stage, keyed "p50", ..., "max".
+    """
+    return {
+        stage: {
+            f"p{p}" if p < 100 else "max": percentile(times, p) * 1000
+            for p in PERCENTILES
+        }
+        for stage, times in samples.items()
+    }
+
+
+def percentile(samples, p):
+    """Returns the nearest-rank percentile of some samples.
+
+    Args:
+        samples (list[float]): Samples to rank.
+        p (float): Percentile between 0 and 100.
+
+    Returns:
+        float: The sample at the given percentile, or 0.0 if empty.
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(math.ceil(p / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def format_results(results):
+    """Returns benchmark results as a human-readable table.
+
+    Args:
+        results (dict): Results returned by `benchmark`.
+
+    Returns:
+        str: The formatted table.
+    """
+    config = results["config"]
+    lines = [
+        f"{config['frames']} frames, {config['width']}x{config['height']}, "
+        f"{config['planets']} bodies, {config['stars']} stars, "
+        f"{config['backend']} backend"
+        f"{', z-buffer' if config['zbuffer'] else ''}, "
+        f"loaded in {results['load_ms']:.1f}ms",
+    ]
+    if "culled_per_frame" in results:
+        lines.append(
+            f"zoom {config['zoom']:g}x, "
+            f"{results['culled_per_frame']:.1f} bodies culled per frame"
+        )
+    return "\n".join(lines + _stage_table(results["stages_ms"]))
+
+
+def format_kepler_results(results):
+    """Returns Kepler solver benchmark results as a human-readable table.
+
+    Args:
+        results (dict): Results returned by `kepler_benchmark`.
+
+    Returns:
+        str: The formatted table.
+    """
+    config = results["config"]
+    steps = results["steps_per_body"]
+    lines = [
+        f"{config['frames']} frames, {config['bodies']} elliptical orbits, "
+        f"{config['framerate']} fps",
+        *_stage_table(results["stages_ms"]),
+        f"Newton steps per body: {steps['warm']:.2f} warm, "
+        f"{steps['cold']:.2f} cold",
+    ]
+    return "\n".join(lines)
+
+
+def format_gravity_results(results):
+    """Returns gravity benchmark results as a human-readable table.
+
+    Args:
+        results (dict): Results returned by `gravity_benchmark`.
+
+    Returns:
+        str: The formatted table.
+    """
+    config = results["config"]
+    error = results["force_error"]
+    lines = [
+        f"{config['frames']} steps, {config['bodies']} bodies, "
+        f"theta {config['theta']}",
+        *_stage_table(results["stages_ms"]),
+        "force error vs direct: " + ", ".join(
+            f"{column} {value:.3%}" for column, value in error.items()
+        ),
+        f"energy drift: {results['energy_drift']:.3%}",
+    ]
+    return "\n".join(lines)
+
+
+def _stage_table(stages_ms):
+    """Returns the lines of a table of stage percentiles."""
+    lines = [
+        f"{'ms':<10}" + "".join(
+            f"{column:>9}" for column in ("p50", "p95", "p99", "max")
+        ),
+    ]
+    for stage, stats in stages_ms.items():
+        lines.append(
+            f"{stage:<10}" + "".join(
+                f"{value:>9.3f}" for value in stats.values()
+            )
+        )
+    return lines
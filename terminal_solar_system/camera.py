@@ -0,0 +1,172 @@
+from terminal_solar_system.config import (
+    DEPTH_OF_FIELD_MODIFIER,
+    MAX_ZOOM,
+    MIN_ZOOM,
+    PAN_STEP,
+    RING_SIZE_MODIFIER,
+)
+from terminal_solar_system.planets import BodySystem
+
+
+class Camera:
+    """Zooms and pans the view of the planets, and culls the bodies that
+    fall outside the frame before any per-cell work is done for them.
+
+    The scene point (`pan_x`, `pan_y`) is drawn at the centre of the frame
+    and distances from it are multiplied by `zoom`, as are the planets'
+    radii. Borders stay the same width and the stars stay where they are.
+    """
+
+    def __init__(self, zoom=1.0, pan_x=0.0, pan_y=0.0):
+        """Initialises a new Camera.
+
+        Args:
+            zoom (float, optional): Magnification. Defaults to 1.0.
+            pan_x (float, optional): Scene x-coordinate drawn at the centre
+                of the frame. Defaults to 0.0.
+            pan_y (float, optional): Scene y-coordinate drawn at the centre
+                of the frame. Defaults to 0.0.
+
+        Attributes:
+            culled (int): Bodies culled from the last frame.
+            total_culled (int): Bodies culled over every frame.
+            frames (int): Frames placed.
+        """
+        self.zoom = zoom
+        self.pan_x = pan_x
+        self.pan_y = pan_y
+        self.culled = 0
+        self.total_culled = 0
+        self.frames = 0
+
+    def zoom_by(self, factor):
+        """Multiplies the zoom, keeping it between MIN_ZOOM and MAX_ZOOM.
+
+        Args:
+            factor (float): Zoom multiplier.
+
+        Returns:
+            None
+        """
+        self.zoom = min(max(self.zoom * factor, MIN_ZOOM), MAX_ZOOM)
+
+    def pan(self, columns, rows):
+        """Moves the view by a number of PAN_STEP steps on screen, however
+        far it is zoomed.
+
+        Args:
+            columns (float): Steps to the right.
+            rows (float): Steps down.
+
+        Returns:
+            None
+        """
+        self.pan_x += columns * PAN_STEP / self.zoom
+        self.pan_y += rows * PAN_STEP / self.zoom
+
+    def reset(self):
+        """Goes back to the unzoomed view of the centre.
+
+        Returns:
+            None
+        """
+        self.zoom = 1.0
+        self.pan_x = 0.0
+        self.pan_y = 0.0
+
+    def place(
+        self,
+        planets,
+        width,
+        height,
+        terminal_x_scale,
+        sprite_cache=None,
+        lod=None,
+        front_to_back=False
+    ):
+        """Returns where to draw the bodies that may show up in the frame,
+        in drawing order.
+
+        A body is kept if the box around its disc, border and ring overlaps
+        the frame, so culling never changes what is drawn. The bounds of
+        every body are tested in one vectorized pass, and only the bodies
+        kept are sorted.
+
+        Args:
+            planets (list[Planet] | BodySystem): Bodies to place.
+            width (int): Width of the frame.
+            height (int): Height of the frame.
+            terminal_x_scale (float): Font height/width ratio.
+            sprite_cache (SpriteCache, optional): Cache planets are stamped
+                from, whose sprites may be up to half a quantum larger than
+                the disc. Defaults to None.
+            lod (LevelOfDetail, optional): Level of detail whose sprite
+                cache planets may be stamped from, and which may leave out
+                rings. Defaults to None.
+            front_to_back (bool, optional): Sort the bodies kept nearest
+                first instead of farthest first. Defaults to False.
+
+        Returns:
+            list[tuple]: (planet, center_x, center_y) of each body kept,
+                sorted by depth.
+        """
+        import numpy as np
+
+        if isinstance(planets, BodySystem):
+            x, y, z = planets.x, planets.y, planets.z
+            radius, ring = planets.radius, planets.has_ring
+            half_width = planets.line_width / 2
+        else:
+            planets = list(planets)
+            x, y, z, radius, half_width, ring = np.array([
+                (
+                    planet.x, planet.y, planet.z, planet.radius,
+                    planet.line_width / 2, planet.has_ring
+                )
+                for planet in planets
+            ], dtype=np.float64).reshape(-1, 6).T
+
+        margin = 0.0
+        for cache in (sprite_cache, lod and lod.sprite_cache):
+            if cache is not None:
+                margin = max(margin, cache.quantum / 2)
+        if lod is not None and not lod.rings:
+            ring = 0
+        size = np.abs(radius + z / DEPTH_OF_FIELD_MODIFIER) * self.zoom
+        extent = np.maximum(
+            size + half_width, ring * size * RING_SIZE_MODIFIER
+        ) + margin
+
+        # One extra cell covers rounding to cells, including rings
+        # truncated towards zero from just outside the frame.
+        center_x = width // 2 + (x - self.pan_x) * self.zoom
+        center_y = height // 2 + (y - self.pan_y) * self.zoom
+        reach_x = extent * abs(terminal_x_scale) + 1
+        reach_y = extent + 1
+        kept = np.flatnonzero(
+            (center_x + reach_x >= 0) & (center_x - reach_x < width)
+            & (center_y + reach_y >= 0) & (center_y - reach_y < height)
+        )
+        depth = -z[kept] if front_to_back else z[kept]
+        kept = kept[np.argsort(depth, kind="stable")]
+
+        self.culled = len(planets) - len(kept)
+        self.total_culled += self.culled
+        self.frames += 1
+        return list(zip(
+            [planets[index] for index in kept.tolist()],
+            center_x[kept].tolist(),
+            center_y[kept].tolist(),
+        ))
+
+    def __str__(self):
+        """Returns the view and how many bodies were culled.
+
+        Returns:
+            str: Zoom, pan and culled bodies per frame.
+        """
+        average = self.total_culled / self.frames if self.frames else 0.0
+        return (
+            f"camera: zoom {self.zoom:g}x at ({self.pan_x:g}, "
+            f"{self.pan_y:g}), {average:.1f} bodies culled per frame"
+        )
@@ -3,6 +3,8 @@ import math
 DEPTH_OF_FIELD_MODIFIER = 30
 TERMINAL_X_SCALE = 2.2
 STAR_FRAME_HOLD = 0.5
+STAR_FRAMES = [' ', '.', '+', '*', '+', '.', ' ']
+STAR_COLOR = "white"
 
 MIN_RADIUS = 1
 MAX_RADIUS = 5
@@ -25,10 +27,61 @@ FILL_SYMBOLS = [
     ' ', '.', ',', '`', '\'', ':', ';', '_', '^', '"', '/'
 ]
 PLANET_COLORS = [
-    'white', 'yellow', 'bright_yellow', 'gold',
-    'red', 'bright_red', 'pink',
+    'white', 'yellow', 'bright_yellow', 'gold1',
+    'red', 'bright_red', 'pink1',
     'magenta', 'bright_magenta',
     'green', 'bright_green',
     'cyan', 'bright_cyan',
     'blue', 'bright_blue'
 ]
+
+SPRITE_CACHE_SIZE = 256
+SPRITE_RADIUS_QUANTUM = 0.25
+
+LOD_POINT_RADIUS = 1.0
+LOD_STAMP_RADIUS = 8.0
+
+PIPELINE_DEPTH = 1
+
+RECORD_BUFFER_SIZE = 1 << 16
+OFFLINE_CHUNK_SIZE = 32
+
+STATS_WINDOW = 60
+STATS_COLOR = "bright_green"
+
+SPEED_STEP = 2.0
+MIN_SPEED = 1 / 16
+MAX_SPEED = 16.0
+
+ZOOM_STEP = 1.5
+MIN_ZOOM = 1 / 16
+MAX_ZOOM = 64.0
+PAN_STEP = 4
+
+GOVERNOR_WINDOW = 30
+GOVERNOR_DOWNGRADE = 0.9
+GOVERNOR_UPGRADE = 0.5
+GOVERNOR_STAR_FRACTION = 0.5
+GOVERNOR_SPRITE_QUANTUM = 1.0
+GOVERNOR_POINT_RADIUS = 3.0
+
+SCENE_CHUNK_SIZE = 1 << 14
+
+KEPLER_TOLERANCE = 1e-6
+KEPLER_MAX_ITERATIONS = 16
+
+NBODY_GRAVITY = 240.0
+NBODY_DENSITY = 0.001
+NBODY_STAR_DENSITY = 1.0
+NBODY_SOFTENING = 5.0
+NBODY_THETA = 0.7
+NBODY_TREE_DEPTH = 16
+NBODY_TIMESTEP = 1 / 30
+NBODY_MAX_STEPS = 4
+NBODY_DIRECT_CHUNK = 256
+NBODY_PARTICLE_RADIUS = 0.4
+NBODY_CLOUD_RADIUS = 120
+NBODY_CLOUD_ECCENTRICITY = 0.5
+NBODY_CLOUD_MASS = 500.0
+NBODY_CLOUD_TILT = 1.2
+NBODY_CLOUD_SPREAD = 0.5
@@ -0,0 +1,267 @@
+import shutil
+import signal
+import threading
+
+BLANK_CELL = (' ', None)
+
+
+def blank_grid(width, height):
+    """Returns a new grid of blank cells, for a frame drawn only once.
+
+    Args:
+        width (int): Width of the grid.
+        height (int): Height of the grid.
+
+    Returns:
+        list[list[tuple]]: Rows of blank (symbol, color) cells.
+    """
+    return [[BLANK_CELL] * width for _ in range(height)]
+
+
+class FrameBuffer:
+    """Pair of (symbol, color) grids reused from frame to frame.
+
+    Each frame is drawn into the grid that was not drawn last, after
+    clearing it in place, so the previous frame stays intact for writers
+    that diff against it. The grids are only reallocated when the frame
+    size changes.
+    """
+
+    def __init__(self):
+        """Initialises a new FrameBuffer.
+
+        Attributes:
+            width (int): Width of the grids.
+            height (int): Height of the grids.
+            resized (bool): Whether the last `acquire` reallocated.
+            reallocations (int): Times the grids have been reallocated.
+        """
+        self.width = 0
+        self.height = 0
+        self.resized = False
+        self.reallocations = 0
+        self._grids = ([], [])
+        self._blank = []
+        self._current = 0
+
+    def acquire(self, width, height):
+        """Returns a cleared grid to draw the next frame into.
+
+        Args:
+            width (int): Width of the frame.
+            height (int): Height of the frame.
+
+        Returns:
+            list[list[tuple]]: Rows of blank (symbol, color) cells.
+        """
+        self._current ^= 1
+        self.resized = (width, height) != (self.width, self.height)
+        if self.resized:
+            self.width = width
+            self.height = height
+            self._blank = [BLANK_CELL] * width
+            self._grids = tuple(
+                [list(self._blank) for _ in range(height)] for _ in range(2)
+            )
+            self.reallocations += 1
+            return self._grids[self._current]
+
+        grid = self._grids[self._current]
+        blank = self._blank
+        for row in grid:
+            row[:] = blank
+        return grid
+
+
+class FramePool:
+    """Grids for frames that outlive the next one, such as frames handed
+    to a FramePipeline, each reused once its consumer releases it.
+
+    Like a FrameBuffer, every frame is drawn into a cleared grid that no
+    frame still in use is drawn in. A grid is only allocated when every
+    grid of the current size is still in use, so the pool grows to the
+    number of frames in flight and stays there. Grids may be released
+    from any thread.
+    """
+
+    def __init__(self):
+        """Initialises a new FramePool.
+
+        Attributes:
+            width (int): Width of the grids.
+            height (int): Height of the grids.
+            resized (bool): Whether the last `acquire` changed the size.
+            allocations (int): Grids allocated.
+        """
+        self.width = 0
+        self.height = 0
+        self.resized = False
+        self.allocations = 0
+        self._blank = []
+        self._free = []
+        self._lock = threading.Lock()
+
+    def acquire(self, width, height):
+        """Returns a cleared grid to draw the next frame into, which is not
+        handed out again until it is released.
+
+        Args:
+            width (int): Width of the frame.
+            height (int): Height of the frame.
+
+        Returns:
+            list[list[tuple]]: Rows of blank (symbol, color) cells.
+        """
+        self.resized = (width, height) != (self.width, self.height)
+        with self._lock:
+            if self.resized:
+                self.width = width
+                self.height = height
+                self._blank = [BLANK_CELL] * width
+                self._free = []
+            grid = self._free.pop() if self._free else None
+        blank = self._blank
+        if grid is None:
+            self.allocations += 1
+            return [list(blank) for _ in range(height)]
+        for row in grid:
+            row[:] = blank
+        return grid
+
+    def release(self, grid):
+        """Hands a grid back to be drawn into again. Grids of an earlier
+        size are dropped.
+
+        Args:
+            grid (list[list[tuple]]): A grid returned by `acquire`.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            if len(grid) == self.height and all(
+                len(row) == self.width for row in grid[:1]
+            ):
+                self._free.append(grid)
+
+
+class DepthBuffer:
+    """Depth of the nearest fragment drawn to each cell, reused from frame
+    to frame.
+
+    Renderers given a DepthBuffer write a fragment of a planet only if it
+    is nearer than what the cell already holds, so planets can be drawn in
+    any order and parts of a planet can pass in front of or behind
+    another. Larger depths are nearer, matching the order the painter's
+    sort draws planets in. Depths are float32 in one array, which NumPy
+    renderers use directly and the Python renderer reads through row
+    views. They are cleared in place and only reallocated when the frame
+    size changes.
+    """
+
+    def __init__(self):
+        """Initialises a new DepthBuffer.
+
+        Attributes:
+            depth (ndarray): Nearest depth drawn to each cell, -inf where
+                nothing has been.
+            rows (list[memoryview]): Views of each row of `depth` that
+                read and write Python floats.
+        """
+        import numpy as np
+
+        self.depth = np.empty((0, 0), dtype=np.float32)
+        self.rows = []
+
+    def acquire(self, width, height):
+        """Returns the depths cleared for the next frame.
+
+        Args:
+            width (int): Width of the frame.
+            height (int): Height of the frame.
+
+        Returns:
+            ndarray: Depth of each cell, all -inf.
+        """
+        import numpy as np
+
+        if self.depth.shape != (height, width):
+            self.depth = np.empty((height, width), dtype=np.float32)
+            self.rows = [memoryview(row) for row in self.depth]
+        self.depth.fill(-np.inf)
+        return self.depth
+
+
+class TerminalSize:
+    """Size of the terminal, queried again only after a SIGWINCH.
+
+    Stands in for a Console wherever only `width` and `height` are read.
+    Outside a `with` block, on platforms without SIGWINCH, or off the main
+    thread, the size is queried every time it is read.
+    """
+
+    def __init__(self, console=None):
+        """Initialises a new TerminalSize.
+
+        Args:
+            console (Console, optional): Console whose size is tracked.
+                Defaults to None, reading the size of stdout directly.
+        """
+        self.console = console
+        self._stale = True
+        self._size = (0, 0)
+        self._previous_handler = None
+        self._watching = False
+
+    def __enter__(self):
+        """Starts listening for SIGWINCH."""
+        self._watching = (
+            hasattr(signal, "SIGWINCH")
+            and threading.current_thread() is threading.main_thread()
+        )
+        if self._watching:
+            self._previous_handler = signal.signal(
+                signal.SIGWINCH, self._on_resize
+            )
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Restores the previous SIGWINCH handler."""
+        if self._watching:
+            signal.signal(
+                signal.SIGWINCH, self._previous_handler or signal.SIG_DFL
+            )
+            self._watching = False
+
+    def _on_resize(self, signum, frame):
+        """Marks the size as stale."""
+        self.invalidate()
+
+    def invalidate(self):
+        """Makes the next read query the terminal size again.
+
+        Returns:
+            None
+        """
+        self._stale = True
+
+    def _refresh(self):
+        """Queries the console size if it may have changed."""
+        if self._stale or not self._watching:
+            self._stale = False
+            if self.console is None:
+                self._size = tuple(shutil.get_terminal_size())
+            else:
+                self._size = tuple(self.console.size)
+
+    @property
+    def width(self):
+        """int: Width of the terminal in cells."""
+        self._refresh()
+        return self._size[0]
+
+    @property
+    def height(self):
+        """int: Height of the terminal in cells."""
+        self._refresh()
+        return self._size[1]
@@ -0,0 +1,153 @@
+from collections import deque
+
+from terminal_solar_system.config import (
+    GOVERNOR_DOWNGRADE,
+    GOVERNOR_POINT_RADIUS,
+    GOVERNOR_SPRITE_QUANTUM,
+    GOVERNOR_STAR_FRACTION,
+    GOVERNOR_UPGRADE,
+    GOVERNOR_WINDOW,
+)
+from terminal_solar_system.lod import LevelOfDetail
+from terminal_solar_system.sprites import SpriteCache
+
+# Quality levels in the order they are given up. Each level keeps every
+# reduction of the levels before it.
+QUALITY_LEVELS = (
+    "full",
+    "fewer stars",
+    "coarse discs",
+    "no rings",
+    "point planets",
+)
+
+
+class QualityGovernor:
+    """Trades rendering quality for frame rate.
+
+    Frame times are averaged over a window of frames. When the average
+    rises above `downgrade` times the frame budget, quality drops one level;
+    when it falls below `upgrade` times the budget, quality rises one level.
+    The gap between the two thresholds, and the fresh window required after
+    every change, keep the level from flapping.
+    """
+
+    def __init__(
+        self,
+        framerate,
+        level: int = 0,
+        adaptive: bool = True,
+        window: int = GOVERNOR_WINDOW,
+        downgrade: float = GOVERNOR_DOWNGRADE,
+        upgrade: float = GOVERNOR_UPGRADE,
+    ):
+        """Initialises a new QualityGovernor.
+
+        Args:
+            framerate (float): Target frames per second.
+            level (int, optional): Starting index into QUALITY_LEVELS.
+                Defaults to 0.
+            adaptive (bool, optional): Whether or not the level follows
+                frame times. If not, it stays at `level`. Defaults to True.
+            window (int, optional): Frames averaged before each decision.
+                Defaults to GOVERNOR_WINDOW.
+            downgrade (float, optional): Fraction of the budget above which
+                quality drops. Defaults to GOVERNOR_DOWNGRADE.
+            upgrade (float, optional): Fraction of the budget below which
+                quality rises. Defaults to GOVERNOR_UPGRADE.
+
+        Attributes:
+            budget (float): Seconds available per frame.
+            history (list[tuple]): (frame, level) for every level change.
+        """
+        if not 0 <= level < len(QUALITY_LEVELS):
+            raise ValueError(
+                f"quality level must be between 0 and "
+                f"{len(QUALITY_LEVELS) - 1}"
+            )
+        self.budget = 1 / framerate
+        self.level = level
+        self.adaptive = adaptive
+        self.downgrade = downgrade
+        self.upgrade = upgrade
+        self.history = []
+        self._frames = 0
+        self._times = deque(maxlen=window)
+        self._coarse_lod = None
+
+    def record(self, frame_time):
+        """Adds a frame's work time and changes level if it is due.
+
+        Args:
+            frame_time (float): Seconds spent on the frame.
+
+        Returns:
+            bool: Whether the level changed.
+        """
+        self._frames += 1
+        if not self.adaptive:
+            return False
+        self._times.append(frame_time)
+        if len(self._times) < self._times.maxlen:
+            return False
+        average = sum(self._times) / len(self._times)
+        if (
+            average > self.budget * self.downgrade
+            and self.level < len(QUALITY_LEVELS) - 1
+        ):
+            self.level += 1
+        elif average < self.budget * self.upgrade and self.level > 0:
+            self.level -= 1
+        else:
+            return False
+        self._times.clear()
+        self.history.append((self._frames, self.level))
+        return True
+
+    def stars(self, stars):
+        """Returns the stars to draw at the current level.
+
+        Args:
+            stars (StarField): Every star.
+
+        Returns:
+            StarField: The stars to draw.
+        """
+        if self.level < 1:
+            return stars
+        return stars.subset(int(len(stars) * GOVERNOR_STAR_FRACTION))
+
+    def lod(self, lod=None):
+        """Returns the level of detail to draw with at the current level.
+
+        Args:
+            lod (LevelOfDetail, optional): Level of detail used at full
+                quality. Defaults to None.
+
+        Returns:
+            LevelOfDetail: The level of detail, or `lod` if quality is not
+                reduced that far.
+        """
+        if self.level < 2:
+            return lod
+        if self._coarse_lod is None:
+            self._coarse_lod = LevelOfDetail(
+                point_radius=0,
+                stamp_radius=float("inf"),
+                sprite_cache=SpriteCache(quantum=GOVERNOR_SPRITE_QUANTUM),
+            )
+        coarse = self._coarse_lod
+        coarse.rings = self.level < 3
+        coarse.point_radius = GOVERNOR_POINT_RADIUS if self.level >= 4 else 0
+        return coarse
+
+    def __str__(self):
+        """Returns the current level and how often it changed.
+
+        Returns:
+            str: Quality level summary.
+        """
+        return (
+            f"quality: {self.level} ({QUALITY_LEVELS[self.level]}), "
+            f"changes: {len(self.history)}"
+        )
@@ -0,0 +1,65 @@
+from terminal_solar_system.config import LOD_POINT_RADIUS, LOD_STAMP_RADIUS
+from terminal_solar_system.sprites import SpriteCache
+
+POINT = "point"
+STAMP = "stamp"
+FULL = "full"
+
+
+class LevelOfDetail:
+    """Chooses how much work to spend drawing each planet.
+
+    Bodies whose outer edge is smaller than `point_radius` are drawn as a
+    single glyph, bodies smaller than `stamp_radius` are stamped from a
+    sprite cache, and only larger bodies are rasterized exactly.
+    """
+
+    def __init__(
+        self,
+        point_radius: float = LOD_POINT_RADIUS,
+        stamp_radius: float = LOD_STAMP_RADIUS,
+        sprite_cache: SpriteCache = None,
+        rings: bool = True,
+    ):
+        """Initialises a new LevelOfDetail.
+
+        Args:
+            point_radius (float, optional): Outer radius below which bodies
+                are drawn as a point. Defaults to LOD_POINT_RADIUS.
+            stamp_radius (float, optional): Effective radius below which
+                bodies are stamped from a sprite. Defaults to
+                LOD_STAMP_RADIUS.
+            sprite_cache (SpriteCache, optional): Cache used for stamped
+                bodies. Defaults to a new SpriteCache.
+            rings (bool, optional): Whether or not planets' rings are drawn.
+                Defaults to True.
+
+        Attributes:
+            counts (dict[str, int]): Bodies drawn at each tier.
+        """
+        self.point_radius = point_radius
+        self.stamp_radius = stamp_radius
+        if sprite_cache is None:
+            sprite_cache = SpriteCache()
+        self.sprite_cache = sprite_cache
+        self.rings = rings
+        self.counts = {POINT: 0, STAMP: 0, FULL: 0}
+
+    def tier(self, radius, line_width):
+        """Returns the tier a body should be drawn at, and counts it.
+
+        Args:
+            radius (float): Effective radius of the body.
+            line_width (float): Width of the body's border.
+
+        Returns:
+            str: POINT, STAMP or FULL.
+        """
+        if radius + line_width / 2 < self.point_radius:
+            tier = POINT
+        elif radius < self.stamp_radius:
+            tier = STAMP
+        else:
+            tier = FULL
+        self.counts[tier] += 1
+        return tier
@@ -1,13 +1,28 @@
-from time import sleep
+import contextlib
 import random
+import sys
 import threading
+import time
 
-from rich.console import Console
-from rich.live import Live
-
+from terminal_solar_system import renderer as python_renderer
 from terminal_solar_system.utils import listen_for_quit
-from terminal_solar_system.planets import Planet, Star, Sun
-from terminal_solar_system.renderer import render_frame
+from terminal_solar_system.camera import Camera
+from terminal_solar_system.framebuffer import (
+    DepthBuffer,
+    FrameBuffer,
+    FramePool,
+    TerminalSize,
+)
+from terminal_solar_system.governor import QUALITY_LEVELS, QualityGovernor
+from terminal_solar_system.lod import LevelOfDetail
+from terminal_solar_system.output import DiffWriter
+from terminal_solar_system.pipeline import FramePipeline
+from terminal_solar_system.recording import Recorder, play
+from terminal_solar_system.planets import Planet, PlanetSystem, StarField, Sun
+from terminal_solar_system.runtime import AsyncRuntime
+from terminal_solar_system.scheduler import FrameScheduler, SimulationClock
+from terminal_solar_system.stats import FrameStats, NullStats
+from terminal_solar_system.sprites import SpriteCache
 from terminal_solar_system.config import (
     BORDER_SYMBOLS,
     FILL_SYMBOLS,
@@ -16,15 +31,48 @@ from terminal_solar_system.config import (
     MAX_ORBIT_RADIUS,
     MAX_PERIOD,
     MAX_RADIUS,
+    MAX_SPEED,
     MIN_PERIOD,
     MIN_RADIUS,
+    MIN_SPEED,
+    NBODY_CLOUD_ECCENTRICITY,
+    NBODY_CLOUD_MASS,
+    NBODY_CLOUD_RADIUS,
+    NBODY_CLOUD_SPREAD,
+    NBODY_CLOUD_TILT,
+    NBODY_PARTICLE_RADIUS,
     ORBIT_RADIUS_MULTIPLIER,
     PLANET_COLORS,
-    RING_CHANCE
+    RING_CHANCE,
+    SPEED_STEP,
+    ZOOM_STEP
 )
 
 
-def main(framerate, print_color, star_count, terminal_x_scale, random_planets):
+def main(
+    framerate,
+    print_color,
+    star_count,
+    terminal_x_scale,
+    random_planets,
+    backend="python",
+    sprite_quantum=None,
+    diff_output=False,
+    level_of_detail=False,
+    workers=None,
+    pipelined=False,
+    record_path=None,
+    show_stats=False,
+    metrics_path=None,
+    runtime="threads",
+    governed=False,
+    quality=0,
+    scene_path=None,
+    gravity=None,
+    particle_count=0,
+    zoom=1.0,
+    zbuffer=False
+):
     """Runs a simple animated ASCII solar system in your Unix terminal.
 
     Args:
@@ -33,41 +81,318 @@ def main(framerate, print_color, star_count, terminal_x_scale, random_planets):
         star_count (int): Stars in the background.
         terminal_x_scale (float): Font height/width ratio.
         random_planets (bool): Randomised planets.
+        backend (str, optional): Frame renderer, "python", "numpy" or
+            "parallel". Defaults to "python".
+        sprite_quantum (float, optional): If given, planets are stamped from
+            a cache of discs quantized to this radius step. Defaults to None.
+        diff_output (bool, optional): Write only changed cells with raw ANSI
+            escapes instead of repainting through Rich. Rich is not imported
+            at all in this mode unless colors are enabled. Defaults to False.
+        level_of_detail (bool, optional): Draw small planets as points and
+            mid-size planets from cached sprites. Defaults to False.
+        workers (int, optional): Worker processes for the parallel backend.
+            Defaults to the number of CPUs.
+        pipelined (bool, optional): Serialize and write frames on separate
+            threads while the next frame is simulated. Defaults to False.
+        record_path (str, optional): File to stream an asciicast v2
+            recording of the session to. Defaults to None.
+        show_stats (bool, optional): Draw a HUD with fps and the time spent
+            in each stage of the frame. Defaults to False.
+        metrics_path (str, optional): File to append per-frame stage
+            timings to, as CSV or JSON lines. Defaults to None.
+        runtime (str, optional): "threads" polls a key listener thread
+            between frames. "asyncio" runs input, resize handling and
+            rendering as coroutines on one event loop, and adds keybindings
+            to pause, change speed, toggle color, zoom and pan.
+            Defaults to "threads".
+        governed (bool, optional): Lower the quality level while frames run
+            over budget and raise it again when there is headroom.
+            Defaults to False.
+        quality (int, optional): Starting quality level, or the fixed level
+            if not governed. See QUALITY_LEVELS. Defaults to 0.
+        scene_path (str, optional): Scene file to load the bodies from
+            instead of the solar system. Defaults to None.
+        gravity (str, optional): If given, the bodies attract each other
+            instead of following their orbits, with forces from a
+            Barnes-Hut octree ("tree") or summed over every pair
+            ("direct"). Defaults to None.
+        particle_count (int, optional): Particles in a collapsing cloud
+            added to the scene. Defaults to 0.
+        zoom (float, optional): Starting magnification of the camera.
+            Defaults to 1.0.
+        zbuffer (bool, optional): Composite planets cell by cell with a
+            depth buffer instead of painting them back to front, so rings
+            pass behind their planets. Defaults to False.
 
     Returns:
         None
     """
-    console = Console()
-    stars = [Star(console) for _ in range(star_count)]
-    planets = []
-    if random_planets:
-        add_random_solar_system(planets)
+    if diff_output:
+        console = None
+        report = print
     else:
-        add_solar_system(planets)
+        from rich.console import Console
+        from rich.live import Live
+
+        console = Console()
+        report = console.print
+    screen = TerminalSize(console)
+    sprite_cache = None
+    if sprite_quantum is not None:
+        sprite_cache = SpriteCache(quantum=sprite_quantum)
+    lod = None
+    if level_of_detail:
+        lod = LevelOfDetail(sprite_cache=sprite_cache)
+    clock = SimulationClock()
+    stars = StarField(screen, star_count, clock=clock)
+    if gravity is None:
+        planets = PlanetSystem(clock=clock)
+    else:
+        from terminal_solar_system.nbody import GravitySystem
+
+        planets = GravitySystem(clock=clock, direct=gravity == "direct")
+    add_scene(planets, scene_path, random_planets)
+    add_particle_cloud(planets, particle_count)
+    camera = Camera(zoom)
+
+    if diff_output:
+        display = DiffWriter(sys.stdout, print_color)
+        stages = [
+            (
+                "output",
+                lambda buffer: display.write_frame(buffer, print_color)
+            ),
+        ]
+    else:
+        display = Live("", auto_refresh=False, console=console)
+        stages = [
+            (
+                "serialize",
+                lambda buffer: python_renderer.serialize_frame(
+                    buffer, print_color
+                )
+            ),
+            ("output", lambda text: display.update(text, refresh=True)),
+        ]
+    # Frames handed to the pipeline outlive the next frame, so each one in
+    # flight gets its own grid, reused once the pipeline releases it.
+    if pipelined:
+        frame_buffer = FramePool()
+        pipeline = FramePipeline(stages, release=frame_buffer.release)
+    else:
+        frame_buffer = FrameBuffer()
+        pipeline = None
+    recorder = None
+    if record_path is not None:
+        recorder = Recorder(
+            record_path, screen.width, screen.height, print_color
+        )
+
+    if show_stats or metrics_path is not None:
+        stats = FrameStats(show_hud=show_stats, metrics_path=metrics_path)
+    else:
+        stats = NullStats()
+
+    governor = None
+    if governed or quality:
+        governor = QualityGovernor(framerate, quality, adaptive=governed)
+
+    depth_buffer = DepthBuffer() if zbuffer else None
+
+    def draw_frame():
+        started = time.perf_counter()
+        stats.start()
+        stars.update()
+        planets.update()
+        stats.mark("update")
+        if governor is None:
+            drawn_stars, frame_lod = stars, lod
+        else:
+            drawn_stars, frame_lod = governor.stars(stars), governor.lod(lod)
+        if (
+            pipeline is None
+            and recorder is None
+            and not diff_output
+            and not stats.enabled
+        ):
+            display.update(
+                renderer.render_frame(
+                    planets,
+                    drawn_stars,
+                    screen,
+                    print_color,
+                    terminal_x_scale,
+                    sprite_cache,
+                    frame_lod,
+                    frame_buffer,
+                    camera,
+                    depth_buffer
+                ),
+                refresh=True
+            )
+        else:
+            buffer = renderer.rasterize_frame(
+                planets,
+                drawn_stars,
+                screen.width,
+                screen.height,
+                terminal_x_scale,
+                sprite_cache,
+                frame_lod,
+                frame_buffer,
+                camera,
+                depth_buffer
+            )
+            stats.mark("rasterize")
+            stats.count("culled", camera.culled)
+            if recorder is not None:
+                recorder.write_frame(buffer)
+                stats.mark("record")
+            grid = buffer
+            buffer = stats.overlay(buffer)
+            if pipeline is not None:
+                pipeline.push(buffer, grid)
+                stats.mark("handoff")
+            else:
+                for name, stage in stages:
+                    buffer = stage(buffer)
+                    stats.mark(name)
+        if governor is not None:
+            governor.record(time.perf_counter() - started)
+            # Shows each change in the HUD and metrics rows as it happens.
+            stats.count("quality", governor.level)
+        stats.finish()
+
+    def toggle_color():
+        nonlocal print_color
+        print_color = not print_color
+        # The output stage picks the change up with the next frame it
+        # writes, so a pipeline's output thread is never raced.
+        if recorder is not None:
+            recorder.print_color = print_color
+
+    def change_speed(factor):
+        clock.speed = min(max(clock.speed * factor, MIN_SPEED), MAX_SPEED)
+
+    scheduler = FrameScheduler(framerate)
+    renderer = get_renderer(backend, workers)
+    with contextlib.ExitStack() as stack:
+        close_renderer = getattr(renderer, "close", None)
+        if close_renderer is not None:
+            stack.callback(close_renderer)
+        for context in (display, pipeline, recorder, stats, screen):
+            if context is not None:
+                stack.enter_context(context)
+        if runtime == "asyncio":
+            AsyncRuntime(
+                draw_frame,
+                scheduler,
+                bindings={
+                    ' ': clock.toggle_pause,
+                    '+': lambda: change_speed(SPEED_STEP),
+                    '-': lambda: change_speed(1 / SPEED_STEP),
+                    'c': toggle_color,
+                    'z': lambda: camera.zoom_by(ZOOM_STEP),
+                    'x': lambda: camera.zoom_by(1 / ZOOM_STEP),
+                    'w': lambda: camera.pan(0, -1),
+                    'a': lambda: camera.pan(-1, 0),
+                    's': lambda: camera.pan(0, 1),
+                    'd': lambda: camera.pan(1, 0),
+                    '0': camera.reset,
+                },
+                on_resize=screen.invalidate,
+            ).run()
+        else:
+            stop_event = threading.Event()
+            threading.Thread(
+                target=listen_for_quit,
+                args=(stop_event,),
+                daemon=True
+            ).start()
+            while not stop_event.is_set():
+                draw_frame()
+                scheduler.wait()
 
+    report(str(scheduler))
+    report(str(camera))
+    if pipeline is not None:
+        report(str(pipeline))
+    if lod is not None:
+        report(str(lod.sprite_cache))
+    elif sprite_cache is not None:
+        report(str(sprite_cache))
+    if governor is not None:
+        for frame, level in governor.history:
+            report(
+                f"frame {frame}: quality {level} ({QUALITY_LEVELS[level]})"
+            )
+        report(str(governor))
+    if gravity is not None:
+        report(str(planets))
+
+
+def replay(path):
+    """Plays back a recorded session without simulating or rendering.
+
+    Args:
+        path (str): asciicast v2 recording to play.
+
+    Returns:
+        None
+    """
     stop_event = threading.Event()
     threading.Thread(
         target=listen_for_quit,
         args=(stop_event,),
         daemon=True
     ).start()
+    play(path, sys.stdout, stop_event)
 
-    with Live("", refresh_per_second=framerate, console=console) as live:
-        while not stop_event.is_set():
-            for star in stars:
-                star.update()
-            for planet in planets:
-                planet.update()
-            live.update(
-                render_frame(
-                    planets,
-                    stars,
-                    console,
-                    print_color,
-                    terminal_x_scale
-                )
-            )
-            sleep(1 / framerate)
+
+def get_renderer(backend, workers=None):
+    """Returns the frame renderer for a backend.
+
+    Args:
+        backend (str): "python", "numpy" or "parallel".
+        workers (int, optional): Worker processes for the parallel backend.
+            Defaults to the number of CPUs.
+
+    Returns:
+        module | NumpyRenderer | ParallelRenderer: Provides `render_frame`
+            and `rasterize_frame`.
+    """
+    if backend == "numpy":
+        from terminal_solar_system.numpy_renderer import NumpyRenderer
+        return NumpyRenderer()
+    if backend == "parallel":
+        from terminal_solar_system.parallel import ParallelRenderer
+        return ParallelRenderer(workers)
+    return python_renderer
+
+
+def add_scene(planets, scene_path=None, random_planets=False):
+    """
+    Populates the given container from a scene file if one is given, and
+    with a random or the real solar system otherwise.
+
+    Args:
+        planets (list | PlanetSystem): Container to which Planet objects
+            will be appended.
+        scene_path (str, optional): Scene file to load. Defaults to None.
+        random_planets (bool, optional): Randomised planets when no scene
+            file is given. Defaults to False.
+
+    Returns:
+        None
+    """
+    if scene_path is not None:
+        from terminal_solar_system.scenes import load_scene
+
+        load_scene(scene_path, planets)
+    elif random_planets:
+        add_random_solar_system(planets)
+    else:
+        add_solar_system(planets)
 
 
 def add_solar_system(planets):
@@ -76,7 +401,8 @@ def add_solar_system(planets):
     using vibrant versions of their real-life colors.
 
     Args:
-        planets (list): The list to which Planet objects will be appended.
+        planets (list | PlanetSystem): Container to which Planet objects
+            will be appended.
 
     Returns:
         None
@@ -118,7 +444,8 @@ def add_random_solar_system(planets, min_planets=3, max_planets=10):
     Populates the given list with a random number of randomised planets.
 
     Args:
-        planets (list): The list to which Planet objects will be appended.
+        planets (list | PlanetSystem): Container to which Planet objects
+            will be appended.
         min_planets (int): Minimum number of planets.
         max_planets (int): Maximum number of planets.
 
@@ -167,3 +494,45 @@ def add_random_solar_system(planets, min_planets=3, max_planets=10):
                 has_ring=has_ring
             )
         )
+
+
+def add_particle_cloud(
+    planets,
+    count,
+    cloud_radius=NBODY_CLOUD_RADIUS,
+    mass=NBODY_CLOUD_MASS,
+):
+    """
+    Populates the given list with a slowly turning cloud of small particles
+    on orbits tilted around a common plane. Each particle starts too slow
+    for a circular orbit, so under gravity the cloud collapses into a
+    spinning disc. See GravitySystem.
+
+    Args:
+        planets (list | PlanetSystem): Container to which Planet objects
+            will be appended.
+        count (int): Number of particles.
+        cloud_radius (float, optional): Radius of the cloud.
+            Defaults to NBODY_CLOUD_RADIUS.
+        mass (float, optional): Total mass of the cloud, shared equally
+            between the particles. Defaults to NBODY_CLOUD_MASS.
+
+    Returns:
+        None
+    """
+    for _ in range(count):
+        planets.append(
+            Planet(
+                NBODY_PARTICLE_RADIUS,
+                cloud_radius * random.random() ** (1 / 3),
+                random.uniform(MIN_PERIOD, MAX_PERIOD),
+                inclination=random.uniform(
+                    NBODY_CLOUD_TILT - NBODY_CLOUD_SPREAD,
+                    NBODY_CLOUD_TILT + NBODY_CLOUD_SPREAD,
+                ),
+                symbol='.',
+                color=random.choice(PLANET_COLORS),
+                eccentricity=NBODY_CLOUD_ECCENTRICITY,
+                mass=mass / count,
+            )
+        )
@@ -0,0 +1,452 @@
+import time
+
+import numpy as np
+
+from terminal_solar_system.config import (
+    NBODY_DENSITY,
+    NBODY_DIRECT_CHUNK,
+    NBODY_GRAVITY,
+    NBODY_MAX_STEPS,
+    NBODY_SOFTENING,
+    NBODY_STAR_DENSITY,
+    NBODY_THETA,
+    NBODY_TIMESTEP,
+    NBODY_TREE_DEPTH,
+)
+from terminal_solar_system.planets import BodySystem
+
+
+def barnes_hut_accelerations(
+    position,
+    mass,
+    gravity=NBODY_GRAVITY,
+    softening=NBODY_SOFTENING,
+    theta=NBODY_THETA,
+    depth=NBODY_TREE_DEPTH,
+):
+    """Returns the gravitational acceleration of every body in O(n log n)
+    with a Barnes-Hut octree.
+
+    Bodies are sorted by the Morton code of their position, which makes
+    every cell of the octree a contiguous run of bodies, so the masses and
+    centres of mass of all cells come from one reduction per level. The tree
+    is then walked breadth first for every body at once. A cell that looks
+    smaller than `theta` radians from a body, and does not hold it, pulls
+    the body as a single mass at its centre of mass; any other cell is
+    opened into its children.
+
+    Args:
+        position (ndarray): (n, 3) positions.
+        mass (ndarray): Masses.
+        gravity (float, optional): Gravitational constant.
+            Defaults to NBODY_GRAVITY.
+        softening (float, optional): Plummer softening length, which keeps
+            close encounters finite. Defaults to NBODY_SOFTENING.
+        theta (float, optional): Opening angle. Smaller is more accurate
+            and slower, and 0 sums every pair directly.
+            Defaults to NBODY_THETA.
+        depth (int, optional): Levels of the octree below the root.
+            Defaults to NBODY_TREE_DEPTH.
+
+    Returns:
+        ndarray: (n, 3) accelerations.
+    """
+    count = len(mass)
+    if count < 2:
+        return np.zeros((count, 3))
+
+    lower = position.min(axis=0)
+    size = float((position.max(axis=0) - lower).max()) or 1.0
+    cells = np.minimum(
+        ((position - lower) * ((1 << depth) / size)).astype(np.int64),
+        (1 << depth) - 1,
+    )
+    code = _morton(cells, depth)
+    order = np.argsort(code, kind="stable")
+    # Single precision halves the memory traffic of the walk, and its
+    # rounding is far below the error of the approximation itself.
+    position = position[order].astype(np.float32)
+    mass = mass[order].astype(np.float32)
+    levels = _build_tree(code[order], position, mass, depth)
+
+    softening2 = softening * softening
+    theta2 = theta * theta
+    acceleration = np.zeros((count, 3))
+    body = np.arange(count)
+    cell = np.zeros(count, dtype=np.int64)
+    for level, (owner, cell_mass, centre, single, children) in enumerate(
+        levels
+    ):
+        offset = centre[cell] - position[body]
+        distance2 = np.einsum("ij,ij->i", offset, offset)
+        holds = owner[body] == cell
+        if children is None:
+            pulls = np.ones(body.size, dtype=bool)
+        else:
+            width = size / (1 << level)
+            pulls = single[cell] | (
+                ~holds & (distance2 * theta2 > width * width)
+            )
+
+        index = np.flatnonzero(pulls)
+        puller, pulled = cell[index], body[index]
+        pull_mass = cell_mass[puller]
+        offset = offset[index]
+        distance2 = distance2[index]
+        own = np.flatnonzero(holds[index])
+        if own.size:
+            # A body does not pull on itself, so it is taken out of the
+            # mass and centre of mass of the cell that holds it.
+            bodies = pulled[own]
+            rest = pull_mass[own] - mass[bodies]
+            moment = offset[own] * pull_mass[own, None]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                offset[own] = moment / rest[:, None]
+            offset[own[rest <= 0]] = 0.0
+            pull_mass[own] = np.maximum(rest, 0.0)
+            distance2[own] = np.einsum(
+                "ij,ij->i", offset[own], offset[own]
+            )
+        strength = pull_mass * (distance2 + softening2) ** -1.5
+        for axis in range(3):
+            acceleration[:, axis] += np.bincount(
+                pulled, weights=strength * offset[:, axis], minlength=count
+            )
+
+        index = np.flatnonzero(~pulls)
+        if index.size == 0:
+            break
+        first, fanout = children[0][cell[index]], children[1][cell[index]]
+        body = np.repeat(body[index], fanout)
+        cell = np.repeat(first - np.cumsum(fanout) + fanout, fanout)
+        cell += np.arange(cell.size)
+
+    unsorted = np.empty_like(acceleration)
+    unsorted[order] = acceleration * gravity
+    return unsorted
+
+
+def _build_tree(code, position, mass, depth):
+    """Returns, for each level of the octree, the cell that holds each body
+    and the mass, centre of mass, whether it holds a single body, and first
+    child and number of children of every non-empty cell. The deepest
+    level has no children."""
+    count = len(mass)
+    weighted = position * mass[:, None]
+    levels = []
+    for level in range(depth + 1):
+        key = code >> (3 * (depth - level))
+        boundary = np.r_[True, key[1:] != key[:-1]]
+        start = np.flatnonzero(boundary)
+        cell_mass = np.add.reduceat(mass, start)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            centre = np.add.reduceat(weighted, start) / cell_mass[:, None]
+        massless = cell_mass <= 0
+        centre[massless] = position[start[massless]]
+        levels.append(
+            [
+                np.cumsum(boundary) - 1,
+                cell_mass,
+                centre,
+                np.diff(np.r_[start, count]) == 1,
+                key[start],
+            ]
+        )
+    for level in range(depth + 1):
+        keys = levels[level].pop()
+        if level == depth:
+            levels[level].append(None)
+            continue
+        grouped = levels[level + 1][-1] >> 3
+        first = np.searchsorted(grouped, keys, side="left")
+        levels[level].append(
+            (first, np.searchsorted(grouped, keys, side="right") - first)
+        )
+    return levels
+
+
+def _morton(cells, depth):
+    """Returns the Morton code of integer (x, y, z) cell coordinates."""
+    code = np.zeros(len(cells), dtype=np.int64)
+    for bit in range(depth):
+        for axis in range(3):
+            code |= ((cells[:, axis] >> bit) & 1) << (3 * bit + 2 - axis)
+    return code
+
+
+def direct_accelerations(
+    position,
+    mass,
+    gravity=NBODY_GRAVITY,
+    softening=NBODY_SOFTENING,
+    chunk=NBODY_DIRECT_CHUNK,
+):
+    """Returns the gravitational acceleration of every body by summing over
+    every pair in O(n²). Used to check `barnes_hut_accelerations`.
+
+    Args:
+        position (ndarray): (n, 3) positions.
+        mass (ndarray): Masses.
+        gravity (float, optional): Gravitational constant.
+            Defaults to NBODY_GRAVITY.
+        softening (float, optional): Plummer softening length.
+            Defaults to NBODY_SOFTENING.
+        chunk (int, optional): Bodies whose pulls are summed at a time,
+            which bounds memory. Defaults to NBODY_DIRECT_CHUNK.
+
+    Returns:
+        ndarray: (n, 3) accelerations.
+    """
+    acceleration = np.empty_like(position, dtype=float)
+    softening2 = softening * softening
+    for start in range(0, len(mass), chunk):
+        offset = position[None, :, :] - position[start:start + chunk, None]
+        distance2 = np.einsum("ijk,ijk->ij", offset, offset) + softening2
+        with np.errstate(divide="ignore"):
+            strength = mass * distance2 ** -1.5
+        # A body does not pull on itself.
+        rows = np.arange(len(strength))
+        strength[rows, start + rows] = 0
+        acceleration[start:start + chunk] = np.einsum(
+            "ij,ijk->ik", strength, offset
+        )
+    return acceleration * gravity
+
+
+class GravitySystem(BodySystem):
+    """BodySystem whose bodies attract each other instead of following
+    their orbits.
+
+    Bodies start where their orbits put them, moving at the speed of a
+    circular orbit around all the mass nearer the centre than they are, in
+    the plane and direction of their own orbit. Eccentric bodies start
+    slower, as if at apoapsis, so they fall inwards. From then on periods,
+    orbits and parents are ignored: a leapfrog (kick-drift-kick) integrator
+    advances every body in fixed steps of simulated time, so the motion is
+    the same at any frame rate.
+
+    A Planet's mass is its `mass` if it has one, and otherwise follows from
+    its volume, with stars (bodies that neither move nor orbit anything)
+    far denser than planets so that they hold their systems together.
+    """
+
+    def __init__(
+        self,
+        planets=(),
+        clock=time.time,
+        timestep: float = NBODY_TIMESTEP,
+        theta: float = NBODY_THETA,
+        direct: bool = False,
+        max_steps: int = NBODY_MAX_STEPS,
+        gravity: float = NBODY_GRAVITY,
+        softening: float = NBODY_SOFTENING,
+    ):
+        """Initialises a new GravitySystem.
+
+        Args:
+            planets (Iterable[Planet], optional): Planets to add.
+                Defaults to ().
+            clock (callable, optional): Simulation clock returning seconds.
+                Defaults to time.time.
+            timestep (float, optional): Seconds of simulated time per
+                physics step. Defaults to NBODY_TIMESTEP.
+            theta (float, optional): Barnes-Hut opening angle.
+                Defaults to NBODY_THETA.
+            direct (bool, optional): Sum the pull of every pair of bodies
+                directly instead of through the octree. Defaults to False.
+            max_steps (int, optional): Most physics steps taken in one
+                update. Simulated time beyond that is dropped rather than
+                caught up on. Defaults to NBODY_MAX_STEPS.
+            gravity (float, optional): Gravitational constant.
+                Defaults to NBODY_GRAVITY.
+            softening (float, optional): Plummer softening length.
+                Defaults to NBODY_SOFTENING.
+
+        Attributes:
+            position (ndarray): (n, 3) positions, or None before the first
+                update.
+            velocity (ndarray): (n, 3) velocities, or None before the first
+                update.
+            mass (ndarray): Masses, or None before the first update.
+            steps (int): Physics steps taken.
+            dropped (float): Seconds of simulated time dropped because the
+                physics fell behind.
+        """
+        self.timestep = timestep
+        self.theta = theta
+        self.direct = direct
+        self.max_steps = max_steps
+        self.gravity = gravity
+        self.softening = softening
+        self.position = None
+        self.velocity = None
+        self.mass = None
+        self.steps = 0
+        self.dropped = 0.0
+        self._acceleration = None
+        self._lag = 0.0
+        super().__init__(planets, clock)
+
+    def update(self, current_time=None):
+        """Advances every Planet to the current time in whole physics steps.
+        Should be called once per frame. Planets added since the last
+        update join the simulation at the position and speed of their
+        orbits.
+
+        Args:
+            current_time (float, optional): Timestamp to advance to.
+                Defaults to the system's clock.
+
+        Returns:
+            None
+        """
+        if current_time is None:
+            current_time = self.clock()
+        if self.position is None or len(self.position) < len(self):
+            self._start()
+        self._lag += current_time - self.time
+        self.time = current_time
+
+        steps = 0
+        while self._lag >= self.timestep:
+            if steps == self.max_steps:
+                behind = self._lag - self._lag % self.timestep
+                self.dropped += behind
+                self._lag -= behind
+                break
+            self._step()
+            self._lag -= self.timestep
+            steps += 1
+        self.x[:], self.y[:], self.z[:] = self.position.T
+
+    def accelerations(self, position=None):
+        """Returns the gravitational acceleration of every body.
+
+        Args:
+            position (ndarray, optional): (n, 3) positions to evaluate at.
+                Defaults to the current positions.
+
+        Returns:
+            ndarray: (n, 3) accelerations.
+        """
+        if position is None:
+            position = self.position
+        if self.direct:
+            return direct_accelerations(
+                position, self.mass, self.gravity, self.softening
+            )
+        return barnes_hut_accelerations(
+            position, self.mass, self.gravity, self.softening, self.theta
+        )
+
+    def energy(self):
+        """Returns the total kinetic and potential energy, which the
+        integrator should keep nearly constant. Takes O(n²) time.
+
+        Returns:
+            float: The total energy.
+        """
+        mass = self.mass
+        kinetic = 0.5 * np.einsum(
+            "i,ij,ij->", mass, self.velocity, self.velocity
+        )
+        potential = 0.0
+        softening2 = self.softening * self.softening
+        for start in range(0, len(mass), NBODY_DIRECT_CHUNK):
+            stop = start + NBODY_DIRECT_CHUNK
+            offset = self.position[None, :] - self.position[start:stop, None]
+            distance = np.sqrt(
+                np.einsum("ijk,ijk->ij", offset, offset) + softening2
+            )
+            pairs = mass[start:stop, None] * mass[None, :] / distance
+            # A body with itself is not a pair, and every other pair is
+            # counted from both ends.
+            rows = np.arange(len(pairs))
+            pairs[rows, start + rows] = 0
+            potential -= 0.5 * self.gravity * pairs.sum()
+        return float(kinetic + potential)
+
+    def _start(self):
+        """Starts the simulation for every body not yet in it."""
+        known = 0 if self.position is None else len(self.position)
+        orbiting = np.flatnonzero(self.period)
+        self._place(orbiting, self.angle[orbiting])
+        position = np.column_stack((self.x, self.y, self.z))
+        mass = self._masses()
+        velocity = self._orbital_velocity(position, mass)
+        if known:
+            position[:known] = self.position
+            velocity[:known] = self.velocity
+        elif mass.sum() > 0:
+            # Start the system's centre of mass at rest.
+            velocity -= mass @ velocity / mass.sum()
+        self.position = position
+        self.velocity = velocity
+        self.mass = mass
+        self._acceleration = self.accelerations()
+
+    def _masses(self):
+        """Returns the mass of every body: its own if it has one, and
+        otherwise its volume times the density of a star, for bodies that
+        orbit nothing, or of a planet."""
+        given = np.array(
+            [np.nan if planet.mass is None else planet.mass for planet in self]
+        )
+        radius = self.radius
+        star = (self.period == 0) & (self.parent < 0)
+        density = np.where(star, NBODY_STAR_DENSITY, NBODY_DENSITY)
+        return np.where(np.isnan(given), density * radius ** 3, given)
+
+    def _orbital_velocity(self, position, mass):
+        """Returns the starting velocity of every body."""
+        distance2 = np.einsum("ij,ij->i", position, position)
+        order = np.argsort(distance2, kind="stable")
+        inside = np.empty_like(mass)
+        inside[order] = np.cumsum(mass[order]) - mass[order]
+        # Circular speed around a softened point mass at the centre.
+        speed = np.sqrt(
+            self.gravity
+            * inside
+            * distance2
+            * (distance2 + self.softening ** 2) ** -1.5
+            * (1 - self.eccentricity)
+        )
+        speed *= np.sign(self.period)
+
+        # Rotate each position a quarter turn forwards in its orbit's
+        # plane, spanned by (1, 0, 0) and (0, sin i, cos i).
+        inclination = self.inclination
+        across = position[:, 1] * np.sin(inclination)
+        across += position[:, 2] * np.cos(inclination)
+        along = position[:, 0]
+        tangent = np.column_stack(
+            (
+                -across,
+                along * np.sin(inclination),
+                along * np.cos(inclination),
+            )
+        )
+        length = np.hypot(along, across)
+        moving = length > 0
+        tangent[moving] *= (speed[moving] / length[moving])[:, None]
+        return tangent
+
+    def _step(self):
+        """Advances every body by one physics step."""
+        half = 0.5 * self.timestep
+        self.velocity += half * self._acceleration
+        self.position += self.timestep * self.velocity
+        self._acceleration = self.accelerations()
+        self.velocity += half * self._acceleration
+        self.steps += 1
+
+    def __str__(self):
+        """Returns how many physics steps were taken and dropped.
+
+        Returns:
+            str: Physics summary.
+        """
+        return (
+            f"gravity: {self.steps} steps, "
+            f"{self.dropped:.1f}s of simulated time dropped"
+        )
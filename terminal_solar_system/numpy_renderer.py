@@ -0,0 +1,646 @@
+import math
+
+import numpy as np
+
+from terminal_solar_system.config import (
+    DEPTH_OF_FIELD_MODIFIER,
+    RING_CHAR,
+    RING_SIZE_MODIFIER,
+)
+from terminal_solar_system.lod import POINT, STAMP
+from terminal_solar_system.planets import StarField
+from terminal_solar_system.renderer import (
+    bounding_box,
+    nearest_cell,
+    place_planets,
+    place_star,
+    relocate_stars,
+)
+
+
+class NumpyRenderer:
+    """Renders frames into preallocated NumPy arrays.
+
+    Produces exactly the same output as `renderer.render_frame`, but keeps
+    glyphs and palette indices in 2-D arrays that are reused between frames
+    and rasterizes each planet with vectorized distance fields.
+    """
+
+    def __init__(self):
+        """Initialises a new NumpyRenderer.
+
+        Attributes:
+            glyphs (ndarray): Symbol drawn in each cell.
+            colors (ndarray): Palette index of each cell, 0 if uncolored.
+            palette (list[str]): Colors indexed by `colors`.
+            row_range (tuple, optional): (start, stop) rows planets may be
+                drawn to, or None for every row.
+            depth (ndarray, optional): Depths of the frame being drawn, or
+                None to paint planets back to front.
+        """
+        self.glyphs = np.full((0, 0), ' ', dtype='<U1')
+        self.colors = np.zeros((0, 0), dtype=np.int16)
+        self.palette = [None]
+        self.row_range = None
+        self.depth = None
+        self._palette_index = {None: 0}
+        self._x_grid = np.zeros(0)
+        self._y_grid = np.zeros(0)
+
+    def render_frame(
+        self,
+        planets,
+        stars,
+        console,
+        print_color,
+        terminal_x_scale,
+        sprite_cache=None,
+        lod=None,
+        frame_buffer=None,
+        camera=None,
+        depth_buffer=None
+    ):
+        """Returns a rendered frame to be printed.
+
+        Args:
+            planets (list[Planet]): List of planets to be drawn.
+            stars (list[Star] | StarField): Stars to be drawn.
+            console (Console): Console being drawn to.
+            print_color (bool): Whether or not to color output.
+            terminal_x_scale (float): Font height/width ratio.
+            sprite_cache (SpriteCache, optional): Cache of pre-rasterized
+                discs to stamp planets from. Defaults to None.
+            lod (LevelOfDetail, optional): If given, chooses per planet
+                between a point glyph, a stamped sprite and exact
+                rasterization. Defaults to None.
+            frame_buffer (FrameBuffer, optional): Unused, since the arrays
+                are already reused between frames. Defaults to None.
+            camera (Camera, optional): Zooms and pans the planets and culls
+                those outside the frame. Defaults to None.
+            depth_buffer (DepthBuffer, optional): If given, planets are
+                composited cell by cell by depth instead of being painted
+                back to front. Defaults to None.
+
+        Returns:
+            Text: Buffer contents rendered to styled text.
+        """
+        self.rasterize(
+            planets,
+            stars,
+            console.width,
+            console.height,
+            terminal_x_scale,
+            sprite_cache,
+            lod,
+            camera,
+            depth_buffer
+        )
+        return self.serialize(print_color)
+
+    def rasterize_frame(
+        self,
+        planets,
+        stars,
+        width,
+        height,
+        terminal_x_scale,
+        sprite_cache=None,
+        lod=None,
+        frame_buffer=None,
+        camera=None,
+        depth_buffer=None
+    ):
+        """Returns a buffer with the stars and planets drawn into it, in the
+        same format as `renderer.rasterize_frame`.
+
+        Args:
+            planets (list[Planet]): List of planets to be drawn.
+            stars (list[Star] | StarField): Stars to be drawn.
+            width (int): Width of the buffer.
+            height (int): Height of the buffer.
+            terminal_x_scale (float): Font height/width ratio.
+            sprite_cache (SpriteCache, optional): Cache of pre-rasterized
+                discs to stamp planets from. Defaults to None.
+            lod (LevelOfDetail, optional): If given, chooses per planet
+                between a point glyph, a stamped sprite and exact
+                rasterization. Defaults to None.
+            frame_buffer (FrameBuffer | FramePool, optional): Reusable
+                grids to copy the frame into instead of allocating new
+                rows. Defaults to None.
+            camera (Camera, optional): Zooms and pans the planets and culls
+                those outside the frame. Defaults to None.
+            depth_buffer (DepthBuffer, optional): If given, planets are
+                composited cell by cell by depth instead of being painted
+                back to front. Defaults to None.
+
+        Returns:
+            list[list[tuple]]: Rows of (symbol, color) cells.
+        """
+        self.rasterize(
+            planets,
+            stars,
+            width,
+            height,
+            terminal_x_scale,
+            sprite_cache,
+            lod,
+            camera,
+            depth_buffer
+        )
+        names = np.array(self.palette, dtype=object)[self.colors].tolist()
+        if frame_buffer is None:
+            return [
+                list(zip(symbols, colors))
+                for symbols, colors in zip(self.glyphs.tolist(), names)
+            ]
+        buffer = frame_buffer.acquire(width, height)
+        for row, symbols, colors in zip(buffer, self.glyphs.tolist(), names):
+            row[:] = zip(symbols, colors)
+        return buffer
+
+    def rasterize(
+        self,
+        planets,
+        stars,
+        width,
+        height,
+        terminal_x_scale,
+        sprite_cache=None,
+        lod=None,
+        camera=None,
+        depth_buffer=None
+    ):
+        """Draws the stars and planets into the arrays.
+
+        Args:
+            planets (list[Planet]): List of planets to be drawn.
+            stars (list[Star] | StarField): Stars to be drawn.
+            width (int): Width of the frame.
+            height (int): Height of the frame.
+            terminal_x_scale (float): Font height/width ratio.
+            sprite_cache (SpriteCache, optional): Cache of pre-rasterized
+                discs to stamp planets from. Defaults to None.
+            lod (LevelOfDetail, optional): If given, chooses per planet
+                between a point glyph, a stamped sprite and exact
+                rasterization. Defaults to None.
+            camera (Camera, optional): Zooms and pans the planets and culls
+                those outside the frame. Defaults to None.
+            depth_buffer (DepthBuffer, optional): If given, planets are
+                composited cell by cell by depth instead of being painted
+                back to front. Defaults to None.
+
+        Returns:
+            None
+        """
+        if self.resize(width, height):
+            relocate_stars(stars, width, height)
+        self.glyphs.fill(' ')
+        self.colors.fill(0)
+        self.depth = None
+        if depth_buffer is not None:
+            self.depth = depth_buffer.acquire(width, height)
+        placed = place_planets(
+            planets, width, height, terminal_x_scale, sprite_cache, lod,
+            camera, front_to_back=self.depth is not None
+        )
+        zoom = 1.0 if camera is None else camera.zoom
+        self.render_stars(stars)
+        for planet, center_x, center_y in placed:
+            self.render_planet(
+                planet,
+                center_x,
+                center_y,
+                terminal_x_scale,
+                sprite_cache,
+                lod,
+                zoom
+            )
+
+    def resize(self, width, height):
+        """Reallocates the arrays and coordinate grid if the size changed.
+
+        Args:
+            width (int): Width of the frame.
+            height (int): Height of the frame.
+
+        Returns:
+            bool: Whether the arrays were reallocated.
+        """
+        if self.glyphs.shape == (height, width):
+            return False
+        self.glyphs = np.full((height, width), ' ', dtype='<U1')
+        self.colors = np.zeros((height, width), dtype=np.int16)
+        self._x_grid = np.arange(width, dtype=np.float64)
+        self._y_grid = np.arange(height, dtype=np.float64)
+        return True
+
+    def color_index(self, color):
+        """Returns the palette index of a color, adding it if unseen.
+
+        Args:
+            color (str): Color name, or None for uncolored.
+
+        Returns:
+            int: Index into `palette`.
+        """
+        if not color:
+            return 0
+        index = self._palette_index.get(color)
+        if index is None:
+            index = len(self.palette)
+            self.palette.append(color)
+            self._palette_index[color] = index
+        return index
+
+    def render_planet(
+        self,
+        planet,
+        center_x,
+        center_y,
+        terminal_x_scale,
+        sprite_cache=None,
+        lod=None,
+        zoom=1.0
+    ):
+        """Writes a planet to the arrays for rendering.
+
+        Args:
+            planet (Planet): The planet being drawn.
+            center_x (float): Center x-coordinate of the planet.
+            center_y (float): Center y-coordinate of the planet.
+            terminal_x_scale (float): height/width ratio of text in terminal.
+            sprite_cache (SpriteCache, optional): If given, the disc is
+                stamped from a cached sprite at the nearest cell instead of
+                being rasterized. Defaults to None.
+            lod (LevelOfDetail, optional): If given, small planets are drawn
+                as a point and mid-size planets are stamped from its sprite
+                cache. Defaults to None.
+            zoom (float, optional): Factor the planet's radius is scaled by.
+                Defaults to 1.0.
+
+        Returns:
+            None
+        """
+        if terminal_x_scale == 0:
+            return
+
+        height, width = self.glyphs.shape
+        color = self.color_index(planet.color)
+
+        depth_of_field = planet.z / DEPTH_OF_FIELD_MODIFIER
+        radius = (planet.radius + depth_of_field) * zoom
+        center_z = planet.z * zoom
+        front_z = center_z + max(radius + planet.line_width / 2, 0)
+
+        if lod is not None:
+            tier = lod.tier(radius, planet.line_width)
+            if tier == POINT:
+                yi = math.ceil(center_y - 0.5)
+                xi = math.ceil(center_x - 0.5)
+                if 0 <= yi < height and 0 <= xi < width:
+                    self._write_cell(yi, xi, planet.symbol, color, front_z)
+                return
+            sprite_cache = lod.sprite_cache if tier == STAMP else None
+
+        if sprite_cache is None:
+            pixel_written = self.rasterize_disc(
+                planet,
+                color,
+                center_x,
+                center_y,
+                radius,
+                terminal_x_scale,
+                center_z
+            )
+        else:
+            sprite = sprite_cache.get(
+                radius,
+                planet.line_width,
+                terminal_x_scale
+            )
+            if self._hidden(
+                sprite,
+                center_x,
+                center_y,
+                max(front_z, center_z + sprite.outer_radius)
+            ):
+                # Neither the stamp nor the fallback glyph would show.
+                pixel_written = True
+            else:
+                pixel_written = self.blit_sprite(
+                    planet, color, sprite, center_x, center_y, center_z
+                )
+
+        if not pixel_written:
+            yi, xi = nearest_cell(center_x, center_y, width, height)
+            if 0 < yi < height - 1 and 0 < xi < width - 1:
+                self._write_cell(yi, xi, planet.symbol, color, front_z)
+
+        if planet.has_ring and (lod is None or lod.rings):
+            self.render_planet_ring(
+                planet,
+                center_x,
+                center_y,
+                terminal_x_scale,
+                zoom,
+                center_z
+            )
+
+    def _hidden(self, sprite, center_x, center_y, z):
+        """Returns whether every cell a sprite could cover, stamped at a
+        planet's nearest cell, already holds something nearer than `z`."""
+        if self.depth is None:
+            return False
+        origin_y = math.ceil(center_y - 0.5)
+        origin_x = math.ceil(center_x - 0.5)
+        y_extent, x_extent = sprite.extent
+        window = self.depth[
+            max(origin_y - y_extent, 0):max(origin_y + y_extent + 1, 0),
+            max(origin_x - x_extent, 0):max(origin_x + x_extent + 1, 0)
+        ]
+        return window.size > 0 and z <= window.min()
+
+    def _write_cell(self, yi, xi, symbol, color, z):
+        """Writes a cell, unless the depths hold something nearer there."""
+        if self.depth is not None:
+            if z <= self.depth[yi, xi]:
+                return
+            self.depth[yi, xi] = z
+        self.glyphs[yi, xi] = symbol
+        self.colors[yi, xi] = color
+
+    def rasterize_disc(
+        self,
+        planet,
+        color,
+        center_x,
+        center_y,
+        radius,
+        terminal_x_scale,
+        center_z=0.0
+    ):
+        """Writes a planet's border and fill using a distance field over its
+        bounding box.
+
+        When compositing by depth, the planet is treated as a sphere of its
+        outer radius, so each cell's depth is that of the sphere's surface
+        in front of it.
+
+        Args:
+            planet (Planet): The planet being drawn.
+            color (int): Palette index of the planet's color.
+            center_x (float): Center x-coordinate of the planet.
+            center_y (float): Center y-coordinate of the planet.
+            radius (float): Effective radius of the planet.
+            terminal_x_scale (float): height/width ratio of text in terminal.
+            center_z (float, optional): Depth of the planet's center.
+                Defaults to 0.0.
+
+        Returns:
+            bool: Whether the disc has any border cell on screen, hidden or
+                not, or is hidden entirely.
+        """
+        height, width = self.glyphs.shape
+        inner_radius = radius - planet.line_width / 2
+        outer_radius = radius + planet.line_width / 2
+
+        y_start, y_stop, x_start, x_stop = bounding_box(
+            center_x, center_y, outer_radius, width, height, terminal_x_scale
+        )
+        if self.row_range is not None:
+            y_start = max(y_start, self.row_range[0])
+            y_stop = min(y_stop, self.row_range[1])
+        if y_start >= y_stop:
+            return False
+        if self.depth is not None and center_z + max(outer_radius, 0) <= (
+            self.depth[y_start:y_stop, x_start:x_stop].min()
+        ):
+            # Nothing of the disc, nor its fallback glyph, could be nearer
+            # than what is already drawn anywhere in its bounding box.
+            return True
+
+        dx = (self._x_grid[x_start:x_stop] - center_x) / terminal_x_scale
+        dy = self._y_grid[y_start:y_stop] - center_y
+        dist = np.sqrt(dx[np.newaxis, :] ** 2 + dy[:, np.newaxis] ** 2)
+        border = (inner_radius < dist) & (dist < outer_radius)
+        fill = dist < inner_radius
+        pixel_written = bool(border.any())
+
+        if self.depth is not None:
+            depth = self.depth[y_start:y_stop, x_start:x_stop]
+            z = center_z + np.sqrt(
+                np.maximum(outer_radius ** 2 - dist ** 2, 0)
+            )
+            nearer = z > depth
+            border &= nearer
+            fill &= nearer
+            depth[border | fill] = z[border | fill]
+
+        glyphs = self.glyphs[y_start:y_stop, x_start:x_stop]
+        colors = self.colors[y_start:y_stop, x_start:x_stop]
+        glyphs[border] = planet.symbol
+        glyphs[fill] = planet.fill
+        colors[border | fill] = color
+        return pixel_written
+
+    def blit_sprite(
+        self,
+        planet,
+        color,
+        sprite,
+        center_x,
+        center_y,
+        center_z=0.0
+    ):
+        """Stamps a pre-rasterized disc onto the arrays at the planet's
+        nearest cell.
+
+        Args:
+            planet (Planet): The planet being drawn.
+            color (int): Palette index of the planet's color.
+            sprite (Sprite): The disc to stamp.
+            center_x (float): Center x-coordinate of the planet.
+            center_y (float): Center y-coordinate of the planet.
+            center_z (float, optional): Depth of the planet's center.
+                Defaults to 0.0.
+
+        Returns:
+            bool: Whether any border cell is on screen, hidden or not.
+        """
+        origin_y = math.ceil(center_y - 0.5)
+        origin_x = math.ceil(center_x - 0.5)
+        pixel_written = self._stamp(
+            sprite.border_rows, sprite.border_cols, sprite.border_heights,
+            origin_y, origin_x, center_z, planet.symbol, color
+        )
+        self._stamp(
+            sprite.fill_rows, sprite.fill_cols, sprite.fill_heights,
+            origin_y, origin_x, center_z, planet.fill, color
+        )
+        return pixel_written
+
+    def _stamp(
+        self, rows, cols, heights, origin_y, origin_x, center_z, symbol, color
+    ):
+        """Writes a symbol to the visible cells of a list of offsets,
+        leaving out those hidden by nearer fragments.
+
+        Returns:
+            bool: Whether any cell was visible.
+        """
+        y = np.frombuffer(rows, dtype=np.intc) + origin_y
+        x = np.frombuffer(cols, dtype=np.intc) + origin_x
+        visible = self._visible(y, x)
+        y = y[visible]
+        x = x[visible]
+        if self.depth is not None:
+            z = center_z + np.frombuffer(heights, dtype=np.float64)[visible]
+            nearer = z > self.depth[y, x]
+            y = y[nearer]
+            x = x[nearer]
+            self.depth[y, x] = z[nearer]
+        self.glyphs[y, x] = symbol
+        self.colors[y, x] = color
+        return bool(visible.any())
+
+    def render_planet_ring(
+        self,
+        planet,
+        center_x,
+        center_y,
+        terminal_x_scale,
+        zoom=1.0,
+        center_z=0.0
+    ):
+        """Draws a Planet's ring to the arrays.
+
+        When compositing by depth, the ring is a circle seen almost edge
+        on: its lower half passes in front of the planet and its upper half
+        behind.
+
+        Args:
+            planet (Planet): The planet whose ring is being drawn.
+            center_x (float): Center x-coordinate of the planet.
+            center_y (float): Center y-coordinate of the planet.
+            terminal_x_scale (float): height/width ratio of text in terminal.
+            zoom (float, optional): Factor the ring's length is scaled by.
+                Defaults to 1.0.
+            center_z (float, optional): Depth of the planet's center.
+                Defaults to 0.0.
+
+        Returns:
+            None
+        """
+        depth_of_field = planet.z / DEPTH_OF_FIELD_MODIFIER
+        ring_radius = (
+            (planet.radius + depth_of_field) * zoom * RING_SIZE_MODIFIER
+        )
+        ring_length = int(ring_radius)
+        if ring_length < 0:
+            return
+
+        offsets = np.arange(-ring_length, ring_length + 1, dtype=np.float64)
+        y = np.trunc(center_y + offsets).astype(np.intp)
+        x = np.trunc(center_x + offsets * terminal_x_scale).astype(np.intp)
+        visible = self._visible(y, x)
+        y = y[visible]
+        x = x[visible]
+        if self.depth is not None:
+            offsets = offsets[visible]
+            bulge = np.sqrt(np.maximum(ring_radius ** 2 - offsets ** 2, 0))
+            z = center_z + np.where(offsets >= 0, bulge, -bulge)
+            nearer = z > self.depth[y, x]
+            y = y[nearer]
+            x = x[nearer]
+            self.depth[y, x] = z[nearer]
+        self.glyphs[y, x] = RING_CHAR
+        self.colors[y, x] = self.color_index(planet.color)
+
+    def _visible(self, y, x):
+        """Returns a mask of the cells planets may be drawn to.
+
+        Args:
+            y (ndarray): Row of each cell.
+            x (ndarray): Column of each cell.
+
+        Returns:
+            ndarray: True where the cell is on screen and in `row_range`.
+        """
+        height, width = self.glyphs.shape
+        start, stop = self.row_range or (0, height)
+        return (
+            (max(start, 0) <= y) & (y < min(stop, height))
+            & (0 <= x) & (x < width)
+        )
+
+    def render_stars(self, stars):
+        """Draws the background stars to the arrays.
+
+        Args:
+            stars (list[Star] | StarField): Stars to be drawn.
+
+        Returns:
+            None
+        """
+        if isinstance(stars, StarField):
+            height, width = self.glyphs.shape
+            stars.relocate(width, height)
+            self.glyphs[stars.y, stars.x] = stars.glyphs()
+            self.colors[stars.y, stars.x] = self.color_index(stars.color)
+        else:
+            for star in stars:
+                self.render_star(star)
+
+    def render_star(self, star):
+        """Draws a Star to the arrays for rendering.
+
+        Args:
+            star (Star): The star being drawn.
+
+        Returns:
+            None
+        """
+        if star.idx == 0:
+            height, width = self.glyphs.shape
+            place_star(star, width, height)
+        self.glyphs[star.y, star.x] = star.frames[star.idx]
+        self.colors[star.y, star.x] = self.color_index(star.color)
+
+    def serialize(self, print_color):
+        """Returns the arrays as styled text, one span per run of equal
+        color.
+
+        Args:
+            print_color (bool): Whether or not to color output. If not, every
+                colored cell is drawn white.
+
+        Returns:
+            Text: Buffer contents as styled text.
+        """
+        from rich.text import Span, Text
+
+        height, width = self.glyphs.shape
+        if width == 0:
+            return Text("\n".join([""] * height))
+        colors = self.colors if print_color else np.minimum(self.colors, 1)
+        names = self.palette if print_color else [None, "white"]
+
+        starts = np.ones((height, width), dtype=bool)
+        starts[:, 1:] = colors[:, 1:] != colors[:, :-1]
+        run_y, run_x = np.nonzero(starts)
+        run_end = np.empty_like(run_x)
+        run_end[:-1] = np.where(run_y[1:] == run_y[:-1], run_x[1:], width)
+        run_end[-1] = width
+        run_color = colors[run_y, run_x]
+        styled = run_color != 0
+        offsets = run_y[styled] * (width + 1)
+        spans = [
+            Span(start, end, names[color])
+            for start, end, color in zip(
+                (offsets + run_x[styled]).tolist(),
+                (offsets + run_end[styled]).tolist(),
+                run_color[styled].tolist(),
+            )
+        ]
+        lines = self.glyphs.view(f"<U{width}").ravel().tolist()
+        return Text("\n".join(lines), spans=spans)
@@ -0,0 +1,201 @@
+import itertools
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from terminal_solar_system.config import OFFLINE_CHUNK_SIZE
+from terminal_solar_system.main import (
+    add_scene,
+    get_renderer,
+)
+from terminal_solar_system.output import DiffWriter
+from terminal_solar_system.planets import PlanetSystem, StarField
+from terminal_solar_system.recording import Recorder
+
+# Separates frames in a plain frame dump.
+FRAME_SEPARATOR = "\f\n"
+
+
+class _Screen:
+    """Stands in for a Console when building a scene off-screen."""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+
+
+class _FrameClock:
+    """Simulation clock reporting the timestamp of the frame being written.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def render_offline(
+    path,
+    duration,
+    framerate,
+    width,
+    height,
+    star_count,
+    random_planets=False,
+    print_color=False,
+    terminal_x_scale=2.2,
+    backend="python",
+    workers=None,
+    seed=None,
+    scene_path=None,
+):
+    """Renders a fixed number of seconds of animation to a file as fast as
+    the CPUs allow.
+
+    Every worker process builds the same scene from the seed and computes
+    each frame's state in closed form from t = k / framerate, so frames are
+    independent of each other and can be spread across the pool in runs of
+    consecutive frames. Workers send back each frame already serialized,
+    and frames are written in order as soon as they and every earlier
+    frame are done.
+
+    Args:
+        path (str): Output file. Names ending in ".cast" are written as an
+            asciicast v2 recording, anything else as a plain text dump with
+            frames separated by form feeds.
+        duration (float): Seconds of animation to render.
+        framerate (float): Frames per second.
+        width (int): Width of the off-screen terminal.
+        height (int): Height of the off-screen terminal.
+        star_count (int): Stars in the background.
+        random_planets (bool, optional): Randomised planets.
+            Defaults to False.
+        print_color (bool, optional): Enabled color. Defaults to False.
+        terminal_x_scale (float, optional): Font height/width ratio.
+            Defaults to 2.2.
+        backend (str, optional): Frame renderer used by the workers,
+            "python" or "numpy". Defaults to "python".
+        workers (int, optional): Worker processes. Defaults to the number
+            of CPUs.
+        seed (int, optional): Seed for the scene. Defaults to a random one.
+        scene_path (str, optional): Scene file to load the bodies from.
+            Defaults to None.
+
+    Returns:
+        int: Frames written.
+    """
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    frame_count = int(duration * framerate)
+    asciicast = path.endswith(".cast")
+    scene = (
+        seed, width, height, star_count, random_planets, terminal_x_scale,
+        backend, framerate, scene_path, asciicast, print_color,
+    )
+    chunks = [
+        range(start, min(start + OFFLINE_CHUNK_SIZE, frame_count))
+        for start in range(0, frame_count, OFFLINE_CHUNK_SIZE)
+    ]
+    with ProcessPoolExecutor(
+        workers, initializer=_build_scene, initargs=scene
+    ) as pool:
+        frames = itertools.chain.from_iterable(
+            pool.map(_render_chunk, chunks)
+        )
+        if asciicast:
+            _write_asciicast(
+                path, frames, width, height, print_color, framerate
+            )
+        else:
+            _write_dump(path, frames)
+    return frame_count
+
+
+def _write_asciicast(path, frames, width, height, print_color, framerate):
+    """Writes frames already diffed against the frame before them to an
+    asciicast v2 recording, timed by frame number."""
+    clock = _FrameClock()
+    with Recorder(path, width, height, print_color, clock) as recorder:
+        for index, output in enumerate(frames):
+            if output:
+                clock.now = index / framerate
+                recorder.write(output)
+
+
+def _write_dump(path, frames):
+    """Writes the symbols of each frame to a text file."""
+    with open(path, "w", encoding="utf-8") as file:
+        for page in frames:
+            file.write(page + "\n" + FRAME_SEPARATOR)
+
+
+_scene = None
+
+
+def _build_scene(
+    seed, width, height, star_count, random_planets, terminal_x_scale,
+    backend, framerate, scene_path, asciicast, print_color
+):
+    """Builds a worker's copy of the scene at t = 0, and the DiffWriter it
+    serializes frames of a recording with."""
+    global _scene
+    random.seed(seed)
+    planets = PlanetSystem(clock=lambda: 0.0)
+    add_scene(planets, scene_path, random_planets)
+    stars = StarField(
+        _Screen(width, height),
+        star_count,
+        np.random.default_rng(seed),
+        clock=lambda: 0.0,
+    )
+    writer = DiffWriter(None, print_color) if asciicast else None
+    _scene = (
+        planets, stars, get_renderer(backend), width, height,
+        terminal_x_scale, framerate, writer,
+    )
+
+
+def _render_chunk(frames):
+    """Rasterizes and serializes a run of consecutive frames of the
+    worker's scene.
+
+    For a recording, the frame before the run is rasterized first, so that
+    the first frame of the run can be diffed against it.
+
+    Args:
+        frames (range): Frame numbers.
+
+    Returns:
+        list[str]: For a recording, the escape sequences turning the frame
+            before each frame into it; otherwise the symbols of each frame.
+    """
+    writer = _scene[-1]
+    if writer is None:
+        return [
+            "\n".join(
+                "".join(symbol for symbol, _ in row) for row in _render(index)
+            )
+            for index in frames
+        ]
+    writer.invalidate()
+    if frames.start > 0:
+        writer.diff(_render(frames.start - 1))
+    return [writer.diff(_render(index)) for index in frames]
+
+
+def _render(index):
+    """Rasterizes frame `index` of the worker's scene.
+
+    Args:
+        index (int): Frame number.
+
+    Returns:
+        list[list[tuple]]: Rows of (symbol, color) cells.
+    """
+    planets, stars, renderer, width, height, x_scale, framerate, _ = _scene
+    current_time = index / framerate
+    planets.at(current_time)
+    stars.at(current_time, width, height)
+    return renderer.rasterize_frame(planets, stars, width, height, x_scale)
@@ -0,0 +1,163 @@
+ENTER_ALT_SCREEN = "\x1b[?1049h"
+EXIT_ALT_SCREEN = "\x1b[?1049l"
+HIDE_CURSOR = "\x1b[?25l"
+SHOW_CURSOR = "\x1b[?25h"
+CLEAR_SCREEN = "\x1b[2J"
+RESET_STYLE = "\x1b[0m"
+# What monochrome output draws every colored cell in, known up front so
+# that monochrome frames never need Rich to parse a color.
+WHITE_STYLE = "\x1b[0;37m"
+
+# Unchanged cells between two changed runs are rewritten rather than
+# skipped when that is no longer than the cursor move it would save.
+MAX_RUN_GAP = 4
+
+
+class DiffWriter:
+    """Writes frames to a terminal, redrawing only the cells that changed
+    since the previous frame.
+
+    Changed runs are positioned with raw ANSI cursor movement and colored
+    with SGR sequences. A change in frame size forces a full redraw.
+    """
+
+    def __init__(self, file, print_color=True):
+        """Initialises a new DiffWriter.
+
+        Args:
+            file (TextIO): Stream to write escape sequences to.
+            print_color (bool, optional): Whether or not to color output.
+                If not, every colored cell is drawn white. Defaults to True.
+
+        Attributes:
+            bytes_written (int): Characters written for the last frame.
+        """
+        self.file = file
+        self.print_color = print_color
+        self.bytes_written = 0
+        self._previous = None
+        self._sgr = {None: RESET_STYLE, "white": WHITE_STYLE}
+
+    def __enter__(self):
+        """Switches to the alternate screen and hides the cursor."""
+        self.file.write(ENTER_ALT_SCREEN + HIDE_CURSOR)
+        self.file.flush()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Restores the cursor and the main screen."""
+        self.file.write(RESET_STYLE + SHOW_CURSOR + EXIT_ALT_SCREEN)
+        self.file.flush()
+
+    def invalidate(self):
+        """Forces the next frame to be redrawn in full.
+
+        Returns:
+            None
+        """
+        self._previous = None
+
+    def write_frame(self, buffer, print_color=None):
+        """Writes the difference between a buffer and the previous frame.
+
+        Args:
+            buffer (list[list[tuple]]): Rows of (symbol, color) cells.
+            print_color (bool, optional): Whether or not to color this frame
+                and the ones after it. A change redraws the frame in full.
+                Handing it over with the frame, rather than setting
+                `print_color` directly, keeps the change on the thread
+                writing frames. Defaults to None, keeping the current
+                setting.
+
+        Returns:
+            None
+        """
+        if print_color is not None and print_color != self.print_color:
+            self.print_color = print_color
+            self.invalidate()
+        output = self.diff(buffer)
+        self.bytes_written = len(output)
+        if output:
+            self.file.write(output)
+            self.file.flush()
+
+    def diff(self, buffer):
+        """Returns the escape sequences turning the previous frame into
+        `buffer`, and remembers `buffer` as the previous frame.
+
+        Args:
+            buffer (list[list[tuple]]): Rows of (symbol, color) cells.
+
+        Returns:
+            str: Escape sequences and symbols to write.
+        """
+        previous = self._previous
+        if (
+            previous is None
+            or len(previous) != len(buffer)
+            or (buffer and len(previous[0]) != len(buffer[0]))
+        ):
+            previous = None
+        self._previous = buffer
+
+        parts = [] if previous is not None else [RESET_STYLE + CLEAR_SCREEN]
+        style = None
+        for y, row in enumerate(buffer):
+            if previous is not None:
+                old_row = previous[y]
+                if row == old_row:
+                    continue
+                changed = [
+                    x for x, cell in enumerate(row) if cell != old_row[x]
+                ]
+            else:
+                changed = range(len(row))
+            for start, stop in runs(changed):
+                parts.append(f"\x1b[{y + 1};{start + 1}H")
+                for symbol, color in row[start:stop]:
+                    if not self.print_color and color:
+                        color = "white"
+                    if color != style:
+                        parts.append(self.sgr(color))
+                        style = color
+                    parts.append(symbol)
+        if style is not None:
+            parts.append(RESET_STYLE)
+        return "".join(parts)
+
+    def sgr(self, color):
+        """Returns the SGR sequence selecting a foreground color.
+
+        Args:
+            color (str): Color name understood by Rich, or None to reset.
+
+        Returns:
+            str: The escape sequence.
+        """
+        sequence = self._sgr.get(color)
+        if sequence is None:
+            from rich.color import Color
+
+            codes = Color.parse(color).get_ansi_codes(foreground=True)
+            sequence = f"\x1b[0;{';'.join(codes)}m"
+            self._sgr[color] = sequence
+        return sequence
+
+
+def runs(indices):
+    """Groups ascending cell indices into half-open runs, bridging gaps of
+    up to MAX_RUN_GAP cells.
+
+    Args:
+        indices (Iterable[int]): Ascending indices of changed cells.
+
+    Returns:
+        list[tuple]: (start, stop) pairs.
+    """
+    spans = []
+    for index in indices:
+        if spans and index - spans[-1][1] <= MAX_RUN_GAP:
+            spans[-1][1] = index + 1
+        else:
+            spans.append([index, index + 1])
+    return [(start, stop) for start, stop in spans]
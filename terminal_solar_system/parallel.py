@@ -0,0 +1,352 @@
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from types import SimpleNamespace
+
+import numpy as np
+
+from terminal_solar_system.config import (
+    DEPTH_OF_FIELD_MODIFIER,
+    RING_SIZE_MODIFIER,
+)
+from terminal_solar_system.numpy_renderer import NumpyRenderer
+from terminal_solar_system.renderer import (
+    nearest_cell,
+    place_planets,
+    relocate_stars,
+)
+
+GLYPH_DTYPE = np.dtype('<U1')
+COLOR_DTYPE = np.dtype(np.int16)
+
+# Tiles per worker, so a tile crowded with planets does not hold up the
+# whole frame.
+TILES_PER_WORKER = 2
+
+
+class ParallelRenderer(NumpyRenderer):
+    """Renders frames by splitting the arrays into horizontal tiles and
+    rasterizing the tiles in a pool of worker processes.
+
+    The glyph and palette arrays live in shared memory, so workers draw
+    straight into the output and only the list of planets overlapping each
+    tile is sent per frame. Output is identical to NumpyRenderer.
+    """
+
+    def __init__(self, workers=None):
+        """Initialises a new ParallelRenderer.
+
+        Args:
+            workers (int, optional): Number of worker processes.
+                Defaults to the number of CPUs.
+        """
+        super().__init__()
+        self.workers = workers or os.cpu_count() or 1
+        self._pool = ProcessPoolExecutor(
+            self.workers, mp_context=_pool_context()
+        )
+        self._shared = []
+
+    def resize(self, width, height):
+        """Reallocates the shared arrays if the size changed.
+
+        Args:
+            width (int): Width of the frame.
+            height (int): Height of the frame.
+
+        Returns:
+            bool: Whether the arrays were reallocated.
+        """
+        if self.glyphs.shape == (height, width):
+            return False
+        self._release()
+        self._shared = [
+            shared_memory.SharedMemory(
+                create=True, size=max(height * width * dtype.itemsize, 1)
+            )
+            for dtype in (GLYPH_DTYPE, COLOR_DTYPE)
+        ]
+        self.glyphs = np.ndarray(
+            (height, width), GLYPH_DTYPE, self._shared[0].buf
+        )
+        self.colors = np.ndarray(
+            (height, width), COLOR_DTYPE, self._shared[1].buf
+        )
+        self._x_grid = np.arange(width, dtype=np.float64)
+        self._y_grid = np.arange(height, dtype=np.float64)
+        return True
+
+    def rasterize(
+        self,
+        planets,
+        stars,
+        width,
+        height,
+        terminal_x_scale,
+        sprite_cache=None,
+        lod=None,
+        camera=None,
+        depth_buffer=None
+    ):
+        """Draws the stars and planets into the shared arrays.
+
+        Args:
+            planets (list[Planet]): List of planets to be drawn.
+            stars (list[Star] | StarField): Stars to be drawn.
+            width (int): Width of the frame.
+            height (int): Height of the frame.
+            terminal_x_scale (float): Font height/width ratio.
+            sprite_cache (SpriteCache, optional): Not supported.
+            lod (LevelOfDetail, optional): Not supported.
+            camera (Camera, optional): Zooms and pans the planets and culls
+                those outside the frame before they are sent to workers.
+                Defaults to None.
+            depth_buffer (DepthBuffer, optional): Not supported.
+
+        Returns:
+            None
+        """
+        if sprite_cache is not None or lod is not None:
+            raise ValueError(
+                "the parallel renderer does not support sprites or LOD"
+            )
+        if depth_buffer is not None:
+            raise ValueError(
+                "the parallel renderer does not support depth buffers"
+            )
+        if self.resize(width, height):
+            relocate_stars(stars, width, height)
+        self.glyphs.fill(' ')
+        self.colors.fill(0)
+        self.render_stars(stars)
+        if terminal_x_scale == 0 or width == 0 or height == 0:
+            return
+
+        placed = place_planets(
+            planets, width, height, terminal_x_scale, camera=camera
+        )
+        zoom = 1.0 if camera is None else camera.zoom
+        bodies = [
+            self._body(index, planet, center_x, center_y, zoom)
+            for index, (planet, center_x, center_y) in enumerate(placed)
+        ]
+
+        tiles = min(self.workers * TILES_PER_WORKER, height)
+        bounds = [height * tile // tiles for tile in range(tiles + 1)]
+        tasks = []
+        for row_start, row_stop in zip(bounds, bounds[1:]):
+            overlapping = [
+                body for body in bodies
+                if body.top < row_stop and body.bottom >= row_start
+            ]
+            if overlapping:
+                tasks.append((
+                    self._shared[0].name,
+                    self._shared[1].name,
+                    (height, width),
+                    (row_start, row_stop),
+                    overlapping,
+                    terminal_x_scale,
+                ))
+
+        written = set()
+        for tile_written in self._pool.map(_render_tile, tasks):
+            written.update(tile_written)
+
+        for index in range(len(bodies)):
+            if index not in written:
+                self._render_fallback(bodies, index, terminal_x_scale)
+
+    def _body(self, index, planet, center_x, center_y, zoom=1.0):
+        """Returns the picklable description of a planet sent to workers.
+
+        Args:
+            index (int): Position of the planet in depth order.
+            planet (Planet): The planet being drawn.
+            center_x (float): Center x-coordinate of the planet.
+            center_y (float): Center y-coordinate of the planet.
+            zoom (float, optional): Factor the planet's radius is scaled by.
+                Defaults to 1.0.
+
+        Returns:
+            SimpleNamespace: The planet's drawing parameters.
+        """
+        radius = (planet.radius + planet.z / DEPTH_OF_FIELD_MODIFIER) * zoom
+        extent = max(
+            radius + planet.line_width / 2,
+            abs(radius * RING_SIZE_MODIFIER) if planet.has_ring else 0,
+        )
+        return SimpleNamespace(
+            index=index,
+            radius=planet.radius,
+            z=planet.z,
+            line_width=planet.line_width,
+            symbol=planet.symbol,
+            fill=planet.fill,
+            color=self.color_index(planet.color),
+            has_ring=planet.has_ring,
+            zoom=zoom,
+            center_x=center_x,
+            center_y=center_y,
+            top=math.floor(center_y - extent) - 1,
+            bottom=math.ceil(center_y + extent) + 1,
+        )
+
+    def _render_fallback(self, bodies, index, terminal_x_scale):
+        """Draws the single glyph of a planet no tile drew a border for,
+        unless its own ring or a nearer planet has since covered that cell.
+
+        Args:
+            bodies (list[SimpleNamespace]): Planets sorted by depth.
+            index (int): Index of the planet in `bodies`.
+            terminal_x_scale (float): Font height/width ratio.
+
+        Returns:
+            None
+        """
+        height, width = self.glyphs.shape
+        body = bodies[index]
+        yi, xi = nearest_cell(body.center_x, body.center_y, width, height)
+        if not (0 < yi < height - 1 and 0 < xi < width - 1):
+            return
+        if _ring_covers(body, yi, xi, terminal_x_scale):
+            return
+        for nearer in bodies[index + 1:]:
+            if nearer.top <= yi <= nearer.bottom and _covers(
+                nearer, yi, xi, terminal_x_scale
+            ):
+                return
+        self.glyphs[yi, xi] = body.symbol
+        self.colors[yi, xi] = body.color
+
+    def _release(self):
+        """Frees the shared arrays."""
+        self.glyphs = np.full((0, 0), ' ', dtype=GLYPH_DTYPE)
+        self.colors = np.zeros((0, 0), dtype=COLOR_DTYPE)
+        for block in self._shared:
+            block.close()
+            block.unlink()
+        self._shared = []
+
+    def close(self):
+        """Shuts down the worker pool and frees the shared arrays.
+
+        Returns:
+            None
+        """
+        self._pool.shutdown()
+        self._release()
+
+
+def _pool_context():
+    """Returns the multiprocessing context workers are started from.
+
+    Workers are started lazily on the first frame, by which time the key
+    listener thread is running and the terminal is in raw mode; forking
+    then can deadlock the children. A forkserver (or spawn, where there is
+    none) starts them from a clean, single-threaded process instead.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _covers(body, y, x, terminal_x_scale):
+    """Returns whether drawing a planet writes to a cell, ignoring its
+    single glyph fallback."""
+    radius = (body.radius + body.z / DEPTH_OF_FIELD_MODIFIER) * body.zoom
+    inner_radius = radius - body.line_width / 2
+    outer_radius = radius + body.line_width / 2
+    dx = (x - body.center_x) / terminal_x_scale
+    dy = y - body.center_y
+    dist = math.sqrt(dx ** 2 + dy ** 2)
+    if inner_radius < dist < outer_radius or dist < inner_radius:
+        return True
+    return _ring_covers(body, y, x, terminal_x_scale)
+
+
+def _ring_covers(body, y, x, terminal_x_scale):
+    """Returns whether a planet's ring passes through a cell."""
+    if not body.has_ring:
+        return False
+    depth_of_field = body.z / DEPTH_OF_FIELD_MODIFIER
+    ring_length = int(
+        (body.radius + depth_of_field) * body.zoom * RING_SIZE_MODIFIER
+    )
+    for offset in range(-ring_length, ring_length + 1):
+        if (
+            int(body.center_y + offset) == y
+            and int(body.center_x + offset * terminal_x_scale) == x
+        ):
+            return True
+    return False
+
+
+class _TileRenderer(NumpyRenderer):
+    """NumpyRenderer drawing into shared arrays inside a worker, with
+    planets' colors already given as palette indices."""
+
+    def color_index(self, color):
+        return color
+
+
+_tile_renderers = {}
+
+
+def _render_tile(task):
+    """Rasterizes the planets overlapping one tile in a worker process.
+
+    Args:
+        task (tuple): Shared memory names, frame shape, tile rows, planets
+            and terminal x scale.
+
+    Returns:
+        list[int]: Indices of planets that wrote a border cell in the tile.
+    """
+    glyph_name, color_name, shape, row_range, bodies, terminal_x_scale = task
+    renderer = _attach(glyph_name, color_name, shape)
+    renderer.row_range = row_range
+    written = []
+    for body in bodies:
+        if renderer.rasterize_disc(
+            body,
+            body.color,
+            body.center_x,
+            body.center_y,
+            (body.radius + body.z / DEPTH_OF_FIELD_MODIFIER) * body.zoom,
+            terminal_x_scale
+        ):
+            written.append(body.index)
+        if body.has_ring:
+            renderer.render_planet_ring(
+                body, body.center_x, body.center_y, terminal_x_scale,
+                body.zoom
+            )
+    return written
+
+
+def _attach(glyph_name, color_name, shape):
+    """Returns a worker's renderer over the shared arrays, attaching to
+    them the first time they are seen."""
+    key = (glyph_name, color_name)
+    renderer = _tile_renderers.get(key)
+    if renderer is not None:
+        return renderer
+    for stale in _tile_renderers.values():
+        for block in stale.shared:
+            block.close()
+    _tile_renderers.clear()
+
+    shared = []
+    for name in key:
+        shared.append(shared_memory.SharedMemory(name=name))
+    renderer = _TileRenderer()
+    renderer.shared = shared
+    renderer.glyphs = np.ndarray(shape, GLYPH_DTYPE, shared[0].buf)
+    renderer.colors = np.ndarray(shape, COLOR_DTYPE, shared[1].buf)
+    renderer._x_grid = np.arange(shape[1], dtype=np.float64)
+    renderer._y_grid = np.arange(shape[0], dtype=np.float64)
+    _tile_renderers[key] = renderer
+    return renderer
@@ -0,0 +1,250 @@
+import threading
+from collections import deque
+
+from terminal_solar_system.config import PIPELINE_DEPTH
+
+# Marks the end of the stream. Never dropped.
+_CLOSED = object()
+
+
+class FrameQueue:
+    """Bounded hand-off between two pipeline stages.
+
+    Putting into a full queue drops the oldest frame instead of blocking,
+    so a slow consumer always receives the freshest frame available.
+    """
+
+    def __init__(self, maxsize: int = PIPELINE_DEPTH, on_drop=None):
+        """Initialises a new FrameQueue.
+
+        Args:
+            maxsize (int, optional): Frames held before the oldest is
+                dropped. Defaults to PIPELINE_DEPTH.
+            on_drop (callable, optional): Called with each frame dropped.
+                Defaults to None.
+
+        Attributes:
+            max_depth (int): Most frames ever waiting at once.
+            dropped (int): Stale frames discarded.
+        """
+        self.maxsize = maxsize
+        self.on_drop = on_drop
+        self.max_depth = 0
+        self.dropped = 0
+        self._items = deque()
+        self._ready = threading.Condition()
+
+    @property
+    def depth(self):
+        """int: Frames currently waiting."""
+        return len(self._items)
+
+    def put(self, item):
+        """Adds a frame, dropping the oldest waiting frame if full.
+
+        Args:
+            item: The frame.
+
+        Returns:
+            None
+        """
+        with self._ready:
+            while len(self._items) >= self.maxsize:
+                dropped = self._items.popleft()
+                self.dropped += 1
+                if self.on_drop is not None:
+                    self.on_drop(dropped)
+            self._items.append(item)
+            self.max_depth = max(self.max_depth, len(self._items))
+            self._ready.notify()
+
+    def close(self):
+        """Wakes the consumer and tells it no more frames will come.
+
+        Frames still waiting are discarded.
+
+        Returns:
+            None
+        """
+        with self._ready:
+            self._items.clear()
+            self._items.append(_CLOSED)
+            self._ready.notify()
+
+    def get(self):
+        """Removes and returns the oldest frame, waiting for one if empty.
+
+        Returns:
+            tuple: (frame, stalled) where stalled is whether the call had to
+                wait.
+        """
+        with self._ready:
+            stalled = not self._items
+            while not self._items:
+                self._ready.wait()
+            return self._items.popleft(), stalled
+
+
+class Stage:
+    """A pipeline stage running a function on its own thread.
+
+    Attributes:
+        name (str): Name shown in statistics.
+        queue (FrameQueue): Frames waiting for this stage.
+        processed (int): Frames this stage has finished.
+        stalls (int): Times this stage sat idle waiting for a frame.
+    """
+
+    def __init__(self, name, func, maxsize=PIPELINE_DEPTH):
+        """Initialises a new Stage.
+
+        Args:
+            name (str): Name shown in statistics.
+            func (callable): Takes a frame and returns the frame passed on
+                to the next stage.
+            maxsize (int, optional): Size of the input queue.
+                Defaults to PIPELINE_DEPTH.
+        """
+        self.name = name
+        self.func = func
+        self.queue = FrameQueue(maxsize)
+        self.processed = 0
+        self.stalls = 0
+
+    def __str__(self):
+        """Returns the stage's queue statistics.
+
+        Returns:
+            str: Depth, dropped frames and stalls.
+        """
+        return (
+            f"{self.name}: depth {self.queue.depth}/{self.queue.maxsize} "
+            f"(max {self.queue.max_depth}), "
+            f"dropped {self.queue.dropped}, stalls {self.stalls}"
+        )
+
+
+class FramePipeline:
+    """Runs the later stages of a frame on their own threads, so the next
+    frame can be simulated while earlier ones are still being serialized
+    and written.
+
+    Frames pushed by the caller flow through each stage in order. Every
+    stage reads from a bounded FrameQueue, so a stage that falls behind
+    skips stale frames rather than letting them pile up.
+    """
+
+    def __init__(self, stages, maxsize: int = PIPELINE_DEPTH, release=None):
+        """Initialises a new FramePipeline.
+
+        Args:
+            stages (list[tuple]): (name, func) pairs in order. Each func
+                takes the previous stage's result.
+            maxsize (int, optional): Size of each stage's input queue.
+                Defaults to PIPELINE_DEPTH.
+            release (callable, optional): Called with the token of each
+                pushed frame once the first stage is done with it: as soon
+                as the frame is dropped, or once the first stage has
+                processed the frame after it, since writers such as
+                DiffWriter diff each frame against the one before.
+                Defaults to None.
+
+        Attributes:
+            stages (list[Stage]): The stages in order.
+            error (BaseException): First exception raised by a stage.
+        """
+        self.stages = [Stage(name, func, maxsize) for name, func in stages]
+        self.release = release
+        self.error = None
+        if self.stages:
+            self.stages[0].queue.on_drop = self._release_dropped
+        self._threads = [
+            threading.Thread(target=self._run, args=(index,), daemon=True)
+            for index in range(len(self.stages))
+        ]
+
+    def __enter__(self):
+        """Starts the stage threads."""
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stops the stage threads and re-raises any stage error."""
+        self.close()
+        if exc_type is None and self.error is not None:
+            raise self.error
+
+    def push(self, frame, token=None):
+        """Hands a frame to the first stage.
+
+        Args:
+            frame: Input to the first stage.
+            token (optional): Passed to `release` once the first stage is
+                done with the frame. Defaults to None.
+
+        Returns:
+            None
+
+        Raises:
+            BaseException: The error of a stage that has failed.
+        """
+        if self.error is not None:
+            raise self.error
+        self.stages[0].queue.put((frame, token))
+
+    def close(self):
+        """Stops the stages once they finish their current frame.
+
+        Returns:
+            None
+        """
+        if self.stages:
+            self.stages[0].queue.close()
+        for thread in self._threads:
+            if thread.is_alive():
+                thread.join()
+
+    def _run(self, index):
+        """Body of a stage thread."""
+        stage = self.stages[index]
+        following = self.stages[index + 1:index + 2]
+        held = None
+        while True:
+            frame, stalled = stage.queue.get()
+            if frame is _CLOSED:
+                break
+            if index == 0:
+                frame, token = frame
+            stage.stalls += stalled
+            try:
+                result = stage.func(frame)
+            except BaseException as error:
+                if self.error is None:
+                    self.error = error
+                break
+            stage.processed += 1
+            if index == 0:
+                self._release(held)
+                held = token
+            if following:
+                following[0].queue.put(result)
+        if following:
+            following[0].queue.close()
+
+    def _release_dropped(self, item):
+        """Releases a frame dropped from the first stage's queue."""
+        self._release(item[1])
+
+    def _release(self, token):
+        """Passes a frame's token to `release`, if both were given."""
+        if token is not None and self.release is not None:
+            self.release(token)
+
+    def __str__(self):
+        """Returns each stage's queue statistics.
+
+        Returns:
+            str: One line per stage.
+        """
+        return "\n".join(str(stage) for stage in self.stages)
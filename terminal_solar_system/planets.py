@@ -1,13 +1,109 @@
+import copy
 import math
 import random
 import time
 
-from terminal_solar_system.utils import polar_to_cartesian
-from terminal_solar_system.config import STAR_FRAME_HOLD
+from terminal_solar_system.utils import (
+    kepler_to_cartesian_arrays,
+    polar_to_cartesian,
+    polar_to_cartesian_arrays,
+    solve_kepler,
+)
+from terminal_solar_system.config import (
+    STAR_COLOR,
+    STAR_FRAME_HOLD,
+    STAR_FRAMES,
+)
+
+ORBITAL_STATE = (
+    "angle", "period", "orbit_radius", "inclination", "eccentricity",
+    "periapsis", "anomaly", "x", "y", "z"
+)
+
+# How each body is drawn, kept beside its orbital state so that the bodies
+# can be culled in one vectorized pass.
+SHAPE_STATE = {"radius": "f8", "line_width": "f8", "has_ring": "?"}
+
+# One body of a scene. An angle of NaN is replaced by a random one, and a
+# parent of -1 means the body orbits the centre of the screen.
+BODY_FIELDS = [
+    ("radius", "f8"),
+    ("orbit_radius", "f8"),
+    ("period", "f8"),
+    ("angle", "f8"),
+    ("inclination", "f8"),
+    ("eccentricity", "f8"),
+    ("periapsis", "f8"),
+    ("line_width", "f8"),
+    ("has_ring", "?"),
+    ("symbol", "U1"),
+    ("fill", "U1"),
+    ("color", "U24"),
+    ("parent", "i8"),
+]
+
+
+def __getattr__(name):
+    """Builds BODY_DTYPE, the NumPy dtype of BODY_FIELDS, on first use, so
+    that importing this module does not import NumPy."""
+    if name == "BODY_DTYPE":
+        import numpy as np
+
+        global BODY_DTYPE
+        BODY_DTYPE = np.dtype(BODY_FIELDS)
+        return BODY_DTYPE
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _orbital_property(name, kind=float):
+    """Returns a property reading the named state from the Planet's
+    BodySystem if it belongs to one, or from the Planet itself if not."""
+    private = "_" + name
+
+    def getter(self):
+        if self._system is None:
+            return getattr(self, private)
+        return kind(getattr(self._system, name)[self._index])
+
+    def setter(self, value):
+        if self._system is None:
+            setattr(self, private, value)
+        else:
+            getattr(self._system, name)[self._index] = value
+
+    return property(getter, setter, doc=f"{kind.__name__}: The {name}.")
 
 
 class Planet:
-    """Represents a planet."""
+    """Represents a planet.
+
+    `angle` is the mean anomaly, which advances at a constant rate. On an
+    elliptical orbit the planet's position follows from the eccentric
+    anomaly, `anomaly`, found by solving Kepler's equation; on a circular
+    orbit the two are equal and the planet simply moves at a constant rate.
+
+    Once added to a BodySystem, a Planet's orbital state and shape live in
+    the system's arrays and the Planet acts as a view onto them.
+    """
+
+    _system = None
+    _index = None
+    parent = None
+    mass = None
+
+    angle = _orbital_property("angle")
+    period = _orbital_property("period")
+    orbit_radius = _orbital_property("orbit_radius")
+    inclination = _orbital_property("inclination")
+    eccentricity = _orbital_property("eccentricity")
+    periapsis = _orbital_property("periapsis")
+    anomaly = _orbital_property("anomaly")
+    x = _orbital_property("x")
+    y = _orbital_property("y")
+    z = _orbital_property("z")
+    radius = _orbital_property("radius")
+    line_width = _orbital_property("line_width")
+    has_ring = _orbital_property("has_ring", bool)
 
     def __init__(
         self,
@@ -24,12 +120,17 @@ class Planet:
         x: float = 0,
         y: float = 0,
         z: float = 0,
+        parent: "Planet" = None,
+        eccentricity: float = 0.0,
+        periapsis: float = 0.0,
+        mass: float = None,
     ):
         """Initialises new Planet.
 
         Args:
             radius (float): Width of the Planet.
-            orbit_radius (float): Orbit radius of the Planet.
+            orbit_radius (float): Orbit radius of the Planet, or semi-major
+                axis of an elliptical orbit.
             period (float): Seconds needed for complete orbit.
             angle (float, optional): Angle of revolution in radians.
                 Defaults to 0.0.
@@ -51,10 +152,23 @@ class Planet:
                 Defaults to 0.
             z (float, optional): Initial z-coordinate of the Planet's center.
                 Defaults to 0.
+            parent (Planet, optional): Body the Planet orbits. Its position
+                is then relative to the parent's. Defaults to None, orbiting
+                the centre of the screen.
+            eccentricity (float, optional): Eccentricity of the orbit, from
+                0 for a circle up to but excluding 1. Defaults to 0.0.
+            periapsis (float, optional): Argument of periapsis in radians,
+                the angle of the orbit's closest point. Defaults to 0.0.
+            mass (float, optional): Mass of the Planet under gravity. See
+                GravitySystem. Defaults to None, a mass that follows from
+                the Planet's size.
 
         Attributes:
             time (float): Timestamp for the next frame update.
+            anomaly (float): Eccentric anomaly in radians.
         """
+        if not 0 <= eccentricity < 1:
+            raise ValueError("eccentricity must be at least 0 and below 1")
         self.radius = radius
         self.orbit_radius = orbit_radius
         self.period = period
@@ -62,6 +176,9 @@ class Planet:
             angle = random.uniform(0, 2 * math.pi)
         self.angle = angle
         self.inclination = inclination
+        self.eccentricity = eccentricity
+        self.periapsis = periapsis
+        self.anomaly = angle
         self.symbol = symbol
         self.fill = fill
         self.line_width = line_width
@@ -70,28 +187,81 @@ class Planet:
         self.x = x
         self.y = y
         self.z = z
+        self.parent = parent
+        self.mass = mass
         self.time = time.time()
 
-    def update(self):
+    def update(self, current_time=None):
         """Updates the planet when called to calculate new position.
-        Should be called once per frame.
+        Should be called once per frame, after its parent's update.
+
+        Args:
+            current_time (float, optional): Timestamp to advance to.
+                Defaults to time.time().
 
         Returns:
             None
         """
-        if self.period == 0:
+        if self.period == 0 and self.parent is None:
             return
-        current_time = time.time()
-        dt = current_time - self.time
-        self.angle = (
-            self.angle + (dt / self.period) * 2 * math.pi
-        ) % (2 * math.pi)
-        self.x, self.y, self.z = polar_to_cartesian(
-            self.orbit_radius, self.angle, self.inclination
-        )
+        if current_time is None:
+            current_time = time.time()
+        if self.period != 0:
+            dt = current_time - self.time
+            self.angle = (
+                self.angle + (dt / self.period) * 2 * math.pi
+            ) % (2 * math.pi)
+        if self.eccentricity:
+            anomaly, _ = solve_kepler(
+                [self.angle], [self.eccentricity], [self.anomaly]
+            )
+            self.anomaly = float(anomaly[0])
+            self.x, self.y, self.z = (
+                float(value[0]) for value in kepler_to_cartesian_arrays(
+                    self.orbit_radius,
+                    anomaly,
+                    self.eccentricity,
+                    self.periapsis,
+                    self.inclination,
+                )
+            )
+        else:
+            self.x, self.y, self.z = polar_to_cartesian(
+                self.orbit_radius,
+                self.angle + self.periapsis,
+                self.inclination,
+            )
+        if self.parent is not None:
+            self.x += self.parent.x
+            self.y += self.parent.y
+            self.z += self.parent.z
         self.time = current_time
         return
 
+    @classmethod
+    def view(cls, system, index, symbol, fill, color):
+        """Returns a Planet backed by one entry of a BodySystem's arrays,
+        without copying its state through the constructor.
+
+        Args:
+            system (BodySystem): The system holding the Planet's state.
+            index (int): Index of the planet in the system.
+            symbol (chr): Symbol used to draw the Planet border.
+            fill (chr): Symbol used to fill in planet border.
+            color (str): Color used to draw the Planet.
+
+        Returns:
+            Planet: The view.
+        """
+        planet = cls.__new__(cls)
+        planet._system = system
+        planet._index = index
+        planet.symbol = symbol
+        planet.fill = fill
+        planet.color = color
+        planet.time = system.time
+        return planet
+
     def __str__(self):
         """
         Returns a string representation of the planet's current state.
@@ -137,6 +307,7 @@ class Sun(Planet):
             radius,
             0,
             0,
+            angle=0,
             symbol=symbol,
             fill=fill,
             line_width=line_width,
@@ -144,9 +315,394 @@ class Sun(Planet):
         )
 
 
+def _state_array(name):
+    """Returns a property exposing the in-use part of one of a
+    BodySystem's state arrays."""
+
+    def getter(self):
+        return self._storage[name][:len(self._planets)]
+
+    return property(getter, doc=f"ndarray: The {name} of each Planet.")
+
+
+class BodySystem:
+    """Container storing the orbital state and shape of many Planets in
+    contiguous arrays, and placing them all at once.
+
+    Planets added to the system become views onto its arrays, so they can
+    still be read, drawn and modified individually. How the bodies move
+    over time is up to subclasses: see PlanetSystem and GravitySystem.
+
+    Bodies with a parent are resolved after the bodies orbiting the centre,
+    one vectorized pass per level of the hierarchy, so `x`, `y` and `z`
+    always hold positions relative to the centre of the screen.
+    """
+
+    angle = _state_array("angle")
+    period = _state_array("period")
+    orbit_radius = _state_array("orbit_radius")
+    inclination = _state_array("inclination")
+    eccentricity = _state_array("eccentricity")
+    periapsis = _state_array("periapsis")
+    anomaly = _state_array("anomaly")
+    x = _state_array("x")
+    y = _state_array("y")
+    z = _state_array("z")
+    parent = _state_array("parent")
+    radius = _state_array("radius")
+    line_width = _state_array("line_width")
+    has_ring = _state_array("has_ring")
+
+    def __init__(self, planets=(), clock=time.time):
+        """Initialises a new BodySystem.
+
+        Args:
+            planets (Iterable[Planet], optional): Planets to add.
+                Defaults to ().
+            clock (callable, optional): Simulation clock returning seconds.
+                Defaults to time.time.
+
+        Attributes:
+            time (float): Timestamp of the last update.
+            kepler_steps (int): Newton steps taken on Kepler's equation
+                over all elliptical orbits in the last update.
+        """
+        self._planets = []
+        self._capacity = 0
+        self._storage = {}
+        self._reserve(16)
+        self.clock = clock
+        self.time = clock()
+        self._levels = []
+        self.kepler_steps = 0
+        self.extend(planets)
+
+    def _reserve(self, capacity):
+        """Grows the arrays to hold at least `capacity` Planets."""
+        import numpy as np
+
+        if capacity <= self._capacity:
+            return
+        capacity = max(capacity, 2 * self._capacity)
+        size = len(self._planets)
+        for name in ORBITAL_STATE:
+            grown = np.zeros(capacity)
+            if name in self._storage:
+                grown[:size] = self._storage[name][:size]
+            self._storage[name] = grown
+        for name, dtype in SHAPE_STATE.items():
+            grown = np.zeros(capacity, dtype)
+            if name in self._storage:
+                grown[:size] = self._storage[name][:size]
+            self._storage[name] = grown
+        for name in ("parent", "depth"):
+            grown = np.full(capacity, -1 if name == "parent" else 0)
+            if name in self._storage:
+                grown[:size] = self._storage[name][:size]
+            self._storage[name] = grown
+        self._capacity = capacity
+
+    def append(self, planet):
+        """Adds a Planet, moving its orbital state and shape into the
+        system.
+
+        Args:
+            planet (Planet): The planet to add. It must not already belong
+                to a BodySystem, and its parent, if any, must already
+                belong to this one.
+
+        Returns:
+            None
+        """
+        import numpy as np
+
+        if planet._system is not None:
+            raise ValueError("planet already belongs to a BodySystem")
+        parent = planet.parent
+        if parent is not None and parent._system is not self:
+            raise ValueError("a planet's parent must be added before it")
+        index = len(self._planets)
+        self._reserve(index + 1)
+        for name in (*ORBITAL_STATE, *SHAPE_STATE):
+            self._storage[name][index] = getattr(planet, name)
+        if parent is not None:
+            self._link(np.array([index]), np.array([parent._index]))
+        self._planets.append(planet)
+        planet._system = self
+        planet._index = index
+
+    def _link(self, children, parents):
+        """Records the parents of some new Planets and regroups the
+        hierarchy into levels."""
+        import numpy as np
+
+        storage = self._storage
+        storage["parent"][children] = parents
+        storage["depth"][children] = storage["depth"][parents] + 1
+        depth = storage["depth"][:max(len(self._planets), children[-1] + 1)]
+        self._levels = [
+            np.flatnonzero(depth == level)
+            for level in range(1, int(depth.max()) + 1)
+        ]
+
+    def extend(self, planets):
+        """Adds several Planets.
+
+        Args:
+            planets (Iterable[Planet]): The planets to add.
+
+        Returns:
+            None
+        """
+        for planet in planets:
+            self.append(planet)
+
+    def extend_records(self, records, first=None):
+        """Adds Planets described by a structured array, copying each
+        orbital state and shape column into the system's arrays in one
+        step.
+
+        Args:
+            records (ndarray): Bodies with the fields of BODY_DTYPE. Bodies
+                with a NaN angle are given a random one.
+            first (int, optional): Index in the system of the body that
+                parent indices count from, so that a scene can be added in
+                several chunks. Defaults to the first of `records`.
+
+        Returns:
+            None
+        """
+        import numpy as np
+
+        start = len(self._planets)
+        stop = start + len(records)
+        self._reserve(stop)
+        storage = self._storage
+        angle = storage["angle"][start:stop]
+        angle[:] = records["angle"]
+        unset = np.isnan(angle)
+        if unset.any():
+            rng = np.random.default_rng(random.getrandbits(64))
+            angle[unset] = rng.uniform(0, 2 * math.pi, np.count_nonzero(unset))
+        for name in (
+            "period", "orbit_radius", "inclination", "eccentricity",
+            "periapsis", *SHAPE_STATE,
+        ):
+            storage[name][start:stop] = records[name]
+        eccentricity = storage["eccentricity"][start:stop]
+        if ((eccentricity < 0) | (eccentricity >= 1)).any():
+            raise ValueError("eccentricity must be at least 0 and below 1")
+        storage["anomaly"][start:stop] = angle
+        for name in ("x", "y", "z"):
+            storage[name][start:stop] = 0
+        if first is None:
+            first = start
+        parent = np.asarray(records["parent"])
+        children = np.flatnonzero(parent >= 0)
+        parents = first + parent[children]
+        children += start
+        if (parents >= children).any():
+            raise ValueError("a planet's parent must come before it")
+        view = Planet.view
+        self._planets.extend(
+            view(self, index, *fields)
+            for index, *fields in zip(
+                range(start, stop),
+                *(
+                    records[name].tolist()
+                    for name in ("symbol", "fill", "color")
+                ),
+            )
+        )
+        if children.size:
+            self._link(children, parents)
+            planets = self._planets
+            for child, index in zip(children.tolist(), parents.tolist()):
+                planets[child].parent = planets[index]
+
+    def _place(self, moving, angle):
+        """Sets the angles of the given Planets and recomputes their
+        positions, then those of every Planet with a parent."""
+        self.angle[moving] = angle
+        self.kepler_steps = 0
+        if self._levels:
+            roots = self.parent[moving] < 0
+            moving, angle = moving[roots], angle[roots]
+        if moving.size:
+            x, y, z = self._orbit(moving, angle)
+            self.x[moving] = x
+            self.y[moving] = y
+            self.z[moving] = z
+        self._resolve()
+
+    def _orbit(self, bodies, angle):
+        """Returns the positions of some Planets relative to what they
+        orbit, solving Kepler's equation for those on elliptical orbits."""
+        import numpy as np
+
+        radius = self.orbit_radius[bodies]
+        periapsis = self.periapsis[bodies]
+        inclination = self.inclination[bodies]
+        eccentricity = self.eccentricity[bodies]
+        elliptical = np.flatnonzero(eccentricity)
+        if elliptical.size == 0:
+            return polar_to_cartesian_arrays(
+                radius, angle + periapsis, inclination
+            )
+
+        circular = np.flatnonzero(eccentricity == 0)
+        x, y, z = (np.empty(bodies.size) for _ in range(3))
+        x[circular], y[circular], z[circular] = polar_to_cartesian_arrays(
+            radius[circular],
+            angle[circular] + periapsis[circular],
+            inclination[circular],
+        )
+        eccentric = bodies[elliptical]
+        eccentricity = eccentricity[elliptical]
+        anomaly, steps = solve_kepler(
+            angle[elliptical], eccentricity, self.anomaly[eccentric]
+        )
+        self.anomaly[eccentric] = anomaly
+        self.kepler_steps += steps
+        x[elliptical], y[elliptical], z[elliptical] = (
+            kepler_to_cartesian_arrays(
+                radius[elliptical],
+                anomaly,
+                eccentricity,
+                periapsis[elliptical],
+                inclination[elliptical],
+            )
+        )
+        return x, y, z
+
+    def _resolve(self):
+        """Places every Planet with a parent relative to it, a whole level
+        of the hierarchy at a time, parents before children."""
+        parent = self.parent
+        x, y, z = self.x, self.y, self.z
+        for level in self._levels:
+            parents = parent[level]
+            local_x, local_y, local_z = self._orbit(level, self.angle[level])
+            x[level] = local_x + x[parents]
+            y[level] = local_y + y[parents]
+            z[level] = local_z + z[parents]
+
+    def __iter__(self):
+        """Returns an iterator over the Planets."""
+        return iter(self._planets)
+
+    def __len__(self):
+        """Returns the number of Planets."""
+        return len(self._planets)
+
+    def __getitem__(self, index):
+        """Returns the Planet at an index."""
+        return self._planets[index]
+
+
+class PlanetSystem(BodySystem):
+    """BodySystem whose Planets follow their orbits, advancing them all at
+    once.
+
+    Every body is moved with a single clock read and one vectorized trig
+    pass per frame. Because orbits have a closed form, the system can also
+    be moved straight to any timestamp.
+    """
+
+    def __init__(self, planets=(), clock=time.time):
+        """Initialises a new PlanetSystem.
+
+        Args:
+            planets (Iterable[Planet], optional): Planets to add.
+                Defaults to ().
+            clock (callable, optional): Simulation clock returning seconds.
+                Defaults to time.time.
+        """
+        super().__init__(planets, clock)
+        self._epoch = None
+
+    def update(self, current_time=None):
+        """Advances every Planet to the current time.
+        Should be called once per frame.
+
+        Args:
+            current_time (float, optional): Timestamp to advance to.
+                Defaults to the system's clock.
+
+        Returns:
+            None
+        """
+        import numpy as np
+
+        if current_time is None:
+            current_time = self.clock()
+        dt = current_time - self.time
+        self.time = current_time
+
+        moving = np.flatnonzero(self.period)
+        angle = (
+            self.angle[moving] + (dt / self.period[moving]) * 2 * math.pi
+        ) % (2 * math.pi)
+        self._place(moving, angle)
+
+    def at(self, current_time):
+        """Moves every Planet to its position at a timestamp in closed form,
+        measured from the state the system had the first time this was
+        called. Frames can therefore be computed in any order.
+
+        Args:
+            current_time (float): Timestamp to move to.
+
+        Returns:
+            None
+        """
+        import numpy as np
+
+        if self._epoch is None:
+            self._epoch = (self.time, self.angle.copy())
+        epoch_time, epoch_angle = self._epoch
+        self.time = current_time
+
+        moving = np.flatnonzero(self.period)
+        angle = (
+            epoch_angle[moving]
+            + ((current_time - epoch_time) / self.period[moving]) * 2 * math.pi
+        ) % (2 * math.pi)
+        self._place(moving, angle)
+
+
+def _star_property(name, kind):
+    """Returns a property reading the named state from the Star's StarField
+    if it belongs to one, or from the Star itself if not."""
+    private = "_" + name
+
+    def getter(self):
+        if self._field is None:
+            return getattr(self, private)
+        return kind(getattr(self._field, name)[self._index])
+
+    def setter(self, value):
+        if self._field is None:
+            setattr(self, private, value)
+        else:
+            getattr(self._field, name)[self._index] = value
+
+    return property(getter, setter)
+
+
 class Star():
     """Represents a star.
-    Unlike Planets, coordinates are exact pixels on the screen."""
+    Unlike Planets, coordinates are exact pixels on the screen.
+
+    Stars belonging to a StarField are views onto the field's arrays."""
+
+    _field = None
+    _index = None
+
+    x = _star_property("x", int)
+    y = _star_property("y", int)
+    idx = _star_property("idx", int)
+    time = _star_property("time", float)
 
     def __init__(self, console):
         """Initializes a new Star.
@@ -164,16 +720,234 @@ class Star():
         """
         self.x = random.randint(0, console.width - 1)
         self.y = random.randint(0, console.height - 1)
-        self.frames = [' ', '.', '+', '*', '+', '.', ' ']
+        self.frames = list(STAR_FRAMES)
         self.idx = random.randint(0, len(self.frames) - 1)
         self.time = time.time() + random.uniform(0, STAR_FRAME_HOLD)
-        self.color = "white"
+        self.color = STAR_COLOR
+
+    @classmethod
+    def view(cls, field, index):
+        """Returns a Star backed by one entry of a StarField.
 
-    def update(self):
+        Args:
+            field (StarField): The field holding the star's state.
+            index (int): Index of the star in the field.
+
+        Returns:
+            Star: The view.
+        """
+        star = cls.__new__(cls)
+        star._field = field
+        star._index = index
+        star.frames = field.frames
+        star.color = field.color
+        return star
+
+    def update(self, current_time=None):
         """Updates the Star when called to calculate new symbol/position.
-        Should be called once per frame."""
-        current_time = time.time()
+        Should be called once per frame.
+
+        Args:
+            current_time (float, optional): Timestamp to advance to.
+                Defaults to time.time().
+        """
+        if current_time is None:
+            current_time = time.time()
         dt = current_time - self.time
         if dt > STAR_FRAME_HOLD:
             self.time = current_time
             self.idx = (self.idx + 1) % len(self.frames)
+
+
+def _mix(values):
+    """Returns the SplitMix64 finalizer of each value, a cheap hash whose
+    output bits all depend on every input bit."""
+    import numpy as np
+
+    values = values + np.uint64(0x9E3779B97F4A7C15)
+    values = (values ^ (values >> np.uint64(30))) * np.uint64(
+        0xBF58476D1CE4E5B9
+    )
+    values = (values ^ (values >> np.uint64(27))) * np.uint64(
+        0x94D049BB133111EB
+    )
+    return values ^ (values >> np.uint64(31))
+
+
+class StarField:
+    """Twinkling background stars stored in compact arrays.
+
+    Every due star advances its animation frame in one batched step, faded
+    out stars are respawned in bulk to cells hashed from their respawn
+    count, and all stars are stamped into the frame buffer in one pass.
+    """
+
+    def __init__(self, console, count, rng=None, clock=time.time):
+        """Initialises a new StarField.
+
+        Args:
+            console (Console): Console being drawn to.
+            count (int): Number of stars.
+            rng (Generator, optional): Random number generator.
+                Defaults to a freshly seeded one.
+            clock (callable, optional): Simulation clock returning seconds.
+                Defaults to time.time.
+
+        Attributes:
+            x (ndarray): X-coordinate of each star on the screen.
+            y (ndarray): Y-coordinate of each star on the screen.
+            idx (ndarray): Current animation frame of each star.
+            time (ndarray): Timestamp of each star's last frame change.
+            respawns (ndarray): Times each star has been relocated.
+            frames (list[str]): Animation frames for the twinkle effect.
+            color (str): Color used to draw the stars.
+        """
+        import numpy as np
+
+        self.rng = np.random.default_rng() if rng is None else rng
+        self.clock = clock
+        self.frames = list(STAR_FRAMES)
+        self.color = STAR_COLOR
+        self._glyphs = np.array(self.frames)
+        self.x = self.rng.integers(0, console.width, count, dtype=np.intp)
+        self.y = self.rng.integers(0, console.height, count, dtype=np.intp)
+        self.idx = self.rng.integers(
+            0, len(self.frames), count, dtype=np.int8
+        )
+        self.time = clock() + self.rng.uniform(0, STAR_FRAME_HOLD, count)
+        self.respawns = np.zeros(count, dtype=np.int64)
+        self._key = np.uint64(self.rng.integers(2 ** 63))
+        self._epoch = None
+
+    def update(self, current_time=None):
+        """Advances the animation frame of every star that is due.
+        Should be called once per frame.
+
+        Args:
+            current_time (float, optional): Timestamp to advance to.
+                Defaults to the field's clock.
+
+        Returns:
+            None
+        """
+        if current_time is None:
+            current_time = self.clock()
+        due = current_time - self.time > STAR_FRAME_HOLD
+        self.time[due] = current_time
+        self.idx[due] = (self.idx[due] + 1) % len(self.frames)
+
+    def at(self, current_time, width, height):
+        """Moves every star to its state at a timestamp in closed form,
+        measured from the state the field had the first time this was
+        called. Frames can therefore be computed in any order.
+
+        Each star steps through its animation once per STAR_FRAME_HOLD and
+        is respawned every time it fades out, so its frame and respawn count
+        follow directly from the elapsed time.
+
+        Args:
+            current_time (float): Timestamp to move to.
+            width (int): Width of the frame.
+            height (int): Height of the frame.
+
+        Returns:
+            None
+        """
+        import numpy as np
+
+        if self._epoch is None:
+            self._epoch = tuple(
+                array.copy()
+                for array in (self.idx, self.time, self.x, self.y)
+            )
+        idx, start, x, y = self._epoch
+        frames = len(self.frames)
+        steps = np.floor((current_time - start) / STAR_FRAME_HOLD)
+        total = idx + np.maximum(steps, 0).astype(np.int64)
+        self.idx = (total % frames).astype(np.int8)
+        self.time = start + np.maximum(steps, 0) * STAR_FRAME_HOLD
+        self.respawns = total // frames + (idx == 0)
+        respawned = np.flatnonzero(self.respawns)
+        self.x, self.y = x.copy(), y.copy()
+        self._scatter(respawned, width, height)
+
+    def relocate(self, width, height):
+        """Moves every star that has faded out or fallen outside the frame
+        to a random cell.
+
+        Args:
+            width (int): Width of the frame.
+            height (int): Height of the frame.
+
+        Returns:
+            None
+        """
+        import numpy as np
+
+        moved = np.flatnonzero(
+            (self.idx == 0) | (self.x >= width) | (self.y >= height)
+        )
+        self.respawns[moved] += 1
+        self._scatter(moved, width, height)
+
+    def _scatter(self, moved, width, height):
+        """Places stars on cells hashed from their index and respawn count.
+        """
+        import numpy as np
+
+        if moved.size == 0:
+            return
+        cells = _mix(
+            _mix(self._key ^ moved.astype(np.uint64))
+            ^ self.respawns[moved].astype(np.uint64)
+        ) % np.uint64(width * height)
+        self.y[moved], self.x[moved] = np.divmod(cells.astype(np.intp), width)
+
+    def glyphs(self):
+        """Returns the symbol each star currently shows.
+
+        Returns:
+            ndarray: Symbols in star order.
+        """
+        return self._glyphs[self.idx]
+
+    def stamp(self, buffer):
+        """Relocates faded stars and draws every star to the buffer.
+
+        Args:
+            buffer (list[list[str]]): Buffer to write to.
+
+        Returns:
+            None
+        """
+        self.relocate(len(buffer[0]), len(buffer))
+        color = self.color
+        for x, y, symbol in zip(
+            self.x.tolist(), self.y.tolist(), self.glyphs().tolist()
+        ):
+            buffer[y][x] = (symbol, color)
+
+    def subset(self, count):
+        """Returns a StarField drawing only the first `count` stars.
+
+        The subset's arrays are views onto this field's, so it follows
+        this field's updates and relocations write through to it.
+
+        Args:
+            count (int): Number of stars to keep.
+
+        Returns:
+            StarField: The smaller field.
+        """
+        subset = copy.copy(self)
+        for name in ("x", "y", "idx", "time", "respawns"):
+            setattr(subset, name, getattr(self, name)[:count])
+        return subset
+
+    def __iter__(self):
+        """Returns an iterator over Star views of the field."""
+        return (Star.view(self, index) for index in range(len(self)))
+
+    def __len__(self):
+        """Returns the number of stars."""
+        return len(self.x)
@@ -0,0 +1,172 @@
+import json
+import sys
+import time
+
+from terminal_solar_system.config import RECORD_BUFFER_SIZE
+from terminal_solar_system.output import (
+    ENTER_ALT_SCREEN,
+    EXIT_ALT_SCREEN,
+    HIDE_CURSOR,
+    RESET_STYLE,
+    SHOW_CURSOR,
+    DiffWriter,
+)
+
+ASCIICAST_VERSION = 2
+
+
+class Recorder:
+    """Streams frames to an asciicast v2 file as they are drawn.
+
+    Each frame is stored as an output event holding only the escape
+    sequences that turn the previous frame into it, so nothing but the
+    last frame is kept in memory.
+    """
+
+    def __init__(
+        self, path, width, height, print_color=True, clock=time.monotonic
+    ):
+        """Initialises a new Recorder.
+
+        Args:
+            path (str): File to write the recording to.
+            width (int): Terminal width at the start of the recording.
+            height (int): Terminal height at the start of the recording.
+            print_color (bool, optional): Whether or not to record color.
+                Defaults to True.
+            clock (callable, optional): Monotonic clock returning seconds.
+                Defaults to time.monotonic.
+
+        Attributes:
+            events (int): Events written so far.
+        """
+        self.path = path
+        self.width = width
+        self.height = height
+        self.events = 0
+        self._clock = clock
+        self._writer = DiffWriter(self, print_color)
+        self._file = None
+        self._start = None
+
+    def __enter__(self):
+        """Opens the file and writes the asciicast header."""
+        self._file = open(
+            self.path, "w", encoding="utf-8", buffering=RECORD_BUFFER_SIZE
+        )
+        header = {
+            "version": ASCIICAST_VERSION,
+            "width": self.width,
+            "height": self.height,
+            "timestamp": int(time.time()),
+        }
+        self._file.write(json.dumps(header) + "\n")
+        self._start = self._clock()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Closes the file."""
+        self._file.close()
+
+    @property
+    def print_color(self):
+        """bool: Whether or not color is recorded. Changing it records the
+        next frame in full."""
+        return self._writer.print_color
+
+    @print_color.setter
+    def print_color(self, print_color):
+        self._writer.print_color = print_color
+        self._writer.invalidate()
+
+    def write_frame(self, buffer):
+        """Records the difference between a buffer and the previous frame.
+
+        Args:
+            buffer (list[list[tuple]]): Rows of (symbol, color) cells.
+
+        Returns:
+            None
+        """
+        height = len(buffer)
+        width = len(buffer[0]) if buffer else 0
+        if (width, height) != (self.width, self.height):
+            self.width, self.height = width, height
+            self._event("r", f"{width}x{height}")
+        self._writer.write_frame(buffer)
+
+    def write(self, data):
+        """Records terminal output. Called by the DiffWriter.
+
+        Args:
+            data (str): Escape sequences and symbols.
+
+        Returns:
+            None
+        """
+        self._event("o", data)
+
+    def flush(self):
+        """Does nothing; events reach the disk as the buffer fills."""
+
+    def _event(self, code, data):
+        """Writes an event stamped with the time since recording began."""
+        elapsed = round(self._clock() - self._start, 6)
+        self._file.write(json.dumps([elapsed, code, data]) + "\n")
+        self.events += 1
+
+
+def play(
+    path,
+    file=sys.stdout,
+    stop_event=None,
+    clock=time.monotonic,
+    sleep=time.sleep
+):
+    """Replays an asciicast v2 recording with its original timing.
+
+    Events are read from disk one at a time, so recordings of any length
+    play in constant memory.
+
+    Args:
+        path (str): Recording to play.
+        file (TextIO, optional): Stream to write to. Defaults to sys.stdout.
+        stop_event (Event, optional): Playback stops early once set.
+            Defaults to None.
+        clock (callable, optional): Monotonic clock returning seconds.
+            Defaults to time.monotonic.
+        sleep (callable, optional): Function sleeping for a number of
+            seconds. Defaults to time.sleep.
+
+    Returns:
+        int: Output events played.
+
+    Raises:
+        ValueError: If the file is not an asciicast v2 recording.
+    """
+    played = 0
+    with open(path, encoding="utf-8") as recording:
+        header = json.loads(recording.readline() or "{}")
+        if header.get("version") != ASCIICAST_VERSION:
+            raise ValueError(f"{path} is not an asciicast v2 recording")
+        file.write(ENTER_ALT_SCREEN + HIDE_CURSOR)
+        try:
+            start = clock()
+            for line in recording:
+                if stop_event is not None and stop_event.is_set():
+                    break
+                if not line.strip():
+                    continue
+                elapsed, code, data = json.loads(line)
+                if code != "o":
+                    continue
+                delay = start + elapsed - clock()
+                if delay > 0:
+                    sleep(delay)
+                file.write(data)
+                file.flush()
+                played += 1
+        finally:
+            file.write(RESET_STYLE + SHOW_CURSOR + EXIT_ALT_SCREEN)
+            file.flush()
+    return played
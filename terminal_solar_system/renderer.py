@@ -1,58 +1,233 @@
 import math
 import random
+from itertools import groupby
 
 from terminal_solar_system.config import (
     DEPTH_OF_FIELD_MODIFIER,
     RING_CHAR,
     RING_SIZE_MODIFIER,
 )
+from terminal_solar_system.framebuffer import blank_grid
+from terminal_solar_system.lod import POINT, STAMP
+from terminal_solar_system.planets import StarField
 
 
-def render_frame(planets, stars, console, print_color, terminal_x_scale):
+def render_frame(
+    planets,
+    stars,
+    console,
+    print_color,
+    terminal_x_scale,
+    sprite_cache=None,
+    lod=None,
+    frame_buffer=None,
+    camera=None,
+    depth_buffer=None
+):
     """Returns a rendered frame to be printed.
 
     Args:
         planets (list[Planet]): List of planets to be drawn.
-        stars (list[Star]): List of stars to be drawn.
+        stars (list[Star] | StarField): Stars to be drawn.
         console (Console): Console being drawn to.
         print_color (bool): Whether or not to color output.
         terminal_x_scale (float): Font height/width ratio.
+        sprite_cache (SpriteCache, optional): Cache of pre-rasterized discs
+            to stamp planets from. Defaults to None.
+        lod (LevelOfDetail, optional): If given, chooses per planet between
+            a point glyph, a stamped sprite and exact rasterization.
+            Defaults to None.
+        frame_buffer (FrameBuffer | FramePool, optional): Reusable grids
+            to draw into instead of allocating a new buffer.
+            Defaults to None.
+        camera (Camera, optional): Zooms and pans the planets and culls
+            those outside the frame. Defaults to None.
+        depth_buffer (DepthBuffer, optional): If given, planets are
+            composited cell by cell by depth instead of being painted back
+            to front. Defaults to None.
+
+    Returns:
+        Text: Buffer contents rendered to styled text.
+    """
+    buffer = rasterize_frame(
+        planets,
+        stars,
+        console.width,
+        console.height,
+        terminal_x_scale,
+        sprite_cache,
+        lod,
+        frame_buffer,
+        camera,
+        depth_buffer
+    )
+    return serialize_frame(buffer, print_color)
+
 
+def rasterize_frame(
+    planets,
+    stars,
+    width,
+    height,
+    terminal_x_scale,
+    sprite_cache=None,
+    lod=None,
+    frame_buffer=None,
+    camera=None,
+    depth_buffer=None
+):
+    """Returns a buffer with the stars and planets drawn into it.
+
+    Stars are moved back inside the frame only when the buffer is
+    allocated or resized.
+
+    Args:
+        planets (list[Planet]): List of planets to be drawn.
+        stars (list[Star] | StarField): Stars to be drawn.
+        width (int): Width of the buffer.
+        height (int): Height of the buffer.
+        terminal_x_scale (float): Font height/width ratio.
+        sprite_cache (SpriteCache, optional): Cache of pre-rasterized discs
+            to stamp planets from. Defaults to None.
+        lod (LevelOfDetail, optional): If given, chooses per planet between
+            a point glyph, a stamped sprite and exact rasterization.
+            Defaults to None.
+        frame_buffer (FrameBuffer | FramePool, optional): Reusable grids
+            to draw into instead of allocating a new buffer.
+            Defaults to None.
+        camera (Camera, optional): Zooms and pans the planets and culls
+            those outside the frame. Defaults to None.
+        depth_buffer (DepthBuffer, optional): If given, planets are
+            composited cell by cell by depth instead of being painted back
+            to front. Defaults to None.
 
     Returns:
-        str: Buffer contents rendered to a string.
+        list[list[tuple]]: Rows of (symbol, color) cells.
     """
-    width = console.width
-    height = console.height
-    buffer = [[(' ', None) for _ in range(width)] for _ in range(height)]
-    center_x = width // 2
-    center_y = height // 2
-    sorted_planets = sorted(planets, key=lambda planet: planet.z)
-    for star in stars:
-        render_star(buffer, star)
-    for planet in sorted_planets:
+    if frame_buffer is None:
+        buffer = blank_grid(width, height)
+    else:
+        buffer = frame_buffer.acquire(width, height)
+    if frame_buffer is None or frame_buffer.resized:
+        relocate_stars(stars, width, height)
+    depth = None
+    if depth_buffer is not None:
+        depth_buffer.acquire(width, height)
+        depth = depth_buffer.rows
+    placed = place_planets(
+        planets, width, height, terminal_x_scale, sprite_cache, lod, camera,
+        front_to_back=depth is not None
+    )
+    zoom = 1.0 if camera is None else camera.zoom
+    if isinstance(stars, StarField):
+        stars.stamp(buffer)
+    else:
+        for star in stars:
+            render_star(buffer, star)
+    for planet, center_x, center_y in placed:
         render_planet(
             buffer,
             planet,
-            center_x + planet.x,
-            center_y + planet.y,
-            terminal_x_scale
+            center_x,
+            center_y,
+            terminal_x_scale,
+            sprite_cache,
+            lod,
+            zoom,
+            depth
         )
-    if print_color:
-        return "\n".join(
-            "".join(
-                f"[{color}]{symbol}[/{color}]" if color else symbol
-                for symbol, color in row
-            )
-            for row in buffer
+    return buffer
+
+
+def place_planets(
+    planets,
+    width,
+    height,
+    terminal_x_scale,
+    sprite_cache=None,
+    lod=None,
+    camera=None,
+    front_to_back=False
+):
+    """Returns where to draw each planet, in drawing order.
+
+    Planets are painted back to front. With a depth buffer the order no
+    longer decides what is visible, but drawing front to back lets the
+    depth test reject hidden fragments before anything is written.
+
+    Args:
+        planets (list[Planet]): List of planets to be drawn.
+        width (int): Width of the frame.
+        height (int): Height of the frame.
+        terminal_x_scale (float): Font height/width ratio.
+        sprite_cache (SpriteCache, optional): Cache planets are stamped
+            from. Defaults to None.
+        lod (LevelOfDetail, optional): Level of detail planets are drawn
+            at. Defaults to None.
+        camera (Camera, optional): If given, zooms and pans the planets and
+            leaves out those outside the frame. If not, every planet is
+            drawn around the centre of the frame. Defaults to None.
+        front_to_back (bool, optional): Sort the planets nearest first
+            instead of farthest first. Defaults to False.
+
+    Returns:
+        list[tuple]: (planet, center_x, center_y) of each planet, sorted by
+            depth.
+    """
+    if camera is not None:
+        return camera.place(
+            planets, width, height, terminal_x_scale, sprite_cache, lod,
+            front_to_back
         )
-    return "\n".join(
-        "".join(
-            f"[{'white'}]{symbol}[/{'white'}]" if color else symbol
-            for symbol, color in row
+    center_x = width // 2
+    center_y = height // 2
+    return [
+        (planet, center_x + planet.x, center_y + planet.y)
+        for planet in sorted(
+            planets, key=lambda planet: planet.z, reverse=front_to_back
         )
-        for row in buffer
-    )
+    ]
+
+
+def serialize_frame(buffer, print_color):
+    """Converts a buffer to styled text, one span per run of equal color.
+
+    Building the Text directly means Rich never has to parse markup. Rich
+    itself is only imported on the first call, so monochrome ANSI output
+    never pays for it.
+
+    Args:
+        buffer (list[list[str]]): Buffer to convert.
+        print_color (bool): Whether or not to color output. If not, every
+            colored cell is drawn white.
+
+    Returns:
+        Text: Buffer contents as styled text.
+    """
+    from rich.text import Span, Text
+
+    lines = []
+    spans = []
+    offset = 0
+    for row in buffer:
+        symbols, colors = zip(*row) if row else ((), ())
+        lines.append("".join(symbols))
+        start = offset
+        for color, run in groupby(colors):
+            end = start + sum(1 for _ in run)
+            if color:
+                style = color if print_color else "white"
+                if (
+                    spans
+                    and spans[-1].end == start
+                    and spans[-1].style == style
+                ):
+                    spans[-1] = Span(spans[-1].start, end, style)
+                else:
+                    spans.append(Span(start, end, style))
+            start = end
+        offset += len(symbols) + 1
+    return Text("\n".join(lines), spans=spans)
 
 
 def render_planet(
@@ -60,7 +235,11 @@ def render_planet(
         planet,
         center_x,
         center_y,
-        terminal_x_scale
+        terminal_x_scale,
+        sprite_cache=None,
+        lod=None,
+        zoom=1.0,
+        depth=None
 ):
     """Writes a planet to the buffer for rendering.
 
@@ -70,6 +249,17 @@ def render_planet(
         center_x (int): Center x-coordinate of the buffer.
         center_y (int): Center y-coordinate of the buffer.
         terminal_x_scale (float): height/width ratio of text in terminal.
+        sprite_cache (SpriteCache, optional): If given, the disc is stamped
+            from a cached sprite at the nearest cell instead of being
+            rasterized. Defaults to None.
+        lod (LevelOfDetail, optional): If given, small planets are drawn as
+            a point and mid-size planets are stamped from its sprite cache.
+            Defaults to None.
+        zoom (float, optional): Factor the planet's radius is scaled by.
+            Defaults to 1.0.
+        depth (list[memoryview], optional): Rows of a DepthBuffer. If
+            given, each cell is only written if the planet is nearer there
+            than what was drawn before. Defaults to None.
 
     Returns:
         None
@@ -80,60 +270,325 @@ def render_planet(
     height = len(buffer)
     width = len(buffer[0])
 
-    pixel_written = False
-    min_dist = float("inf")
-
     depth_of_field = planet.z / DEPTH_OF_FIELD_MODIFIER
-    inner_radius = planet.radius + depth_of_field - planet.line_width / 2
-    outer_radius = planet.radius + depth_of_field + planet.line_width / 2
+    radius = (planet.radius + depth_of_field) * zoom
+    # Depths are in cells, like the radius, so the planet's surface can
+    # bulge towards the viewer.
+    center_z = planet.z * zoom
+    front_z = center_z + max(radius + planet.line_width / 2, 0)
 
-    for yi in range(height):
-        for xi in range(width):
-            dx = (xi - center_x) / terminal_x_scale
-            dy = (yi - center_y)
-            dist = math.sqrt(dx ** 2 + dy ** 2)
-
-            if inner_radius < dist < outer_radius:
-                buffer[yi][xi] = (planet.symbol, planet.color)
-                pixel_written = True
-
-            if dist < inner_radius:
-                buffer[yi][xi] = (planet.fill, planet.color)
+    if lod is not None:
+        tier = lod.tier(radius, planet.line_width)
+        if tier == POINT:
+            render_point(buffer, planet, center_x, center_y, depth, front_z)
+            return
+        sprite_cache = lod.sprite_cache if tier == STAMP else None
 
-            if dist < min_dist:
-                min_dist = dist
-                min_coords = (yi, xi)
+    if sprite_cache is None:
+        pixel_written = rasterize_disc(
+            buffer,
+            planet,
+            center_x,
+            center_y,
+            radius,
+            terminal_x_scale,
+            depth,
+            center_z
+        )
+    else:
+        sprite = sprite_cache.get(
+            radius,
+            planet.line_width,
+            terminal_x_scale
+        )
+        pixel_written = blit_sprite(
+            buffer, planet, sprite, center_x, center_y, depth, center_z
+        )
 
     if not pixel_written:
-        yi, xi = min_coords
+        yi, xi = nearest_cell(center_x, center_y, width, height)
         if 0 < yi < height - 1 and 0 < xi < width - 1:
-            buffer[yi][xi] = (planet.symbol, planet.color)
+            write_cell(
+                buffer, depth, yi, xi, (planet.symbol, planet.color), front_z
+            )
 
-    if planet.has_ring:
+    if planet.has_ring and (lod is None or lod.rings):
         render_planet_ring(
             buffer,
             planet,
             center_x,
             center_y,
-            terminal_x_scale
+            terminal_x_scale,
+            zoom,
+            depth,
+            center_z
         )
 
 
-def render_planet_ring(
+def write_cell(buffer, depth, yi, xi, cell, z):
+    """Writes a cell, unless a depth buffer holds something nearer there.
+
+    Args:
+        buffer (list[list[str]]): Buffer to write to.
+        depth (list[memoryview]): Rows of a DepthBuffer, or None to always
+            write.
+        yi (int): Row of the cell.
+        xi (int): Column of the cell.
+        cell (tuple): (symbol, color) to write.
+        z (float): Depth of the fragment.
+
+    Returns:
+        None
+    """
+    if depth is not None:
+        if z <= depth[yi][xi]:
+            return
+        depth[yi][xi] = z
+    buffer[yi][xi] = cell
+
+
+def render_point(buffer, planet, center_x, center_y, depth=None, z=0.0):
+    """Draws a planet as a single glyph in the cell containing its center.
+
+    Args:
+        buffer (list[list[str]]): Buffer to write to.
+        planet (Planet): The planet being drawn.
+        center_x (float): Center x-coordinate of the planet.
+        center_y (float): Center y-coordinate of the planet.
+        depth (list[memoryview], optional): Rows of a DepthBuffer to test
+            the glyph against. Defaults to None.
+        z (float, optional): Depth of the glyph. Defaults to 0.0.
+
+    Returns:
+        None
+    """
+    yi = math.ceil(center_y - 0.5)
+    xi = math.ceil(center_x - 0.5)
+    if 0 <= yi < len(buffer) and 0 <= xi < len(buffer[0]):
+        write_cell(buffer, depth, yi, xi, (planet.symbol, planet.color), z)
+
+
+def rasterize_disc(
     buffer,
     planet,
     center_x,
     center_y,
+    radius,
+    terminal_x_scale,
+    depth=None,
+    center_z=0.0
+):
+    """Writes a planet's border and fill to the cells inside its bounding box.
+
+    With a depth buffer, the planet is treated as a sphere of its outer
+    radius, so each cell's depth is that of the sphere's surface in front
+    of it.
+
+    Args:
+        buffer (list[list[str]]): Buffer to write to.
+        planet (Planet): The planet being drawn.
+        center_x (float): Center x-coordinate of the planet.
+        center_y (float): Center y-coordinate of the planet.
+        radius (float): Effective radius of the planet.
+        terminal_x_scale (float): height/width ratio of text in terminal.
+        depth (list[memoryview], optional): Rows of a DepthBuffer to test
+            cells against. Defaults to None.
+        center_z (float, optional): Depth of the planet's center.
+            Defaults to 0.0.
+
+    Returns:
+        bool: Whether the disc has any border cell on screen, hidden or
+            not, or is hidden entirely.
+    """
+    height = len(buffer)
+    width = len(buffer[0])
+
+    pixel_written = False
+
+    inner_radius = radius - planet.line_width / 2
+    outer_radius = radius + planet.line_width / 2
+
+    y_start, y_stop, x_start, x_stop = bounding_box(
+        center_x, center_y, outer_radius, width, height, terminal_x_scale
+    )
+    if depth is not None and y_start < y_stop and (
+        center_z + max(outer_radius, 0) <= min(
+            min(depth[yi][x_start:x_stop]) for yi in range(y_start, y_stop)
+        )
+    ):
+        # Nothing of the disc, nor its fallback glyph, could be nearer than
+        # what is already drawn anywhere in its bounding box.
+        return True
+
+    border = (planet.symbol, planet.color)
+    fill = (planet.fill, planet.color)
+    outer_squared = outer_radius ** 2
+
+    for yi in range(y_start, y_stop):
+        row = buffer[yi]
+        depth_row = None if depth is None else depth[yi]
+        dy = yi - center_y
+        for xi in range(x_start, x_stop):
+            dx = (xi - center_x) / terminal_x_scale
+            dist = math.sqrt(dx ** 2 + dy ** 2)
+
+            if inner_radius < dist < outer_radius:
+                cell = border
+                pixel_written = True
+            elif dist < inner_radius:
+                cell = fill
+            else:
+                continue
+
+            if depth_row is not None:
+                z = center_z + math.sqrt(outer_squared - dist ** 2)
+                if z <= depth_row[xi]:
+                    continue
+                depth_row[xi] = z
+            row[xi] = cell
+
+    return pixel_written
+
+
+def blit_sprite(
+    buffer,
+    planet,
+    sprite,
+    center_x,
+    center_y,
+    depth=None,
+    center_z=0.0
+):
+    """Stamps a pre-rasterized disc onto the buffer at the planet's
+    nearest cell.
+
+    Args:
+        buffer (list[list[str]]): Buffer to write to.
+        planet (Planet): The planet being drawn.
+        sprite (Sprite): The disc to stamp.
+        center_x (float): Center x-coordinate of the planet.
+        center_y (float): Center y-coordinate of the planet.
+        depth (list[memoryview], optional): Rows of a DepthBuffer to test
+            cells against. Defaults to None.
+        center_z (float, optional): Depth of the planet's center.
+            Defaults to 0.0.
+
+    Returns:
+        bool: Whether any border cell is on screen, hidden or not.
+    """
+    height = len(buffer)
+    width = len(buffer[0])
+    origin_y = math.ceil(center_y - 0.5)
+    origin_x = math.ceil(center_x - 0.5)
+
+    pixel_written = False
+    cell = (planet.symbol, planet.color)
+    for dy, dx, bulge in zip(
+        sprite.border_rows, sprite.border_cols, sprite.border_heights
+    ):
+        yi = origin_y + dy
+        xi = origin_x + dx
+        if 0 <= yi < height and 0 <= xi < width:
+            write_cell(buffer, depth, yi, xi, cell, center_z + bulge)
+            pixel_written = True
+
+    cell = (planet.fill, planet.color)
+    for dy, dx, bulge in zip(
+        sprite.fill_rows, sprite.fill_cols, sprite.fill_heights
+    ):
+        yi = origin_y + dy
+        xi = origin_x + dx
+        if 0 <= yi < height and 0 <= xi < width:
+            write_cell(buffer, depth, yi, xi, cell, center_z + bulge)
+
+    return pixel_written
+
+
+def bounding_box(
+    center_x,
+    center_y,
+    radius,
+    width,
+    height,
     terminal_x_scale
+):
+    """Returns the cell ranges covering a disc's screen-space ellipse.
+
+    Any cell closer than `radius` to the center (with x distances divided by
+    `terminal_x_scale`) lies inside the returned ranges, clipped to the
+    buffer. Ranges are empty when the disc is off-screen or has no area.
+
+    Args:
+        center_x (float): Center x-coordinate of the disc.
+        center_y (float): Center y-coordinate of the disc.
+        radius (float): Radius of the disc in rows.
+        width (int): Width of the buffer.
+        height (int): Height of the buffer.
+        terminal_x_scale (float): height/width ratio of text in terminal.
+
+    Returns:
+        tuple: (y_start, y_stop, x_start, x_stop) half-open cell ranges.
+    """
+    if radius <= 0:
+        return 0, 0, 0, 0
+    x_radius = radius * abs(terminal_x_scale)
+    y_start = max(0, math.floor(center_y - radius))
+    y_stop = min(height, math.ceil(center_y + radius) + 1)
+    x_start = max(0, math.floor(center_x - x_radius))
+    x_stop = min(width, math.ceil(center_x + x_radius) + 1)
+    if y_start >= y_stop or x_start >= x_stop:
+        return 0, 0, 0, 0
+    return y_start, y_stop, x_start, x_stop
+
+
+def nearest_cell(center_x, center_y, width, height):
+    """Returns the buffer cell closest to a point.
+
+    Rows and columns are independent under the stretched distance, so this
+    rounds each axis on its own. Exact halves round down, matching the first
+    closest cell of a row-major scan.
+
+    Args:
+        center_x (float): X-coordinate of the point.
+        center_y (float): Y-coordinate of the point.
+        width (int): Width of the buffer.
+        height (int): Height of the buffer.
+
+    Returns:
+        tuple: (y, x) of the closest cell.
+    """
+    yi = min(max(math.ceil(center_y - 0.5), 0), height - 1)
+    xi = min(max(math.ceil(center_x - 0.5), 0), width - 1)
+    return yi, xi
+
+
+def render_planet_ring(
+    buffer,
+    planet,
+    center_x,
+    center_y,
+    terminal_x_scale,
+    zoom=1.0,
+    depth=None,
+    center_z=0.0
 ):
     """Draws a Planet's ring to the buffer.
 
+    With a depth buffer, the ring is a circle seen almost edge on: its
+    lower half passes in front of the planet and its upper half behind.
+
     Args:
         buffer (list[list[str]]): Buffer to write to.
         planet (Planet): The planet whose ring is being drawn.
         center_x (int): Center x-coordinate of the buffer.
         center_y (int): Center y-coordinate of the buffer.
         terminal_x_scale (float): height/width ratio of text in terminal.
+        zoom (float, optional): Factor the ring's length is scaled by.
+            Defaults to 1.0.
+        depth (list[memoryview], optional): Rows of a DepthBuffer to test
+            ring segments against. Defaults to None.
+        center_z (float, optional): Depth of the planet's center.
+            Defaults to 0.0.
 
     Returns:
         None
@@ -142,30 +597,76 @@ def render_planet_ring(
     width = len(buffer[0])
 
     depth_of_field = planet.z / DEPTH_OF_FIELD_MODIFIER
-    ring_length = int((planet.radius + depth_of_field) * RING_SIZE_MODIFIER)
+    ring_radius = (planet.radius + depth_of_field) * zoom * RING_SIZE_MODIFIER
+    ring_length = int(ring_radius)
 
+    cell = (RING_CHAR, planet.color)
     for offset in range(-ring_length, ring_length + 1):
         y = int(center_y + offset)
         x = int(center_x + offset * terminal_x_scale)
         if 0 <= y < height and 0 <= x < width:
-            buffer[y][x] = (RING_CHAR, planet.color)
+            bulge = math.sqrt(max(ring_radius ** 2 - offset ** 2, 0))
+            write_cell(
+                buffer,
+                depth,
+                y,
+                x,
+                cell,
+                center_z + bulge if offset >= 0 else center_z - bulge
+            )
 
 
 def render_star(buffer, star):
-    """Draws a Star to the buffer for rendering.
+    """Draws a Star to the buffer for rendering, respawning it elsewhere
+    if it has faded out.
 
     Args:
         buffer (list[list[str]]): Buffer to write to.
         star (Star): The star being drawn.
 
+    Returns:
+        None
+    """
+    if star.idx == 0:
+        place_star(star, len(buffer[0]), len(buffer))
+    buffer[star.y][star.x] = (star.frames[star.idx], star.color)
+
+
+def relocate_stars(stars, width, height):
+    """Moves every star that has faded out or fallen outside the frame to a
+    random cell. Called whenever the frame is resized.
+
+    Args:
+        stars (list[Star] | StarField): Stars to place.
+        width (int): Width of the frame.
+        height (int): Height of the frame.
+
+    Returns:
+        None
+    """
+    if isinstance(stars, StarField):
+        stars.relocate(width, height)
+    else:
+        for star in stars:
+            place_star(star, width, height)
+
+
+def place_star(star, width, height):
+    """Moves a Star to a random cell when it has faded out or fallen
+    outside the buffer.
+
+    Args:
+        star (Star): The star being placed.
+        width (int): Width of the buffer.
+        height (int): Height of the buffer.
+
     Returns:
         None
     """
     if (
         star.idx == 0
-        or star.y > len(buffer) - 1
-        or star.x > len(buffer[0]) - 1
+        or star.y > height - 1
+        or star.x > width - 1
     ):
-        star.x = random.randint(0, len(buffer[0]) - 1)
-        star.y = random.randint(0, len(buffer) - 1)
-    buffer[star.y][star.x] = (star.frames[star.idx], star.color)
+        star.x = random.randint(0, width - 1)
+        star.y = random.randint(0, height - 1)
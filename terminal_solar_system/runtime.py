@@ -0,0 +1,155 @@
+import asyncio
+import contextlib
+import os
+import signal
+import sys
+
+try:
+    import termios
+    import tty
+except ImportError:
+    termios = None
+
+QUIT_KEY = 'q'
+
+
+class AsyncRuntime:
+    """Runs the render loop on an asyncio event loop.
+
+    Three coroutines share the loop: one reads keys from stdin as they
+    arrive, one reacts to SIGWINCH, and one draws a frame on every tick of
+    a loop-scheduled timer. Pressing QUIT_KEY ends all three at once.
+    """
+
+    def __init__(
+        self,
+        draw_frame,
+        scheduler,
+        bindings=None,
+        on_resize=None,
+        stdin=None
+    ):
+        """Initialises a new AsyncRuntime.
+
+        Args:
+            draw_frame (callable): Draws one frame.
+            scheduler (FrameScheduler): Paces the frames.
+            bindings (dict[str, callable], optional): Functions called when
+                a key is pressed. Defaults to None.
+            on_resize (callable, optional): Called after the terminal is
+                resized. Defaults to None.
+            stdin (TextIO, optional): Stream to read keys from.
+                Defaults to sys.stdin.
+        """
+        self.draw_frame = draw_frame
+        self.scheduler = scheduler
+        self.bindings = bindings or {}
+        self.on_resize = on_resize
+        self.stdin = sys.stdin if stdin is None else stdin
+        self._stop = None
+        self._error = None
+
+    def run(self):
+        """Runs until the quit key is pressed or `stop` is called.
+
+        Returns:
+            None
+        """
+        asyncio.run(self._main())
+
+    def stop(self):
+        """Ends the loop. Must be called from the loop's thread.
+
+        Returns:
+            None
+        """
+        self._stop.set()
+
+    async def _main(self):
+        """Starts the coroutines and cancels them once stopped."""
+        self._stop = asyncio.Event()
+        self._error = None
+        tasks = [
+            asyncio.create_task(self._guard(coroutine))
+            for coroutine in (
+                self._read_keys(), self._watch_resize(), self._tick()
+            )
+        ]
+        await self._stop.wait()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._error is not None:
+            raise self._error
+
+    async def _guard(self, coroutine):
+        """Runs a coroutine, stopping the loop if it raises."""
+        try:
+            await coroutine
+        except Exception as error:
+            self._error = error
+            self.stop()
+
+    async def _read_keys(self):
+        """Dispatches key presses as the event loop sees them arrive."""
+        loop = asyncio.get_running_loop()
+        keys = asyncio.Queue()
+        fd = self.stdin.fileno()
+
+        def on_readable():
+            data = os.read(fd, 64)
+            if not data:
+                loop.remove_reader(fd)
+            keys.put_nowait(data.decode(errors="ignore"))
+
+        with _cbreak(fd):
+            loop.add_reader(fd, on_readable)
+            try:
+                while True:
+                    for key in await keys.get():
+                        if key == QUIT_KEY:
+                            self.stop()
+                            return
+                        binding = self.bindings.get(key)
+                        if binding is not None:
+                            binding()
+            finally:
+                loop.remove_reader(fd)
+
+    async def _watch_resize(self):
+        """Calls `on_resize` each time the terminal is resized."""
+        if not hasattr(signal, "SIGWINCH"):
+            return
+        loop = asyncio.get_running_loop()
+        resized = asyncio.Event()
+        loop.add_signal_handler(signal.SIGWINCH, resized.set)
+        try:
+            while True:
+                await resized.wait()
+                resized.clear()
+                if self.on_resize is not None:
+                    self.on_resize()
+        finally:
+            loop.remove_signal_handler(signal.SIGWINCH)
+
+    async def _tick(self):
+        """Draws frames against the scheduler's deadlines."""
+        while True:
+            self.draw_frame()
+            await asyncio.sleep(self.scheduler.advance())
+
+
+@contextlib.contextmanager
+def _cbreak(fd):
+    """Puts a terminal into cbreak mode so keys arrive without waiting for
+    Enter, restoring its settings on exit. Does nothing for non-terminals.
+    """
+    if termios is None or not os.isatty(fd):
+        yield
+        return
+    settings = termios.tcgetattr(fd)
+    tty.setcbreak(fd)
+    try:
+        yield
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, settings)
@@ -0,0 +1,168 @@
+import json
+import math
+
+import numpy as np
+
+try:
+    import tomllib
+except ImportError:
+    tomllib = None
+
+from terminal_solar_system.config import SCENE_CHUNK_SIZE
+from terminal_solar_system.planets import BODY_DTYPE, Planet, Sun
+
+
+def load_scene(path, planets):
+    """Adds the bodies of a scene file to a planet container.
+
+    ".json" and ".toml" scenes hold an optional `sun` table and a `bodies`
+    array of tables, whose keys are the keyword arguments of Sun and Planet.
+    A body's `parent` is the index of an earlier body, counting the sun as
+    body 0 if there is one.
+    ".npy" scenes hold a structured array of BODY_DTYPE, which is memory
+    mapped and streamed into the container in chunks, so large belts are
+    never held in memory twice.
+
+    Args:
+        path (str): Scene file to read.
+        planets (list | PlanetSystem): Container to which Planet objects
+            will be appended.
+
+    Returns:
+        int: Number of bodies added.
+    """
+    if path.endswith(".npy"):
+        return _load_records(path, planets)
+    if path.endswith(".json"):
+        with open(path, encoding="utf-8") as file:
+            scene = json.load(file)
+    elif path.endswith(".toml"):
+        if tomllib is None:
+            raise ValueError("TOML scenes need Python 3.11 or newer")
+        with open(path, "rb") as file:
+            scene = tomllib.load(file)
+    else:
+        raise ValueError(f"unknown scene format: {path}")
+
+    loaded = []
+    if "sun" in scene:
+        loaded.append(Sun(**scene["sun"]))
+        planets.append(loaded[-1])
+    for body in scene.get("bodies", ()):
+        parent = body.pop("parent", None)
+        if parent is not None and parent >= 0:
+            if parent >= len(loaded):
+                raise ValueError("a planet's parent must come before it")
+            body["parent"] = loaded[parent]
+        loaded.append(Planet(**body))
+        planets.append(loaded[-1])
+    return len(loaded)
+
+
+def _load_records(path, planets):
+    """Streams a memory-mapped ".npy" scene into a planet container."""
+    records = np.load(path, mmap_mode="r")
+    if records.dtype.names != BODY_DTYPE.names:
+        raise ValueError(
+            f"{path} does not hold bodies: expected fields {BODY_DTYPE.names}"
+        )
+    if hasattr(planets, "extend_records"):
+        first = len(planets)
+        for start in range(0, len(records), SCENE_CHUNK_SIZE):
+            planets.extend_records(
+                records[start:start + SCENE_CHUNK_SIZE], first
+            )
+    else:
+        planets.extend(_planets_from_records(records))
+    return len(records)
+
+
+def _planets_from_records(records):
+    """Yields a Planet for each body of a structured array, reading it one
+    chunk at a time."""
+    loaded = []
+    for start in range(0, len(records), SCENE_CHUNK_SIZE):
+        chunk = records[start:start + SCENE_CHUNK_SIZE].tolist()
+        for (
+            radius, orbit_radius, period, angle, inclination, eccentricity,
+            periapsis, line_width, has_ring, symbol, fill, color, parent,
+        ) in chunk:
+            if parent >= len(loaded):
+                raise ValueError("a planet's parent must come before it")
+            loaded.append(Planet(
+                radius,
+                orbit_radius,
+                period,
+                angle=None if math.isnan(angle) else angle,
+                inclination=inclination,
+                symbol=symbol,
+                fill=fill,
+                line_width=line_width,
+                has_ring=has_ring,
+                color=color,
+                parent=loaded[parent] if parent >= 0 else None,
+                eccentricity=eccentricity,
+                periapsis=periapsis,
+            ))
+            yield loaded[-1]
+
+
+def save_scene(path, planets):
+    """Writes the bodies of a planet container to a scene file.
+
+    Args:
+        path (str): Scene file to write, ".npy" or ".json".
+        planets (Iterable[Planet]): The bodies to save.
+
+    Returns:
+        None
+    """
+    if path.endswith(".npy"):
+        np.save(path, scene_records(planets))
+    elif path.endswith(".json"):
+        bodies = []
+        for fields in _scene_fields(planets):
+            body = dict(zip(BODY_DTYPE.names, fields))
+            if body["parent"] < 0:
+                del body["parent"]
+            bodies.append(body)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(
+                {"bodies": bodies}, file, indent=2, ensure_ascii=False
+            )
+    else:
+        raise ValueError(f"unknown scene format: {path}")
+
+
+def scene_records(planets):
+    """Returns the bodies of a planet container as a structured array.
+
+    Args:
+        planets (Iterable[Planet]): The bodies.
+
+    Returns:
+        ndarray: One BODY_DTYPE record per body.
+    """
+    return np.array(list(_scene_fields(planets)), dtype=BODY_DTYPE)
+
+
+def _scene_fields(planets):
+    """Yields each Planet's BODY_DTYPE fields as a tuple."""
+    indices = {}
+    for index, planet in enumerate(planets):
+        indices[id(planet)] = index
+        yield (
+            planet.radius,
+            planet.orbit_radius,
+            planet.period,
+            planet.angle,
+            planet.inclination,
+            planet.eccentricity,
+            planet.periapsis,
+            planet.line_width,
+            planet.has_ring,
+            planet.symbol,
+            planet.fill,
+            planet.color,
+            -1 if planet.parent is None else indices[id(planet.parent)],
+        )
@@ -0,0 +1,142 @@
+import time
+
+
+class FrameScheduler:
+    """Paces a render loop against absolute frame deadlines.
+
+    Deadlines are spaced exactly one frame period apart on a monotonic
+    clock, so time spent updating and rendering is subtracted from the
+    sleep rather than added to it. When a frame overruns by more than a
+    whole period the missed deadlines are skipped instead of being raced
+    through back to back.
+    """
+
+    def __init__(self, framerate, clock=time.monotonic, sleep=time.sleep):
+        """Initialises a new FrameScheduler.
+
+        Args:
+            framerate (float): Target frames per second.
+            clock (callable, optional): Monotonic clock returning seconds.
+                Defaults to time.monotonic.
+            sleep (callable, optional): Function sleeping for a number of
+                seconds. Defaults to time.sleep.
+
+        Attributes:
+            period (float): Target seconds per frame.
+            frames (int): Frames completed since the scheduler started.
+            skipped (int): Deadlines dropped because a frame overran.
+            work_time (float): Seconds of work in the last frame.
+        """
+        self.framerate = framerate
+        self.period = 1 / framerate
+        self.frames = 0
+        self.skipped = 0
+        self.work_time = 0.0
+        self._clock = clock
+        self._sleep = sleep
+        self._start = clock()
+        self._frame_start = self._start
+        self._deadline = self._start + self.period
+
+    def wait(self):
+        """Sleeps until the next frame deadline. Should be called once per
+        frame, after the frame's work is done.
+
+        Returns:
+            None
+        """
+        delay = self.advance()
+        if delay > 0:
+            self._sleep(delay)
+
+    def advance(self):
+        """Ends the current frame and moves on to the next deadline, without
+        sleeping. For callers that wait by other means, such as an event
+        loop timer.
+
+        Returns:
+            float: Seconds to wait before starting the next frame, or 0 if
+                the frame overran.
+        """
+        now = self._clock()
+        self.work_time = now - self._frame_start
+        self.frames += 1
+        if now < self._deadline:
+            delay = self._deadline - now
+            self._deadline += self.period
+        else:
+            delay = 0.0
+            missed = int((now - self._deadline) // self.period)
+            self.skipped += missed
+            self._deadline += (missed + 1) * self.period
+        self._frame_start = now + delay
+        return delay
+
+    @property
+    def achieved_fps(self):
+        """float: Average frames per second since the scheduler started."""
+        elapsed = self._clock() - self._start
+        return self.frames / elapsed if elapsed > 0 else 0.0
+
+    def __str__(self):
+        """Returns a summary of achieved against target frame rate.
+
+        Returns:
+            str: Achieved and target fps and skipped frames.
+        """
+        return (
+            f"fps: {self.achieved_fps:.1f}/{self.framerate}, "
+            f"skipped: {self.skipped}"
+        )
+
+
+class SimulationClock:
+    """Clock driving the simulation, which can be paused and sped up or
+    slowed down without the simulated time jumping.
+    """
+
+    def __init__(self, clock=time.time):
+        """Initialises a new SimulationClock.
+
+        Args:
+            clock (callable, optional): Wall clock returning seconds.
+                Defaults to time.time.
+
+        Attributes:
+            paused (bool): Whether simulated time is frozen.
+        """
+        self._clock = clock
+        self._anchor = clock()
+        self._base = self._anchor
+        self._speed = 1.0
+        self.paused = False
+
+    def __call__(self):
+        """Returns the simulated time in seconds."""
+        if self.paused:
+            return self._base
+        return self._base + (self._clock() - self._anchor) * self._speed
+
+    def _rebase(self):
+        """Folds the time elapsed so far into the base."""
+        self._base = self()
+        self._anchor = self._clock()
+
+    @property
+    def speed(self):
+        """float: Simulated seconds per wall clock second."""
+        return self._speed
+
+    @speed.setter
+    def speed(self, value):
+        self._rebase()
+        self._speed = value
+
+    def toggle_pause(self):
+        """Pauses the clock if running and resumes it if paused.
+
+        Returns:
+            None
+        """
+        self._rebase()
+        self.paused = not self.paused
@@ -0,0 +1,155 @@
+import math
+from array import array
+from collections import OrderedDict
+
+from terminal_solar_system.config import (
+    SPRITE_CACHE_SIZE,
+    SPRITE_RADIUS_QUANTUM,
+)
+
+
+class Sprite:
+    """A pre-rasterized planet disc stored as a stamp mask.
+
+    Cells are offsets from the disc's center cell, kept in parallel
+    `array('i')` columns so NumPy can view them without copying, along
+    with the height of the planet's surface above each cell for depth
+    testing.
+    """
+
+    def __init__(self, radius, line_width, terminal_x_scale):
+        """Rasterizes a new Sprite centered on the origin.
+
+        Args:
+            radius (float): Effective radius of the disc.
+            line_width (float): Width of the disc's border.
+            terminal_x_scale (float): height/width ratio of text in terminal.
+
+        Attributes:
+            border_rows (array): Row offsets of border cells.
+            border_cols (array): Column offsets of border cells.
+            fill_rows (array): Row offsets of fill cells.
+            fill_cols (array): Column offsets of fill cells.
+            border_heights (array): Height of the surface of a sphere
+                with the disc's outer radius above each border cell.
+            fill_heights (array): Height of the surface above each fill
+                cell.
+            outer_radius (float): Outer radius of the disc, and so the
+                greatest height of its surface.
+            extent (tuple): (rows, columns) that cells may be offset by
+                from the center.
+        """
+        self.border_rows = array('i')
+        self.border_cols = array('i')
+        self.fill_rows = array('i')
+        self.fill_cols = array('i')
+        self.border_heights = array('d')
+        self.fill_heights = array('d')
+
+        inner_radius = radius - line_width / 2
+        outer_radius = radius + line_width / 2
+        self.outer_radius = max(outer_radius, 0)
+        self.extent = (0, 0)
+        if outer_radius <= 0 or terminal_x_scale == 0:
+            return
+
+        y_extent = math.ceil(outer_radius)
+        x_extent = math.ceil(outer_radius * abs(terminal_x_scale))
+        self.extent = (y_extent, x_extent)
+        for dy in range(-y_extent, y_extent + 1):
+            for dx in range(-x_extent, x_extent + 1):
+                dist = math.sqrt((dx / terminal_x_scale) ** 2 + dy ** 2)
+                if inner_radius < dist < outer_radius:
+                    self.border_rows.append(dy)
+                    self.border_cols.append(dx)
+                    self.border_heights.append(
+                        math.sqrt(outer_radius ** 2 - dist ** 2)
+                    )
+                elif dist < inner_radius:
+                    self.fill_rows.append(dy)
+                    self.fill_cols.append(dx)
+                    self.fill_heights.append(
+                        math.sqrt(outer_radius ** 2 - dist ** 2)
+                    )
+
+    def __len__(self):
+        """Returns the number of cells the sprite covers."""
+        return len(self.border_rows) + len(self.fill_rows)
+
+
+class SpriteCache:
+    """Bounded LRU cache of planet disc sprites.
+
+    Sprites are keyed by effective radius rounded to a multiple of
+    `quantum`, line width and terminal x scale. A coarser quantum gives
+    more hits at the cost of discs snapping between sizes.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = SPRITE_CACHE_SIZE,
+        quantum: float = SPRITE_RADIUS_QUANTUM,
+    ):
+        """Initialises a new SpriteCache.
+
+        Args:
+            maxsize (int, optional): Sprites kept before evicting the least
+                recently used. Defaults to SPRITE_CACHE_SIZE.
+            quantum (float, optional): Radius quantization step.
+                Defaults to SPRITE_RADIUS_QUANTUM.
+
+        Attributes:
+            hits (int): Lookups served from the cache.
+            misses (int): Lookups that rasterized a new sprite.
+        """
+        self.maxsize = maxsize
+        self.quantum = quantum
+        self.hits = 0
+        self.misses = 0
+        self._sprites = OrderedDict()
+
+    def get(self, radius, line_width, terminal_x_scale):
+        """Returns the sprite for a disc, rasterizing it on a miss.
+
+        Args:
+            radius (float): Effective radius of the disc.
+            line_width (float): Width of the disc's border.
+            terminal_x_scale (float): height/width ratio of text in terminal.
+
+        Returns:
+            Sprite: The cached sprite.
+        """
+        step = round(radius / self.quantum)
+        key = (step, line_width, terminal_x_scale)
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self.hits += 1
+            self._sprites.move_to_end(key)
+            return sprite
+        self.misses += 1
+        sprite = Sprite(step * self.quantum, line_width, terminal_x_scale)
+        self._sprites[key] = sprite
+        if len(self._sprites) > self.maxsize:
+            self._sprites.popitem(last=False)
+        return sprite
+
+    @property
+    def hit_rate(self):
+        """float: Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self):
+        """Returns the number of cached sprites."""
+        return len(self._sprites)
+
+    def __str__(self):
+        """Returns a summary of the cache counters.
+
+        Returns:
+            str: Hits, misses, hit rate and size.
+        """
+        return (
+            f"sprites: {len(self)}/{self.maxsize}, hits: {self.hits}, "
+            f"misses: {self.misses}, hit rate: {self.hit_rate:.1%}"
+        )
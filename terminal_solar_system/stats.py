@@ -0,0 +1,217 @@
+import csv
+import json
+import time
+from collections import deque
+
+from terminal_solar_system.config import STATS_COLOR, STATS_WINDOW
+
+
+class FrameStats:
+    """Times each stage of the main loop and reports rolling averages.
+
+    Stages are timed by reading a monotonic counter once per stage, so the
+    cost is a few clock reads per frame. Averages cover the last `window`
+    frames and can be drawn into the frame as a one line HUD, along with
+    counts such as the bodies culled from the frame. Per-frame timings and
+    counts can also be appended to a CSV or JSON-lines file.
+    """
+
+    enabled = True
+
+    def __init__(
+        self,
+        window: int = STATS_WINDOW,
+        show_hud: bool = True,
+        metrics_path: str = None,
+        clock=time.perf_counter,
+    ):
+        """Initialises a new FrameStats.
+
+        Args:
+            window (int, optional): Frames averaged in the HUD.
+                Defaults to STATS_WINDOW.
+            show_hud (bool, optional): Whether or not `overlay` draws the
+                HUD. Defaults to True.
+            metrics_path (str, optional): File to append per-frame metrics
+                to, as CSV if it ends in ".csv" and JSON lines otherwise.
+                Defaults to None.
+            clock (callable, optional): Monotonic clock returning seconds.
+                Defaults to time.perf_counter.
+
+        Attributes:
+            frames (int): Frames finished.
+            stages (dict[str, deque]): Recent seconds spent in each stage.
+            counts (dict[str, int]): Last value of each count.
+        """
+        self.window = window
+        self.show_hud = show_hud
+        self.metrics_path = metrics_path
+        self.frames = 0
+        self.stages = {}
+        self.counts = {}
+        self._clock = clock
+        self._frame_times = deque(maxlen=window)
+        self._periods = deque(maxlen=window)
+        self._current = {}
+        self._current_counts = {}
+        self._frame_start = None
+        self._mark = None
+        self._file = None
+        self._csv = None
+
+    def __enter__(self):
+        """Opens the metrics file, if any."""
+        if self.metrics_path is not None:
+            self._file = open(self.metrics_path, "a", newline="")
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Closes the metrics file, if any."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def start(self):
+        """Marks the start of a frame.
+
+        Returns:
+            None
+        """
+        now = self._clock()
+        if self._frame_start is not None:
+            self._periods.append(now - self._frame_start)
+        self._frame_start = now
+        self._mark = now
+        self._current = {}
+        self._current_counts = {}
+
+    def mark(self, stage):
+        """Attributes the time since the previous mark to a stage.
+
+        Args:
+            stage (str): Name of the stage that just finished.
+
+        Returns:
+            None
+        """
+        now = self._clock()
+        self._current[stage] = (
+            self._current.get(stage, 0.0) + now - self._mark
+        )
+        self._mark = now
+
+    def count(self, name, value):
+        """Records a count for the current frame.
+
+        Args:
+            name (str): Name of the count.
+            value (int): Its value this frame.
+
+        Returns:
+            None
+        """
+        self._current_counts[name] = value
+
+    def finish(self):
+        """Marks the end of a frame's work and records its metrics.
+
+        Returns:
+            None
+        """
+        frame_time = self._clock() - self._frame_start
+        self._frame_times.append(frame_time)
+        for stage, seconds in self._current.items():
+            if stage not in self.stages:
+                self.stages[stage] = deque(maxlen=self.window)
+            self.stages[stage].append(seconds)
+        self.counts.update(self._current_counts)
+        if self._file is not None:
+            self._write_metrics(frame_time)
+        self.frames += 1
+
+    def _write_metrics(self, frame_time):
+        """Appends the current frame's timings to the metrics file."""
+        row = {"frame": self.frames, "frame_ms": frame_time * 1000}
+        for stage, seconds in self._current.items():
+            row[f"{stage}_ms"] = seconds * 1000
+        row.update(self._current_counts)
+        if not self.metrics_path.endswith(".csv"):
+            self._file.write(json.dumps(row) + "\n")
+            return
+        if self._csv is None:
+            self._csv = csv.DictWriter(
+                self._file, fieldnames=list(row), extrasaction="ignore"
+            )
+            if self._file.tell() == 0:
+                self._csv.writeheader()
+        self._csv.writerow(row)
+
+    @property
+    def fps(self):
+        """float: Frames per second over the window."""
+        elapsed = sum(self._periods)
+        return len(self._periods) / elapsed if elapsed > 0 else 0.0
+
+    def hud(self):
+        """Returns the HUD line.
+
+        Returns:
+            str: fps, average frame time, average time per stage and the
+                last value of each count.
+        """
+        parts = [f"fps {self.fps:.1f}"]
+        if self._frame_times:
+            average = sum(self._frame_times) / len(self._frame_times)
+            parts.append(f"frame {average * 1000:.1f}ms")
+        for stage, times in self.stages.items():
+            parts.append(f"{stage} {sum(times) / len(times) * 1000:.1f}")
+        for name, value in self.counts.items():
+            parts.append(f"{name} {value}")
+        return " | ".join(parts)
+
+    def overlay(self, buffer):
+        """Returns a buffer with the HUD drawn over its top row.
+
+        The buffer itself is left untouched, since earlier frames may
+        still be referenced by diffing writers.
+
+        Args:
+            buffer (list[list[tuple]]): Rows of (symbol, color) cells.
+
+        Returns:
+            list[list[tuple]]: The buffer with the HUD.
+        """
+        if not self.show_hud or not buffer:
+            return buffer
+        row = list(buffer[0])
+        for x, symbol in enumerate(self.hud()[:len(row)]):
+            row[x] = (symbol, STATS_COLOR)
+        return [row] + buffer[1:]
+
+
+class NullStats:
+    """Stands in for FrameStats when profiling is off, so the main loop
+    pays only for a few empty method calls."""
+
+    enabled = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def start(self):
+        pass
+
+    def mark(self, stage):
+        pass
+
+    def count(self, name, value):
+        pass
+
+    def finish(self):
+        pass
+
+    def overlay(self, buffer):
+        return buffer
@@ -1,6 +1,12 @@
 import math
+
 import readchar
 
+from terminal_solar_system.config import (
+    KEPLER_MAX_ITERATIONS,
+    KEPLER_TOLERANCE,
+)
+
 
 def polar_to_cartesian(radius: float, theta: float, phi: float):
     """Converts polar coordinates to cartesian coordinates with inclination.
@@ -19,6 +25,134 @@ def polar_to_cartesian(radius: float, theta: float, phi: float):
     return x, y, z
 
 
+def polar_to_cartesian_arrays(radius, theta, phi):
+    """Converts arrays of polar coordinates to cartesian coordinates with
+    inclination, element-wise.
+
+    Args:
+        radius (ndarray): Radii on polar plane.
+        theta (ndarray): Angles of revolution in radians.
+        phi (ndarray): Angles of inclination in radians.
+
+    Returns:
+        tuple: (x, y, z) arrays of cartesian coordinates.
+    """
+    import numpy as np
+
+    sin_theta = np.sin(theta)
+    x = radius * np.cos(theta)
+    y = radius * sin_theta * np.sin(phi)
+    z = radius * sin_theta * np.cos(phi)
+    return x, y, z
+
+
+def solve_kepler(mean_anomaly, eccentricity, guess=None):
+    """Solves Kepler's equation, M = E - e sin(E), for the eccentric anomaly
+    E of many orbits at once by Newton's method.
+
+    Each step only revisits the orbits that are not yet within
+    KEPLER_TOLERANCE. Starting from last frame's eccentric anomalies, most
+    orbits get there in one or two steps. Orbits still unsolved after
+    KEPLER_MAX_ITERATIONS steps are solved again from a cold start, which
+    always converges for eccentricities below 1.
+
+    Args:
+        mean_anomaly (ndarray): Mean anomalies in radians.
+        eccentricity (ndarray): Eccentricities, from 0 up to but excluding 1.
+        guess (ndarray, optional): Starting eccentric anomalies.
+            Defaults to a cold start.
+
+    Returns:
+        tuple: (eccentric anomalies in [0, 2π), total Newton steps taken
+            over all orbits).
+    """
+    import numpy as np
+
+    mean = np.asarray(mean_anomaly, dtype=float)
+    eccentricity = np.asarray(eccentricity, dtype=float)
+    if guess is None:
+        guess = _cold_start(mean, eccentricity)
+    anomaly = np.array(guess, dtype=float)
+    steps, unsolved = _newton(mean, eccentricity, anomaly)
+    if unsolved.size:
+        anomaly[unsolved] = _cold_start(
+            mean[unsolved], eccentricity[unsolved]
+        )
+        steps += _newton(mean, eccentricity, anomaly, unsolved)[0]
+    return anomaly % (2 * math.pi), steps
+
+
+def _cold_start(mean, eccentricity):
+    """Returns starting eccentric anomalies that Newton's method converges
+    from for any eccentricity below 1."""
+    import numpy as np
+
+    return np.where(eccentricity < 0.8, mean, math.pi)
+
+
+def _newton(mean, eccentricity, anomaly, active=None):
+    """Refines `anomaly` in place by Newton steps on Kepler's equation.
+
+    Returns:
+        tuple: (total steps taken, indices of orbits still unsolved).
+    """
+    import numpy as np
+
+    if active is None:
+        active = np.arange(anomaly.size)
+    steps = 0
+    for iteration in range(KEPLER_MAX_ITERATIONS + 1):
+        current = anomaly[active]
+        e = eccentricity[active]
+        residual = current - e * np.sin(current) - mean[active]
+        # Wrapping the residual lets anomalies cross 2π between frames.
+        residual -= 2 * math.pi * np.rint(residual / (2 * math.pi))
+        unsolved = np.abs(residual) > KEPLER_TOLERANCE
+        active = active[unsolved]
+        if active.size == 0 or iteration == KEPLER_MAX_ITERATIONS:
+            break
+        current = current[unsolved]
+        anomaly[active] = current - residual[unsolved] / (
+            1 - e[unsolved] * np.cos(current)
+        )
+        steps += active.size
+    return steps, active
+
+
+def kepler_to_cartesian_arrays(
+    semi_major_axis, eccentric_anomaly, eccentricity, periapsis, phi
+):
+    """Converts elliptical orbits to cartesian coordinates with
+    inclination, element-wise. The orbital plane is mapped like the polar
+    plane of `polar_to_cartesian_arrays`.
+
+    Args:
+        semi_major_axis (ndarray): Semi-major axes.
+        eccentric_anomaly (ndarray): Eccentric anomalies in radians.
+        eccentricity (ndarray): Eccentricities.
+        periapsis (ndarray): Arguments of periapsis in radians.
+        phi (ndarray): Angles of inclination in radians.
+
+    Returns:
+        tuple: (x, y, z) arrays of cartesian coordinates.
+    """
+    import numpy as np
+
+    along = semi_major_axis * (np.cos(eccentric_anomaly) - eccentricity)
+    across = (
+        semi_major_axis
+        * np.sqrt(1 - eccentricity ** 2)
+        * np.sin(eccentric_anomaly)
+    )
+    cos_periapsis = np.cos(periapsis)
+    sin_periapsis = np.sin(periapsis)
+    x = along * cos_periapsis - across * sin_periapsis
+    plane_y = along * sin_periapsis + across * cos_periapsis
+    y = plane_y * np.sin(phi)
+    z = plane_y * np.cos(phi)
+    return x, y, z
+
+
 def listen_for_quit(stop_event):
     """Listens for 'q' key input and sets flag to true if detected.
 
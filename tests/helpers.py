@@ -0,0 +1,13 @@
+class FakeClock:
+    """Clock that only moves when a test moves it or sleeps on it."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
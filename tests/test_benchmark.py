@@ -0,0 +1,77 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from terminal_solar_system.benchmark import (
+    benchmark,
+    gravity_benchmark,
+    kepler_benchmark,
+    percentile,
+)
+
+
+class TestPercentile(unittest.TestCase):
+    def test_nearest_rank(self):
+        samples = list(range(1, 101))
+        self.assertEqual(percentile(samples, 50), 50)
+        self.assertEqual(percentile(samples, 99), 99)
+        self.assertEqual(percentile(samples, 100), 100)
+        self.assertEqual(percentile([], 50), 0.0)
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_writes_json_results(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "results.json")
+            with contextlib.redirect_stdout(io.StringIO()) as stdout:
+                benchmark(
+                    5, 60, 20, 10, planet_count=4, seed=1, json_path=path
+                )
+            with open(path) as file:
+                results = json.load(file)
+        self.assertIn("p95", stdout.getvalue())
+        self.assertEqual(results["config"]["planets"], 5)
+        self.assertEqual(
+            set(results["stages_ms"]),
+            {"update", "rasterize", "serialize", "total"},
+        )
+        self.assertEqual(
+            set(results["stages_ms"]["total"]), {"p50", "p95", "p99", "max"}
+        )
+
+    def test_closes_renderer_when_a_frame_fails(self):
+        renderer = mock.Mock()
+        renderer.rasterize.side_effect = RuntimeError("frame failed")
+        with mock.patch(
+            "terminal_solar_system.benchmark.get_renderer",
+            return_value=renderer,
+        ):
+            with self.assertRaises(RuntimeError):
+                benchmark(5, 60, 20, 10, backend="parallel", seed=1)
+        renderer.close.assert_called_once_with()
+
+    def test_kepler_benchmark(self):
+        with contextlib.redirect_stdout(io.StringIO()) as stdout:
+            results = kepler_benchmark(200, 10, seed=1)
+        self.assertIn("Newton steps per body", stdout.getvalue())
+        self.assertEqual(
+            set(results["stages_ms"]), {"update", "warm", "cold"}
+        )
+        self.assertLess(
+            results["steps_per_body"]["warm"],
+            results["steps_per_body"]["cold"],
+        )
+
+    def test_gravity_benchmark(self):
+        with contextlib.redirect_stdout(io.StringIO()) as stdout:
+            results = gravity_benchmark(200, 5, seed=1)
+        self.assertIn("force error vs direct", stdout.getvalue())
+        self.assertEqual(
+            set(results["stages_ms"]), {"tree", "direct", "update"}
+        )
+        self.assertLess(results["force_error"]["p50"], 0.01)
+        self.assertLess(abs(results["energy_drift"]), 0.01)
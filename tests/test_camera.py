@@ -0,0 +1,143 @@
+import random
+import unittest
+
+from terminal_solar_system.camera import Camera
+from terminal_solar_system.config import MAX_ZOOM, MIN_ZOOM, PAN_STEP
+from terminal_solar_system.lod import LevelOfDetail
+from terminal_solar_system.main import add_random_solar_system
+from terminal_solar_system.numpy_renderer import NumpyRenderer
+from terminal_solar_system.planets import Planet, PlanetSystem
+from terminal_solar_system.renderer import rasterize_frame
+from terminal_solar_system.sprites import SpriteCache
+
+
+def scattered_system(seed, width, height):
+    random.seed(seed)
+    planets = []
+    add_random_solar_system(planets, 40, 40)
+    for planet in planets:
+        planet.x = random.uniform(-2 * width, 2 * width)
+        planet.y = random.uniform(-2 * height, 2 * height)
+        planet.z = random.uniform(-120, 120)
+        planet.has_ring = random.random() < 0.3
+    return planets
+
+
+class TestCamera(unittest.TestCase):
+    def test_zoom_is_clamped(self):
+        camera = Camera()
+        camera.zoom_by(1e6)
+        self.assertEqual(camera.zoom, MAX_ZOOM)
+        camera.zoom_by(1e-12)
+        self.assertEqual(camera.zoom, MIN_ZOOM)
+
+    def test_pan_moves_the_same_distance_on_screen(self):
+        camera = Camera(zoom=4.0)
+        camera.pan(1, -2)
+        self.assertEqual(camera.pan_x, PAN_STEP / 4)
+        self.assertEqual(camera.pan_y, -PAN_STEP / 2)
+        camera.reset()
+        self.assertEqual((camera.zoom, camera.pan_x, camera.pan_y), (1, 0, 0))
+
+    def test_culling_does_not_change_the_frame(self):
+        for width, height, scale in [(80, 24, 2.2), (37, 15, 0.6)]:
+            planets = scattered_system(4, width, height)
+            for sprite_cache, lod in [
+                (None, None),
+                (SpriteCache(quantum=1.0), None),
+                (None, LevelOfDetail(sprite_cache=SpriteCache(quantum=2))),
+            ]:
+                camera = Camera()
+                expected = rasterize_frame(
+                    planets, [], width, height, scale, sprite_cache, lod
+                )
+                actual = rasterize_frame(
+                    planets, [], width, height, scale, sprite_cache, lod,
+                    camera=camera
+                )
+                self.assertEqual(actual, expected)
+                self.assertGreater(camera.culled, 0)
+
+    def test_zoom_scales_positions_and_radii(self):
+        camera = Camera(zoom=2.0, pan_x=5.0, pan_y=-1.0)
+        zoomed = [
+            Planet(3, 0, 0, symbol='#', has_ring=True, x=15, y=1, z=0),
+            Planet(1, 0, 0, symbol='o', x=-2, y=0, z=0),
+        ]
+        unzoomed = [
+            Planet(6, 0, 0, symbol='#', has_ring=True, x=20, y=4, z=0),
+            Planet(2, 0, 0, symbol='o', x=-14, y=2, z=0),
+        ]
+        self.assertEqual(
+            rasterize_frame(zoomed, [], 80, 30, 2.2, camera=camera),
+            rasterize_frame(unzoomed, [], 80, 30, 2.2),
+        )
+
+    def test_planet_system_matches_list(self):
+        planets = scattered_system(5, 60, 20)
+        system = PlanetSystem()
+        system.extend(scattered_system(5, 60, 20))
+        for planet, copy in zip(planets, system):
+            copy.x, copy.y, copy.z = planet.x, planet.y, planet.z
+        camera = Camera(zoom=1.5, pan_x=10)
+        expected = Camera(zoom=1.5, pan_x=10).place(planets, 60, 20, 2.2)
+        actual = camera.place(system, 60, 20, 2.2)
+        self.assertEqual(
+            [(planets.index(planet), x, y) for planet, x, y in expected],
+            [(planet._index, x, y) for planet, x, y in actual],
+        )
+        # Bodies added later are culled by their own size.
+        system.append(Planet(40, 0, 0, x=100, y=0, z=0))
+        placed = camera.place(system, 60, 20, 2.2)
+        self.assertIs(placed[-1][0], system[len(system) - 1])
+
+    def test_follows_bodies_whose_shape_changes(self):
+        camera = Camera()
+        # Only a radius of 5, or a radius of 4 with a ring, reaches into
+        # the frame from here.
+        system = PlanetSystem([Planet(4, 0, 0, x=31.2, y=0, z=0)])
+        self.assertEqual(camera.place(system, 40, 20, 2.2), [])
+        system[0].radius = 5
+        self.assertEqual(len(camera.place(system, 40, 20, 2.2)), 1)
+        system[0].radius = 4
+        system[0].has_ring = True
+        self.assertEqual(len(camera.place(system, 40, 20, 2.2)), 1)
+        system[0].has_ring = False
+        self.assertEqual(camera.place(system, 40, 20, 2.2), [])
+
+    def test_culls_rings_that_are_not_drawn(self):
+        camera = Camera()
+        system = PlanetSystem([Planet(4, 0, 0, has_ring=True, x=31.2)])
+        self.assertEqual(len(camera.place(system, 40, 20, 2.2)), 1)
+        placed = camera.place(
+            system, 40, 20, 2.2, lod=LevelOfDetail(rings=False)
+        )
+        self.assertEqual(placed, [])
+
+    def test_counts_culled_bodies(self):
+        camera = Camera()
+        planets = [
+            Planet(1, 0, 0, x=0, y=0, z=0),
+            Planet(1, 0, 0, x=500, y=0, z=0),
+            Planet(1, 0, 0, x=0, y=-90, z=0),
+        ]
+        placed = camera.place(planets, 40, 20, 2.2)
+        self.assertEqual([planet for planet, _, _ in placed], planets[:1])
+        self.assertEqual(camera.culled, 2)
+        camera.place(planets[:1], 40, 20, 2.2)
+        self.assertEqual(camera.culled, 0)
+        self.assertIn("1.0 bodies culled per frame", str(camera))
+
+    def test_numpy_renderer_matches_python(self):
+        planets = scattered_system(6, 70, 25)
+        camera = Camera(zoom=2.5, pan_x=-12, pan_y=4)
+        renderer = NumpyRenderer()
+        expected = rasterize_frame(planets, [], 70, 25, 2.2, camera=camera)
+        actual = renderer.rasterize_frame(
+            planets, [], 70, 25, 2.2, camera=camera
+        )
+        self.assertEqual(actual, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+import os
+import random
+import signal
+import unittest
+
+import numpy as np
+
+from terminal_solar_system.framebuffer import (
+    BLANK_CELL,
+    DepthBuffer,
+    FrameBuffer,
+    FramePool,
+    TerminalSize,
+)
+from terminal_solar_system.main import add_solar_system
+from terminal_solar_system.planets import Star
+from terminal_solar_system.renderer import rasterize_frame
+
+
+class FakeConsole:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.queries = 0
+
+    @property
+    def size(self):
+        self.queries += 1
+        return (self.width, self.height)
+
+
+class TestFrameBuffer(unittest.TestCase):
+    def test_grids_alternate_and_are_reused(self):
+        frame_buffer = FrameBuffer()
+        first = frame_buffer.acquire(6, 3)
+        self.assertTrue(frame_buffer.resized)
+        first[1][2] = ('*', 'red')
+        second = frame_buffer.acquire(6, 3)
+        self.assertFalse(frame_buffer.resized)
+        self.assertIsNot(second, first)
+        self.assertEqual(first[1][2], ('*', 'red'))
+        rows = list(first)
+        third = frame_buffer.acquire(6, 3)
+        self.assertIs(third, first)
+        self.assertTrue(all(a is b for a, b in zip(third, rows)))
+        self.assertEqual(third[1][2], BLANK_CELL)
+        self.assertEqual(frame_buffer.reallocations, 1)
+
+    def test_resize_reallocates(self):
+        frame_buffer = FrameBuffer()
+        frame_buffer.acquire(6, 3)
+        grid = frame_buffer.acquire(4, 5)
+        self.assertTrue(frame_buffer.resized)
+        self.assertEqual((len(grid), len(grid[0])), (5, 4))
+        self.assertEqual(frame_buffer.reallocations, 2)
+
+    def test_rasterize_into_frame_buffer_matches(self):
+        random.seed(2)
+        console = FakeConsole(90, 30)
+        planets = []
+        add_solar_system(planets)
+        stars = [Star(console) for _ in range(40)]
+        for star in stars:
+            star.idx = 2
+        frame_buffer = FrameBuffer()
+        for _ in range(3):
+            expected = rasterize_frame(planets, stars, 90, 30, 2.2)
+            actual = rasterize_frame(
+                planets, stars, 90, 30, 2.2, frame_buffer=frame_buffer
+            )
+            self.assertEqual(actual, expected)
+
+    def test_stars_relocated_on_resize(self):
+        random.seed(4)
+        stars = [Star(FakeConsole(80, 24)) for _ in range(100)]
+        for star in stars:
+            star.idx = 3
+        frame_buffer = FrameBuffer()
+        rasterize_frame([], stars, 80, 24, 2.2, frame_buffer=frame_buffer)
+        rasterize_frame([], stars, 20, 6, 2.2, frame_buffer=frame_buffer)
+        self.assertTrue(all(star.x < 20 and star.y < 6 for star in stars))
+
+
+class TestFramePool(unittest.TestCase):
+    def test_grids_in_use_are_not_handed_out(self):
+        pool = FramePool()
+        first = pool.acquire(6, 3)
+        self.assertTrue(pool.resized)
+        first[1][2] = ('*', 'red')
+        second = pool.acquire(6, 3)
+        third = pool.acquire(6, 3)
+        self.assertFalse(pool.resized)
+        self.assertEqual(len({id(first), id(second), id(third)}), 3)
+        self.assertEqual(first[1][2], ('*', 'red'))
+        pool.release(first)
+        self.assertIs(pool.acquire(6, 3), first)
+        self.assertEqual(first[1][2], BLANK_CELL)
+        self.assertEqual(pool.allocations, 3)
+
+    def test_resize_drops_released_grids(self):
+        pool = FramePool()
+        grid = pool.acquire(6, 3)
+        pool.release(grid)
+        resized = pool.acquire(4, 5)
+        self.assertTrue(pool.resized)
+        self.assertIsNot(resized, grid)
+        self.assertEqual((len(resized), len(resized[0])), (5, 4))
+        pool.release(grid)
+        self.assertIsNot(pool.acquire(4, 5), grid)
+
+    def test_rasterize_into_frame_pool_matches(self):
+        random.seed(3)
+        planets = []
+        add_solar_system(planets)
+        pool = FramePool()
+        expected = rasterize_frame(planets, [], 90, 30, 2.2)
+        grid = rasterize_frame(planets, [], 90, 30, 2.2, frame_buffer=pool)
+        self.assertEqual(grid, expected)
+        pool.release(grid)
+        self.assertIs(
+            rasterize_frame(planets, [], 90, 30, 2.2, frame_buffer=pool),
+            grid
+        )
+        self.assertEqual(grid, expected)
+
+
+class TestDepthBuffer(unittest.TestCase):
+    def test_cleared_and_reused(self):
+        depth_buffer = DepthBuffer()
+        depth = depth_buffer.acquire(6, 3)
+        self.assertEqual(depth.shape, (3, 6))
+        depth_buffer.rows[1][2] = 4.5
+        self.assertEqual(depth[1, 2], 4.5)
+        self.assertIs(depth_buffer.acquire(6, 3), depth)
+        self.assertTrue(np.isneginf(depth).all())
+        self.assertEqual(depth_buffer.acquire(4, 5).shape, (5, 4))
+        self.assertEqual(len(depth_buffer.rows), 5)
+
+
+class TestTerminalSize(unittest.TestCase):
+    def test_queries_every_read_outside_with(self):
+        console = FakeConsole(80, 24)
+        screen = TerminalSize(console)
+        self.assertEqual((screen.width, screen.height), (80, 24))
+        self.assertEqual(console.queries, 2)
+
+    @unittest.skipUnless(hasattr(signal, "SIGWINCH"), "needs SIGWINCH")
+    def test_queries_only_after_sigwinch(self):
+        console = FakeConsole(80, 24)
+        with TerminalSize(console) as screen:
+            for _ in range(5):
+                self.assertEqual(screen.width, 80)
+            self.assertEqual(console.queries, 1)
+            console.width = 100
+            self.assertEqual(screen.width, 80)
+            os.kill(os.getpid(), signal.SIGWINCH)
+            self.assertEqual(screen.width, 100)
+            self.assertEqual(console.queries, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from terminal_solar_system.config import (
+    GOVERNOR_POINT_RADIUS,
+    GOVERNOR_STAR_FRACTION,
+)
+from terminal_solar_system.governor import QUALITY_LEVELS, QualityGovernor
+from terminal_solar_system.lod import LevelOfDetail
+from terminal_solar_system.planets import StarField
+from terminal_solar_system.stats import FrameStats
+
+
+class DummyConsole:
+    width = 80
+    height = 24
+
+
+class TestQualityGovernor(unittest.TestCase):
+    def setUp(self):
+        self.governor = QualityGovernor(10, window=4)
+
+    def feed(self, frame_time, count):
+        for _ in range(count):
+            self.governor.record(frame_time)
+
+    def test_steps_down_over_budget(self):
+        self.feed(0.095, 3)
+        self.assertEqual(self.governor.level, 0)
+        self.feed(0.095, 1)
+        self.assertEqual(self.governor.level, 1)
+        self.feed(0.2, 100)
+        self.assertEqual(self.governor.level, len(QUALITY_LEVELS) - 1)
+        self.assertEqual(self.governor.history[0], (4, 1))
+
+    def test_steps_up_with_headroom(self):
+        governor = QualityGovernor(10, level=3, window=4)
+        for _ in range(4):
+            governor.record(0.01)
+        self.assertEqual(governor.level, 2)
+        for _ in range(100):
+            governor.record(0.01)
+        self.assertEqual(governor.level, 0)
+
+    def test_hysteresis(self):
+        self.feed(0.095, 4)
+        self.assertEqual(self.governor.level, 1)
+        self.feed(0.07, 40)
+        self.assertEqual(self.governor.level, 1)
+        self.assertEqual(len(self.governor.history), 1)
+
+    def test_window_restarts_after_change(self):
+        self.feed(0.2, 4)
+        self.feed(0.01, 3)
+        self.assertEqual(self.governor.level, 1)
+
+    def test_changes_show_in_stats(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "metrics.jsonl")
+            with FrameStats(metrics_path=path) as stats:
+                # As in the main loop, each frame is recorded before its
+                # stats are finished.
+                for _ in range(8):
+                    stats.start()
+                    self.governor.record(0.2)
+                    stats.count("quality", self.governor.level)
+                    stats.finish()
+                self.assertIn("quality 2", stats.hud())
+            with open(path) as file:
+                levels = [json.loads(line)["quality"] for line in file]
+        self.assertEqual(levels, [0, 0, 0, 1, 1, 1, 1, 2])
+
+    def test_fixed_level(self):
+        governor = QualityGovernor(10, level=2, adaptive=False, window=4)
+        for _ in range(20):
+            governor.record(1.0)
+        self.assertEqual(governor.level, 2)
+        self.assertEqual(governor.history, [])
+
+    def test_invalid_level(self):
+        with self.assertRaises(ValueError):
+            QualityGovernor(10, level=len(QUALITY_LEVELS))
+
+    def test_stars(self):
+        stars = StarField(DummyConsole(), 100, np.random.default_rng(1))
+        self.assertIs(self.governor.stars(stars), stars)
+        self.governor.level = 1
+        self.assertEqual(
+            len(self.governor.stars(stars)), int(100 * GOVERNOR_STAR_FRACTION)
+        )
+
+    def test_lod_levels(self):
+        lod = LevelOfDetail()
+        self.governor.level = 1
+        self.assertIs(self.governor.lod(lod), lod)
+        self.assertIsNone(self.governor.lod())
+        self.governor.level = 2
+        coarse = self.governor.lod(lod)
+        self.assertTrue(coarse.rings)
+        self.assertEqual(coarse.point_radius, 0)
+        self.governor.level = 3
+        self.assertFalse(self.governor.lod(lod).rings)
+        self.governor.level = 4
+        self.assertEqual(
+            self.governor.lod(lod).point_radius, GOVERNOR_POINT_RADIUS
+        )
+        self.governor.level = 2
+        self.assertTrue(self.governor.lod(lod).rings)
+
+    def test_str(self):
+        self.feed(0.2, 4)
+        self.assertEqual(
+            str(self.governor), "quality: 1 (fewer stars), changes: 1"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
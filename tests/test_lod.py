@@ -0,0 +1,62 @@
+import unittest
+
+from terminal_solar_system.framebuffer import blank_grid
+from terminal_solar_system.lod import FULL, POINT, STAMP, LevelOfDetail
+from terminal_solar_system.planets import Planet
+from terminal_solar_system.renderer import render_planet
+
+
+class TestLevelOfDetail(unittest.TestCase):
+    def test_tiers(self):
+        lod = LevelOfDetail(point_radius=1, stamp_radius=5)
+        self.assertEqual(lod.tier(0.2, 1), POINT)
+        self.assertEqual(lod.tier(0.6, 1), STAMP)
+        self.assertEqual(lod.tier(4.9, 1), STAMP)
+        self.assertEqual(lod.tier(5, 1), FULL)
+        self.assertEqual(lod.counts, {POINT: 1, STAMP: 2, FULL: 1})
+
+    def test_point_is_single_glyph_at_center_cell(self):
+        lod = LevelOfDetail()
+        planet = Planet(1, 0, 0, symbol='o', color='red', z=-40, has_ring=True)
+        buffer = blank_grid(40, 10)
+        render_planet(buffer, planet, 12.4, 0.6, 2.2, lod=lod)
+        drawn = [
+            (y, x) for y, row in enumerate(buffer)
+            for x, cell in enumerate(row) if cell[1]
+        ]
+        self.assertEqual(drawn, [(1, 12)])
+        self.assertEqual(buffer[1][12], ('o', 'red'))
+
+    def test_point_off_screen_is_skipped(self):
+        planet = Planet(1, 0, 0, z=-40)
+        buffer = blank_grid(40, 10)
+        render_planet(buffer, planet, -3, 5, 2.2, lod=LevelOfDetail())
+        self.assertEqual(buffer, blank_grid(40, 10))
+
+    def test_stamp_uses_sprite_cache(self):
+        lod = LevelOfDetail()
+        planet = Planet(3, 0, 0)
+        render_planet(blank_grid(40, 10), planet, 20, 5, 2.2, lod=lod)
+        render_planet(blank_grid(40, 10), planet, 21, 5, 2.2, lod=lod)
+        self.assertEqual(lod.sprite_cache.hits, 1)
+
+    def test_rings_can_be_dropped(self):
+        planet = Planet(4, 0, 0, has_ring=True)
+        ringed = blank_grid(60, 20)
+        bare = blank_grid(60, 20)
+        render_planet(ringed, planet, 30, 10, 2.2, lod=LevelOfDetail())
+        render_planet(
+            bare, planet, 30, 10, 2.2, lod=LevelOfDetail(rings=False)
+        )
+        ringless = blank_grid(60, 20)
+        render_planet(ringless, Planet(4, 0, 0), 30, 10, 2.2)
+        self.assertNotEqual(ringed, bare)
+        self.assertEqual(bare, ringless)
+
+    def test_full_matches_exact_rasterizer(self):
+        planet = Planet(10, 0, 0, symbol='#', fill='.', line_width=3)
+        expected = blank_grid(80, 30)
+        actual = blank_grid(80, 30)
+        render_planet(expected, planet, 40.3, 15.2, 2.2)
+        render_planet(actual, planet, 40.3, 15.2, 2.2, lod=LevelOfDetail())
+        self.assertEqual(actual, expected)
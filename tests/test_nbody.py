@@ -0,0 +1,195 @@
+import math
+import random
+import unittest
+
+import numpy as np
+
+from terminal_solar_system.main import add_particle_cloud, add_solar_system
+from terminal_solar_system.nbody import (
+    GravitySystem,
+    barnes_hut_accelerations,
+    direct_accelerations,
+)
+from terminal_solar_system.planets import Planet, PlanetSystem, Sun
+
+
+def cloud(count, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(0, 50, (count, 3)), rng.uniform(0.05, 1, count)
+
+
+def relative_error(approximate, exact):
+    return (
+        np.linalg.norm(approximate - exact, axis=1)
+        / np.linalg.norm(exact, axis=1)
+    )
+
+
+class TestDirectAccelerations(unittest.TestCase):
+    def test_two_bodies(self):
+        position = np.array([[0.0, 0.0, 0.0], [3.0, 4.0, 0.0]])
+        mass = np.array([2.0, 1.0])
+        acceleration = direct_accelerations(
+            position, mass, gravity=1.0, softening=0.0
+        )
+        np.testing.assert_allclose(acceleration[0], [3 / 125, 4 / 125, 0])
+        # Equal and opposite forces.
+        np.testing.assert_allclose(
+            mass[0] * acceleration[0], -mass[1] * acceleration[1]
+        )
+
+    def test_chunks_do_not_change_the_result(self):
+        position, mass = cloud(50)
+        np.testing.assert_allclose(
+            direct_accelerations(position, mass, chunk=7),
+            direct_accelerations(position, mass),
+        )
+
+
+class TestBarnesHutAccelerations(unittest.TestCase):
+    def test_opening_every_cell_is_exact(self):
+        position, mass = cloud(300)
+        error = relative_error(
+            barnes_hut_accelerations(position, mass, theta=0.0),
+            direct_accelerations(position, mass),
+        )
+        self.assertLess(error.max(), 1e-5)
+
+    def test_close_to_direct_summation(self):
+        position, mass = cloud(1000)
+        error = relative_error(
+            barnes_hut_accelerations(position, mass),
+            direct_accelerations(position, mass),
+        )
+        self.assertLess(np.median(error), 0.01)
+        self.assertLess(np.percentile(error, 99), 0.1)
+
+    def test_smaller_theta_is_more_accurate(self):
+        position, mass = cloud(500)
+        exact = direct_accelerations(position, mass)
+        coarse = relative_error(
+            barnes_hut_accelerations(position, mass, theta=1.0), exact
+        )
+        fine = relative_error(
+            barnes_hut_accelerations(position, mass, theta=0.3), exact
+        )
+        self.assertLess(np.median(fine), np.median(coarse))
+
+    def test_single_body_is_not_pulled(self):
+        acceleration = barnes_hut_accelerations(
+            np.array([[1.0, 2.0, 3.0]]), np.array([5.0])
+        )
+        np.testing.assert_array_equal(acceleration, np.zeros((1, 3)))
+
+    def test_coincident_bodies(self):
+        position = np.array([[0.0, 0.0, 0.0]] * 3 + [[10.0, 0.0, 0.0]])
+        mass = np.ones(4)
+        acceleration = barnes_hut_accelerations(position, mass)
+        self.assertTrue(np.isfinite(acceleration).all())
+        np.testing.assert_allclose(
+            acceleration, direct_accelerations(position, mass), rtol=1e-5
+        )
+
+
+class TestGravitySystem(unittest.TestCase):
+    def star_and_planet(self, **kwargs):
+        return GravitySystem(
+            [Sun(10), Planet(3, 60, 6.0, angle=0.3, inclination=0.5)],
+            clock=lambda: 0.0,
+            **kwargs
+        )
+
+    def test_starts_on_a_circular_orbit(self):
+        planets = self.star_and_planet()
+        planets.update(0.0)
+        start = planets.position[1].copy()
+        np.testing.assert_allclose(
+            np.dot(start, planets.velocity[1]), 0.0, atol=1e-9
+        )
+        energy = planets.energy()
+        for frame in range(1, 301):
+            planets.update(frame / 30)
+            offset = planets.position[1] - planets.position[0]
+            self.assertAlmostEqual(np.linalg.norm(offset), 60, delta=1)
+        self.assertAlmostEqual(planets.energy() / energy, 1, places=4)
+        # Bodies that are drawn follow the simulation.
+        self.assertEqual(planets[1].x, planets.position[1, 0])
+
+    def test_steps_do_not_depend_on_frame_rate(self):
+        slow = self.star_and_planet()
+        fast = self.star_and_planet()
+        for frame in range(11):
+            slow.update(frame / 10)
+        for frame in range(61):
+            fast.update(frame / 60)
+        self.assertEqual(slow.steps, fast.steps)
+        np.testing.assert_allclose(slow.position, fast.position)
+
+    def test_drops_time_it_cannot_catch_up_on(self):
+        planets = self.star_and_planet(timestep=0.1, max_steps=3)
+        planets.update(0.0)
+        planets.update(1.0)
+        self.assertEqual(planets.steps, 3)
+        self.assertAlmostEqual(planets.dropped, 0.7)
+        planets.update(1.1)
+        self.assertEqual(planets.steps, 4)
+
+    def test_direct_matches_tree(self):
+        random.seed(1)
+        tree = GravitySystem(clock=lambda: 0.0)
+        add_solar_system(tree)
+        add_particle_cloud(tree, 100)
+        random.seed(1)
+        direct = GravitySystem(clock=lambda: 0.0, direct=True)
+        add_solar_system(direct)
+        add_particle_cloud(direct, 100)
+        for frame in range(11):
+            tree.update(frame / 30)
+            direct.update(frame / 30)
+        np.testing.assert_allclose(tree.position, direct.position, atol=0.1)
+
+    def test_masses(self):
+        planets = GravitySystem(
+            [Sun(10), Planet(2, 40, 5.0), Planet(1, 50, 5.0, mass=7.0)],
+            clock=lambda: 0.0,
+        )
+        planets.update(0.0)
+        np.testing.assert_allclose(planets.mass, [1000, 0.008, 7])
+
+    def test_bodies_added_later_join(self):
+        planets = self.star_and_planet()
+        planets.update(0.0)
+        planets.update(1.0)
+        moved = planets.position[1].copy()
+        planets.append(Planet(2, 100, 8.0, angle=0.0))
+        planets.update(1.0)
+        np.testing.assert_array_equal(planets.position[1], moved)
+        self.assertAlmostEqual(planets[2].x, 100)
+        self.assertGreater(np.linalg.norm(planets.velocity[2]), 0)
+
+    def test_has_no_closed_form(self):
+        planets = self.star_and_planet()
+        self.assertNotIsInstance(planets, PlanetSystem)
+        self.assertFalse(hasattr(planets, "at"))
+
+
+class TestParticleCloud(unittest.TestCase):
+    def test_collapses(self):
+        random.seed(2)
+        planets = GravitySystem(clock=lambda: 0.0)
+        add_particle_cloud(planets, 300)
+        planets.update(0.0)
+        self.assertAlmostEqual(planets.mass.sum(), 500)
+        start = np.median(np.linalg.norm(planets.position, axis=1))
+        for frame in range(1, 46):
+            planets.update(frame / 30)
+        end = np.median(np.linalg.norm(planets.position, axis=1))
+        self.assertLess(end, start)
+        self.assertTrue(np.isfinite(planets.position).all())
+        self.assertTrue(
+            all(0 < planet.inclination < math.pi for planet in planets)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+import random
+import unittest
+
+import numpy as np
+
+from terminal_solar_system.framebuffer import DepthBuffer
+from terminal_solar_system.lod import LevelOfDetail
+from terminal_solar_system.main import (
+    add_random_solar_system,
+    add_solar_system,
+)
+from terminal_solar_system.planets import Planet, Star, StarField
+from terminal_solar_system.renderer import render_frame
+from terminal_solar_system.sprites import SpriteCache
+from terminal_solar_system.numpy_renderer import NumpyRenderer
+
+
+class DummyConsole:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+
+
+class TestNumpyRenderer(unittest.TestCase):
+    def assert_same_frame(self, planets, stars, console, print_color, scale):
+        state = random.getstate()
+        expected = render_frame(planets, stars, console, print_color, scale)
+        random.setstate(state)
+        actual = NumpyRenderer().render_frame(
+            planets, stars, console, print_color, scale
+        )
+        self.assert_same_text(actual, expected)
+
+    def assert_same_text(self, actual, expected):
+        self.assertEqual(actual.plain, expected.plain)
+        self.assertEqual(actual.spans, expected.spans)
+
+    def test_solar_system_matches_python(self):
+        random.seed(7)
+        console = DummyConsole(120, 40)
+        planets = []
+        add_solar_system(planets)
+        stars = [Star(console) for _ in range(50)]
+        for planet in planets:
+            planet.update()
+        for print_color in (True, False):
+            self.assert_same_frame(planets, stars, console, print_color, 2.2)
+
+    def test_random_systems_match_python(self):
+        random.seed(11)
+        for width, height in [(80, 24), (157, 51), (13, 7)]:
+            console = DummyConsole(width, height)
+            planets = []
+            add_random_solar_system(planets)
+            for planet in planets:
+                planet.x = random.uniform(-width, width)
+                planet.y = random.uniform(-height, height)
+                planet.z = random.uniform(-120, 120)
+            self.assert_same_frame(planets, [], console, True, 2.2)
+
+    def test_sub_cell_and_ringed_planets_match_python(self):
+        console = DummyConsole(60, 20)
+        planets = [
+            Planet(1, 0, 0, symbol='o', color='red', x=3.5, y=-2.5, z=-40),
+            Planet(4, 0, 0, symbol='#', has_ring=True, x=-9, y=1.3, z=20),
+        ]
+        self.assert_same_frame(planets, [], console, True, 3.1)
+
+    def test_renderer_reuses_arrays(self):
+        renderer = NumpyRenderer()
+        console = DummyConsole(40, 10)
+        renderer.render_frame([], [], console, True, 2.2)
+        glyphs = renderer.glyphs
+        renderer.render_frame([], [], console, True, 2.2)
+        self.assertIs(renderer.glyphs, glyphs)
+        renderer.render_frame([], [], DummyConsole(20, 5), True, 2.2)
+        self.assertEqual(renderer.glyphs.shape, (5, 20))
+
+    def test_sprite_cache_matches_python(self):
+        random.seed(3)
+        console = DummyConsole(100, 30)
+        planets = []
+        add_random_solar_system(planets)
+        for planet in planets:
+            planet.x = random.uniform(-60, 60)
+            planet.y = random.uniform(-20, 20)
+            planet.z = random.uniform(-100, 100)
+        expected = render_frame(planets, [], console, True, 2.2, SpriteCache())
+        actual = NumpyRenderer().render_frame(
+            planets, [], console, True, 2.2, SpriteCache()
+        )
+        self.assert_same_text(actual, expected)
+
+    def test_star_field_matches_python(self):
+        console = DummyConsole(90, 30)
+        planets = []
+        add_solar_system(planets)
+        stars = StarField(console, 300, np.random.default_rng(2))
+        stars.idx[stars.idx == 0] = 1
+        expected = render_frame(planets, stars, console, True, 2.2)
+        actual = NumpyRenderer().render_frame(
+            planets, stars, console, True, 2.2
+        )
+        self.assert_same_text(actual, expected)
+
+    def test_depth_buffer_matches_python(self):
+        random.seed(13)
+        console = DummyConsole(90, 30)
+        planets = []
+        add_random_solar_system(planets, 120, 120)
+        for planet in planets:
+            planet.x = random.uniform(-50, 50)
+            planet.y = random.uniform(-18, 18)
+            planet.z = random.uniform(-150, 100)
+            planet.has_ring = random.random() < 0.3
+        for sprite_cache, lod in [
+            (None, None),
+            (SpriteCache(), None),
+            (None, LevelOfDetail()),
+        ]:
+            expected = render_frame(
+                planets, [], console, True, 2.2, sprite_cache, lod,
+                depth_buffer=DepthBuffer()
+            )
+            actual = NumpyRenderer().render_frame(
+                planets, [], console, True, 2.2, sprite_cache, lod,
+                depth_buffer=DepthBuffer()
+            )
+            self.assert_same_text(actual, expected)
+
+    def test_level_of_detail_matches_python(self):
+        random.seed(9)
+        console = DummyConsole(100, 30)
+        planets = []
+        add_random_solar_system(planets)
+        for planet in planets:
+            planet.x = random.uniform(-60, 60)
+            planet.y = random.uniform(-20, 20)
+            planet.z = random.uniform(-150, 100)
+        expected = render_frame(
+            planets, [], console, True, 2.2, lod=LevelOfDetail()
+        )
+        actual = NumpyRenderer().render_frame(
+            planets, [], console, True, 2.2, lod=LevelOfDetail()
+        )
+        self.assert_same_text(actual, expected)
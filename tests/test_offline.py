@@ -0,0 +1,56 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from terminal_solar_system.offline import FRAME_SEPARATOR, render_offline
+
+
+class TestRenderOffline(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def render(self, name, workers, **kwargs):
+        path = os.path.join(self.directory, name)
+        frames = render_offline(
+            path, 1.0, 6, 50, 14, 40, workers=workers, seed=4, **kwargs
+        )
+        with open(path, encoding="utf-8") as file:
+            return frames, file.read()
+
+    def test_frame_dump(self):
+        frames, dump = self.render("clip.txt", 2)
+        self.assertEqual(frames, 6)
+        pages = dump.split(FRAME_SEPARATOR)[:-1]
+        self.assertEqual(len(pages), 6)
+        self.assertEqual(
+            [len(line) for line in pages[0].splitlines()], [50] * 14
+        )
+
+    def test_output_does_not_depend_on_workers(self):
+        _, one = self.render("one.txt", 1, random_planets=True)
+        _, two = self.render("two.txt", 2, random_planets=True)
+        self.assertEqual(one, two)
+
+    def test_asciicast_is_timed_by_frame(self):
+        _, cast = self.render("clip.cast", 2, print_color=True)
+        lines = cast.splitlines()
+        self.assertIn('"version": 2', lines[0])
+        self.assertTrue(lines[2].startswith("[0.166667, "))
+
+    def test_asciicast_does_not_depend_on_chunks(self):
+        _, whole = self.render("whole.cast", 2, print_color=True)
+        with mock.patch(
+            "terminal_solar_system.offline.OFFLINE_CHUNK_SIZE", 2
+        ):
+            _, chunked = self.render("chunked.cast", 2, print_color=True)
+        # The header holds the time the recording was made.
+        self.assertEqual(
+            chunked.splitlines()[1:], whole.splitlines()[1:]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
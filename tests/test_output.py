@@ -0,0 +1,79 @@
+import io
+import unittest
+
+from terminal_solar_system.framebuffer import blank_grid
+from terminal_solar_system.output import (
+    CLEAR_SCREEN,
+    ENTER_ALT_SCREEN,
+    EXIT_ALT_SCREEN,
+    DiffWriter,
+    runs,
+)
+
+
+class TestRuns(unittest.TestCase):
+    def test_bridges_small_gaps(self):
+        self.assertEqual(runs([1, 2, 5, 20, 21]), [(1, 6), (20, 22)])
+
+    def test_empty(self):
+        self.assertEqual(runs([]), [])
+
+
+class TestDiffWriter(unittest.TestCase):
+    def test_first_frame_is_full_redraw(self):
+        writer = DiffWriter(io.StringIO())
+        output = writer.diff(blank_grid(4, 2))
+        self.assertTrue(output.startswith("\x1b[0m" + CLEAR_SCREEN))
+        self.assertIn("\x1b[1;1H    ", output)
+        self.assertIn("\x1b[2;1H    ", output)
+
+    def test_unchanged_frame_writes_nothing(self):
+        writer = DiffWriter(io.StringIO())
+        writer.diff(blank_grid(4, 2))
+        self.assertEqual(writer.diff(blank_grid(4, 2)), "")
+
+    def test_only_changed_cells_are_written(self):
+        writer = DiffWriter(io.StringIO())
+        writer.diff(blank_grid(30, 3))
+        frame = blank_grid(30, 3)
+        frame[1][2] = ('*', 'red')
+        frame[2][25] = ('o', None)
+        self.assertEqual(
+            writer.diff(frame),
+            "\x1b[2;3H\x1b[0;31m*\x1b[3;26H\x1b[0mo",
+        )
+
+    def test_monochrome_draws_white(self):
+        writer = DiffWriter(io.StringIO(), print_color=False)
+        writer.diff(blank_grid(3, 1))
+        frame = blank_grid(3, 1)
+        frame[0][0] = ('*', 'orange1')
+        self.assertEqual(writer.diff(frame), "\x1b[1;1H\x1b[0;37m*\x1b[0m")
+
+    def test_color_change_redraws_in_full(self):
+        stream = io.StringIO()
+        writer = DiffWriter(stream)
+        frame = blank_grid(3, 1)
+        frame[0][0] = ('*', 'orange1')
+        writer.write_frame(frame, print_color=True)
+        writer.write_frame(frame, print_color=True)
+        self.assertEqual(writer.bytes_written, 0)
+        writer.write_frame(frame, print_color=False)
+        self.assertFalse(writer.print_color)
+        output = stream.getvalue()[-writer.bytes_written:]
+        self.assertTrue(output.startswith("\x1b[0m" + CLEAR_SCREEN))
+        self.assertIn("\x1b[0;37m*", output)
+
+    def test_resize_forces_full_redraw(self):
+        writer = DiffWriter(io.StringIO())
+        writer.diff(blank_grid(4, 2))
+        self.assertIn(CLEAR_SCREEN, writer.diff(blank_grid(5, 2)))
+        writer.invalidate()
+        self.assertIn(CLEAR_SCREEN, writer.diff(blank_grid(5, 2)))
+
+    def test_context_manager_switches_screens(self):
+        stream = io.StringIO()
+        with DiffWriter(stream) as writer:
+            writer.write_frame(blank_grid(2, 1))
+        self.assertTrue(stream.getvalue().startswith(ENTER_ALT_SCREEN))
+        self.assertTrue(stream.getvalue().endswith(EXIT_ALT_SCREEN))
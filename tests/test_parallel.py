@@ -0,0 +1,117 @@
+import os
+import random
+import sys
+import threading
+import unittest
+
+from terminal_solar_system.camera import Camera
+from terminal_solar_system.main import add_random_solar_system
+from terminal_solar_system.numpy_renderer import NumpyRenderer
+from terminal_solar_system.parallel import ParallelRenderer
+from terminal_solar_system.planets import Planet
+
+
+class TestParallelRenderer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.renderer = ParallelRenderer(workers=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.renderer.close()
+
+    def assert_same_arrays(
+        self, planets, width, height, scale=2.2, camera=None
+    ):
+        expected = NumpyRenderer()
+        expected.rasterize(
+            planets, [], width, height, scale, camera=camera
+        )
+        self.renderer.rasterize(
+            planets, [], width, height, scale, camera=camera
+        )
+        self.assertEqual(
+            self.renderer.glyphs.tolist(), expected.glyphs.tolist()
+        )
+        self.assertEqual(
+            [[expected.palette[c] for c in row]
+             for row in expected.colors.tolist()],
+            [[self.renderer.palette[c] for c in row]
+             for row in self.renderer.colors.tolist()],
+        )
+
+    def test_random_systems_match_serial(self):
+        random.seed(21)
+        for width, height in [(120, 40), (61, 17)]:
+            planets = []
+            add_random_solar_system(planets)
+            for planet in planets:
+                planet.x = random.uniform(-width / 2, width / 2)
+                planet.y = random.uniform(-height / 2, height / 2)
+                planet.z = random.uniform(-120, 120)
+                planet.has_ring = random.random() < 0.5
+            self.assert_same_arrays(planets, width, height)
+
+    def test_sub_cell_planets_match_serial(self):
+        planets = [
+            Planet(4, 0, 0, symbol='#', x=0, y=0, z=0),
+            Planet(1, 0, 0, symbol='o', color='red', x=0.4, y=0.4, z=-50),
+            Planet(1, 0, 0, symbol='x', color='blue', x=12, y=2, z=-50),
+            Planet(1, 0, 0, symbol='r', has_ring=True, x=-7, y=5, z=-45),
+        ]
+        self.assert_same_arrays(planets, 60, 20)
+
+    def test_camera_matches_serial(self):
+        random.seed(22)
+        planets = []
+        add_random_solar_system(planets)
+        for planet in planets:
+            planet.x = random.uniform(-80, 80)
+            planet.y = random.uniform(-30, 30)
+            planet.z = random.uniform(-120, 120)
+            planet.has_ring = random.random() < 0.5
+        self.assert_same_arrays(
+            planets, 90, 30, camera=Camera(zoom=2.0, pan_x=8, pan_y=-3)
+        )
+
+    def test_starts_workers_while_a_thread_reads_keys(self):
+        # A thread blocked reading stdin holds its lock, as the key
+        # listener does while the first frame starts the workers.
+        read_end, write_end = os.pipe()
+        stdin = sys.stdin
+        sys.stdin = open(read_end)
+        listener = threading.Thread(target=sys.stdin.read, args=(1,))
+        listener.start()
+        renderer = ParallelRenderer(workers=1)
+        drawn = threading.Thread(
+            target=renderer.rasterize,
+            args=([Planet(4, 0, 0, x=0, y=0, z=0)], [], 40, 12, 2.2),
+            daemon=True,
+        )
+        try:
+            drawn.start()
+            drawn.join(timeout=30)
+            self.assertFalse(drawn.is_alive())
+            self.assertIn('*', renderer.glyphs.tolist()[6])
+        finally:
+            os.write(write_end, b'q')
+            listener.join()
+            os.close(write_end)
+            sys.stdin.close()
+            sys.stdin = stdin
+            if drawn.is_alive():
+                # Let the rest of the suite run instead of hanging on exit.
+                for process in renderer._pool._processes.values():
+                    process.kill()
+            else:
+                renderer.close()
+
+    def test_rejects_sprites(self):
+        with self.assertRaises(ValueError):
+            self.renderer.rasterize([], [], 10, 10, 2.2, lod=object())
+
+    def test_rejects_depth_buffer(self):
+        with self.assertRaises(ValueError):
+            self.renderer.rasterize(
+                [], [], 10, 10, 2.2, depth_buffer=object()
+            )
@@ -0,0 +1,99 @@
+import threading
+import unittest
+
+from terminal_solar_system.pipeline import FramePipeline, FrameQueue
+
+
+class TestFrameQueue(unittest.TestCase):
+    def test_full_queue_drops_oldest(self):
+        queue = FrameQueue(2)
+        for frame in range(5):
+            queue.put(frame)
+        self.assertEqual(queue.dropped, 3)
+        self.assertEqual(queue.depth, 2)
+        self.assertEqual(queue.max_depth, 2)
+        self.assertEqual(queue.get(), (3, False))
+        self.assertEqual(queue.get(), (4, False))
+
+    def test_get_waits_for_frame(self):
+        queue = FrameQueue()
+        threading.Timer(0.01, queue.put, args=("frame",)).start()
+        self.assertEqual(queue.get(), ("frame", True))
+
+
+class TestFramePipeline(unittest.TestCase):
+    def test_frames_flow_through_stages_in_order(self):
+        written = []
+        with FramePipeline(
+            [("double", lambda x: x * 2), ("output", written.append)],
+            maxsize=100
+        ) as pipeline:
+            for frame in range(10):
+                pipeline.push(frame)
+            while len(written) < 10:
+                threading.Event().wait(0.001)
+        self.assertEqual(written, [frame * 2 for frame in range(10)])
+        self.assertEqual(pipeline.stages[1].processed, 10)
+        self.assertEqual(pipeline.stages[0].queue.dropped, 0)
+
+    def test_slow_output_drops_stale_frames(self):
+        release = threading.Event()
+        written = []
+
+        def output(frame):
+            release.wait()
+            written.append(frame)
+
+        with FramePipeline([("output", output)]) as pipeline:
+            for frame in range(20):
+                pipeline.push(frame)
+            self.assertLessEqual(pipeline.stages[0].queue.depth, 1)
+            self.assertGreaterEqual(pipeline.stages[0].queue.dropped, 18)
+            release.set()
+        self.assertLessEqual(len(written), 2)
+        self.assertIn("output: depth", str(pipeline))
+
+    def test_releases_frames_the_first_stage_is_done_with(self):
+        released = []
+        written = []
+        with FramePipeline(
+            [("output", written.append)], maxsize=100,
+            release=released.append
+        ) as pipeline:
+            for frame in range(5):
+                pipeline.push(frame, f"grid {frame}")
+            while len(written) < 5:
+                threading.Event().wait(0.001)
+        # The last frame written is kept for the next one to diff against.
+        self.assertEqual(released, [f"grid {frame}" for frame in range(4)])
+
+    def test_releases_dropped_frames(self):
+        release = threading.Event()
+        released = []
+
+        def output(frame):
+            release.wait()
+
+        with FramePipeline(
+            [("output", output)], maxsize=1, release=released.append
+        ) as pipeline:
+            for frame in range(10):
+                pipeline.push(frame, frame)
+            dropped = pipeline.stages[0].queue.dropped
+            self.assertGreaterEqual(dropped, 8)
+            self.assertEqual(len(released), dropped)
+            release.set()
+
+    def test_stage_error_is_raised(self):
+        def fail(frame):
+            raise RuntimeError("broken terminal")
+
+        with self.assertRaises(RuntimeError):
+            with FramePipeline([("output", fail)]) as pipeline:
+                pipeline.push(1)
+                pipeline._threads[0].join()
+                pipeline.push(2)
+
+
+if __name__ == "__main__":
+    unittest.main()
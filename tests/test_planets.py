@@ -1,8 +1,16 @@
 import math
 import unittest
 
+import numpy as np
+
 from terminal_solar_system.config import STAR_FRAME_HOLD
-from terminal_solar_system.planets import Planet, Star, Sun
+from terminal_solar_system.planets import (
+    Planet,
+    PlanetSystem,
+    Star,
+    StarField,
+    Sun,
+)
 
 
 class TestPlanet(unittest.TestCase):
@@ -163,3 +171,265 @@ class TestStar(unittest.TestCase):
         original_idx = star.idx
         star.update()
         self.assertEqual(star.idx, original_idx)
+
+
+class TestPlanetSystem(unittest.TestCase):
+    def setUp(self):
+        self.planets = [
+            Sun(10),
+            Planet(2, 40, 4.8, angle=0.3),
+            Planet(3, 60, 6.0, angle=2.0, inclination=0.4),
+        ]
+        self.system = PlanetSystem(self.planets)
+
+    def test_planets_become_views(self):
+        self.assertEqual(len(self.system), 3)
+        self.assertIs(self.system[1], self.planets[1])
+        self.assertAlmostEqual(self.system.angle[1], 0.3)
+        self.planets[2].x = 5
+        self.assertEqual(self.system.x[2], 5)
+        self.system.z[1] = 7
+        self.assertEqual(self.planets[1].z, 7)
+
+    def test_update_matches_planet_update(self):
+        reference = [
+            Sun(10),
+            Planet(2, 40, 4.8, angle=0.3),
+            Planet(3, 60, 6.0, angle=2.0, inclination=0.4),
+        ]
+        now = self.system.time + 1.7
+        for planet in reference:
+            planet.time = self.system.time
+            planet.update(now)
+        self.system.update(now)
+        for expected, actual in zip(reference, self.system):
+            self.assertAlmostEqual(actual.angle, expected.angle)
+            self.assertAlmostEqual(actual.x, expected.x)
+            self.assertAlmostEqual(actual.y, expected.y)
+            self.assertAlmostEqual(actual.z, expected.z)
+
+    def test_sun_does_not_move(self):
+        self.system.update(self.system.time + 3)
+        self.assertEqual(
+            (self.planets[0].angle, self.planets[0].x), (0, 0)
+        )
+
+    def test_grows_past_initial_capacity(self):
+        for index in range(40):
+            self.system.append(Planet(1, index, 10, angle=0))
+        self.assertEqual(len(self.system.angle), 43)
+        self.assertEqual(self.system[42].orbit_radius, 39)
+        self.assertEqual(self.planets[1].orbit_radius, 40)
+
+    def test_planet_cannot_join_two_systems(self):
+        with self.assertRaises(ValueError):
+            PlanetSystem([self.planets[0]])
+
+    def test_injected_clock(self):
+        system = PlanetSystem(
+            [Planet(2, 40, 4.0, angle=0.0)], clock=lambda: 1.0
+        )
+        self.assertEqual(system.time, 1.0)
+        system.update()
+        self.assertEqual(system.angle[0], 0.0)
+
+    def test_at_is_closed_form(self):
+        start = self.system.time
+        self.system.at(start + 3.0)
+        later = self.system.x.copy()
+        self.system.at(start + 1.0)
+        self.system.at(start + 3.0)
+        np.testing.assert_allclose(self.system.x, later)
+        self.assertAlmostEqual(
+            self.system.angle[1], (0.3 + 3.0 / 4.8 * 2 * math.pi) % math.tau
+        )
+
+    def make_moons(self, planets):
+        earth = planets[2]
+        moon = Planet(1, 8, 1.3, angle=0.5, inclination=0.2, parent=earth)
+        station = Planet(0.5, 2, 0, angle=1.0, parent=moon)
+        return [moon, station]
+
+    def test_moons_match_planet_update(self):
+        moons = self.make_moons(self.planets)
+        self.system.extend(moons)
+        reference = [
+            Sun(10),
+            Planet(2, 40, 4.8, angle=0.3),
+            Planet(3, 60, 6.0, angle=2.0, inclination=0.4),
+        ]
+        reference += self.make_moons(reference)
+        now = self.system.time + 2.9
+        for planet in reference:
+            planet.time = self.system.time
+            planet.update(now)
+        self.system.update(now)
+        for expected, actual in zip(reference, self.system):
+            self.assertAlmostEqual(actual.x, expected.x)
+            self.assertAlmostEqual(actual.y, expected.y)
+            self.assertAlmostEqual(actual.z, expected.z)
+        # The station does not orbit, but still follows the moon.
+        station = self.system[4]
+        self.assertAlmostEqual(station.x - moons[0].x, 2 * math.cos(1.0))
+
+    def test_moons_resolved_by_level(self):
+        self.system.extend(self.make_moons(self.planets))
+        np.testing.assert_array_equal(self.system.parent, [-1, -1, -1, 2, 3])
+        self.assertEqual(
+            [list(level) for level in self.system._levels], [[3], [4]]
+        )
+
+    def test_parent_must_be_added_first(self):
+        orphan = Planet(1, 8, 1.3, parent=Planet(3, 60, 6.0))
+        with self.assertRaises(ValueError):
+            self.system.append(orphan)
+
+    def test_elliptical_orbits_match_planet_update(self):
+        def make():
+            return [
+                Sun(10),
+                Planet(2, 40, 4.8, angle=0.3, eccentricity=0.6),
+                Planet(
+                    3, 60, 6.0, angle=2.0, inclination=0.4,
+                    eccentricity=0.2, periapsis=1.1,
+                ),
+                Planet(1, 50, 5.0, angle=1.0, periapsis=0.5),
+            ]
+
+        reference = make()
+        system = PlanetSystem(make())
+        for _ in range(30):
+            now = system.time + 0.1
+            for planet in reference:
+                planet.time = system.time
+                planet.update(now)
+            system.update(now)
+        self.assertGreater(system.kepler_steps, 0)
+        for expected, actual in zip(reference, system):
+            self.assertAlmostEqual(actual.x, expected.x)
+            self.assertAlmostEqual(actual.y, expected.y)
+            self.assertAlmostEqual(actual.z, expected.z)
+            if expected.eccentricity:
+                self.assertAlmostEqual(actual.anomaly, expected.anomaly)
+
+    def test_elliptical_distance_from_focus(self):
+        planet = Planet(2, 40, 4.8, angle=0.3, eccentricity=0.5)
+        system = PlanetSystem([planet])
+        system.update(system.time + 1.3)
+        distance = math.hypot(planet.x, planet.y, planet.z)
+        self.assertAlmostEqual(
+            distance, 40 * (1 - 0.5 * math.cos(planet.anomaly))
+        )
+
+    def test_circular_orbits_unchanged(self):
+        self.system.update(self.system.time + 1.7)
+        self.assertEqual(self.system.kepler_steps, 0)
+        self.assertEqual(
+            self.planets[1].x, 40 * math.cos(self.planets[1].angle)
+        )
+
+    def test_eccentricity_must_be_below_one(self):
+        with self.assertRaises(ValueError):
+            Planet(1, 10, 2, eccentricity=1.0)
+
+    def test_moons_at_is_closed_form(self):
+        self.system.extend(self.make_moons(self.planets))
+        start = self.system.time
+        self.system.at(start + 3.0)
+        later = self.system.z.copy()
+        self.system.at(start + 1.0)
+        self.system.at(start + 3.0)
+        np.testing.assert_allclose(self.system.z, later)
+
+
+class TestStarField(unittest.TestCase):
+    class DummyConsole:
+        width = 80
+        height = 24
+
+    def setUp(self):
+        self.field = StarField(
+            self.DummyConsole(), 200, np.random.default_rng(5)
+        )
+
+    def test_initialization(self):
+        self.assertEqual(len(self.field), 200)
+        self.assertTrue(((0 <= self.field.x) & (self.field.x < 80)).all())
+        self.assertTrue(((0 <= self.field.y) & (self.field.y < 24)).all())
+        self.assertTrue((self.field.idx < len(self.field.frames)).all())
+
+    def test_update_advances_only_due_stars(self):
+        self.field.time[:100] -= STAR_FRAME_HOLD + 1
+        before = self.field.idx.copy()
+        now = self.field.time[100:].max()
+        self.field.update(now)
+        frames = len(self.field.frames)
+        self.assertTrue(
+            (self.field.idx[:100] == (before[:100] + 1) % frames).all()
+        )
+        self.assertTrue((self.field.idx[100:] == before[100:]).all())
+        self.assertTrue((self.field.time[:100] == now).all())
+
+    def test_relocate_moves_faded_and_out_of_bounds_stars(self):
+        self.field.idx[:] = 1
+        self.field.idx[0] = 0
+        self.field.x[1] = 79
+        x, y = self.field.x.copy(), self.field.y.copy()
+        self.field.relocate(40, 24)
+        self.assertTrue((self.field.x < 40).all())
+        visible = (self.field.idx != 0) & (x < 40)
+        self.assertTrue((self.field.x[visible] == x[visible]).all())
+        self.assertTrue((self.field.y[visible] == y[visible]).all())
+
+    def test_stamp_draws_every_star(self):
+        self.field.idx[:] = 3
+        buffer = [[(' ', None)] * 80 for _ in range(24)]
+        self.field.stamp(buffer)
+        for x, y in zip(self.field.x, self.field.y):
+            self.assertEqual(buffer[y][x], ('*', 'white'))
+
+    def test_relocate_is_deterministic(self):
+        other = StarField(self.DummyConsole(), 200, np.random.default_rng(5))
+        for field in (self.field, other):
+            field.idx[:50] = 0
+            field.relocate(80, 24)
+        np.testing.assert_array_equal(self.field.x, other.x)
+        self.assertTrue((self.field.respawns[:50] == 1).all())
+
+    def test_at_is_closed_form(self):
+        start = self.field.time.min()
+        self.field.at(start + 7.3, 80, 24)
+        later = (self.field.idx.copy(), self.field.x.copy())
+        self.field.at(start + 2.0, 80, 24)
+        self.field.at(start + 7.3, 80, 24)
+        np.testing.assert_array_equal(self.field.idx, later[0])
+        np.testing.assert_array_equal(self.field.x, later[1])
+
+    def test_at_steps_once_per_hold(self):
+        self.field.idx[:] = 1
+        self.field.time[:] = 0.0
+        x = self.field.x.copy()
+        self.field.at(STAR_FRAME_HOLD * 3.5, 80, 24)
+        self.assertTrue((self.field.idx == 4).all())
+        np.testing.assert_array_equal(self.field.x, x)
+        self.field.at(STAR_FRAME_HOLD * 6.5, 80, 24)
+        self.assertTrue((self.field.idx == 0).all())
+        self.assertTrue((self.field.respawns == 1).all())
+
+    def test_stars_are_views(self):
+        star = list(self.field)[7]
+        star.x = 3
+        star.idx = 2
+        self.assertEqual(self.field.x[7], 3)
+        self.assertEqual(self.field.glyphs()[7], '+')
+        self.assertEqual(star.frames[star.idx], '+')
+
+    def test_subset_is_a_view(self):
+        subset = self.field.subset(50)
+        self.assertEqual(len(subset), 50)
+        self.assertEqual(len(self.field), 200)
+        subset.idx[:] = 0
+        subset.relocate(40, 12)
+        self.assertTrue((self.field.respawns[:50] == 1).all())
+        self.assertTrue((self.field.respawns[50:] == 0).all())
+        np.testing.assert_array_equal(self.field.x[:50], subset.x)
@@ -0,0 +1,97 @@
+import io
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from terminal_solar_system.output import CLEAR_SCREEN
+from terminal_solar_system.recording import Recorder, play
+from tests.helpers import FakeClock
+
+
+def frame(width, height, symbol=' ', color=None):
+    return [[(symbol, color)] * width for _ in range(height)]
+
+
+class TestRecording(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "session.cast")
+        self.clock = FakeClock(50.0)
+
+    def record(self, frames, width=4, height=2):
+        with Recorder(
+            self.path, width, height, print_color=False, clock=self.clock
+        ) as recorder:
+            for buffer in frames:
+                recorder.write_frame(buffer)
+                self.clock.now += 0.5
+        return recorder
+
+    def read_events(self):
+        with open(self.path, encoding="utf-8") as file:
+            header = json.loads(file.readline())
+            return header, [json.loads(line) for line in file]
+
+    def test_records_header_and_frame_diffs(self):
+        changed = frame(4, 2)
+        changed[1][2] = ('*', None)
+        self.record([frame(4, 2), changed, changed])
+        header, events = self.read_events()
+        self.assertEqual(header["version"], 2)
+        self.assertEqual((header["width"], header["height"]), (4, 2))
+        self.assertEqual([event[0] for event in events], [0.0, 0.5])
+        self.assertTrue(all(event[1] == "o" for event in events))
+        self.assertEqual(events[1][2], "\x1b[2;3H*")
+
+    def test_records_resize(self):
+        self.record([frame(4, 2), frame(6, 3)])
+        _, events = self.read_events()
+        self.assertEqual(events[1][1:], ["r", "6x3"])
+        self.assertEqual(events[2][1], "o")
+
+    def test_records_color_change_in_full(self):
+        colored = frame(4, 2, '*', 'red')
+        with Recorder(self.path, 4, 2, clock=self.clock) as recorder:
+            recorder.write_frame(colored)
+            recorder.print_color = False
+            recorder.write_frame(colored)
+        self.assertFalse(recorder.print_color)
+        _, events = self.read_events()
+        self.assertEqual(len(events), 2)
+        self.assertIn(CLEAR_SCREEN, events[1][2])
+        self.assertIn("\x1b[0;37m*", events[1][2])
+        self.assertNotIn("\x1b[0;31m", events[1][2])
+
+    def test_play_reproduces_output_and_timing(self):
+        changed = frame(4, 2)
+        changed[0][0] = ('+', None)
+        self.record([frame(4, 2), changed])
+        _, events = self.read_events()
+
+        output = io.StringIO()
+        player_clock = FakeClock(50.0)
+        played = play(
+            self.path, output, clock=player_clock, sleep=player_clock.sleep
+        )
+        self.assertEqual(played, 2)
+        self.assertEqual(player_clock.slept, [0.5])
+        self.assertIn(events[0][2] + events[1][2], output.getvalue())
+
+    def test_play_stops_on_event(self):
+        self.record([frame(4, 2)])
+        stop_event = threading.Event()
+        stop_event.set()
+        self.assertEqual(play(self.path, io.StringIO(), stop_event), 0)
+
+    def test_play_rejects_other_files(self):
+        with open(self.path, "w") as file:
+            file.write('{"version": 1}\n')
+        with self.assertRaises(ValueError):
+            play(self.path, io.StringIO())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,194 @@
+import math
+import random
+import unittest
+
+from rich.console import Console
+from rich.text import Span, Text
+
+from terminal_solar_system.config import DEPTH_OF_FIELD_MODIFIER, RING_CHAR
+from terminal_solar_system.framebuffer import DepthBuffer, blank_grid
+from terminal_solar_system.main import add_random_solar_system
+from terminal_solar_system.planets import Planet
+from terminal_solar_system.renderer import (
+    bounding_box,
+    nearest_cell,
+    rasterize_frame,
+    render_planet,
+    serialize_frame,
+)
+
+
+def full_scan_render_planet(buffer, planet, center_x, center_y, x_scale):
+    """Reference rasterizer visiting every cell of the buffer."""
+    height = len(buffer)
+    width = len(buffer[0])
+    pixel_written = False
+    min_dist = float("inf")
+    depth_of_field = planet.z / DEPTH_OF_FIELD_MODIFIER
+    inner_radius = planet.radius + depth_of_field - planet.line_width / 2
+    outer_radius = planet.radius + depth_of_field + planet.line_width / 2
+    for yi in range(height):
+        for xi in range(width):
+            dx = (xi - center_x) / x_scale
+            dy = (yi - center_y)
+            dist = math.sqrt(dx ** 2 + dy ** 2)
+            if inner_radius < dist < outer_radius:
+                buffer[yi][xi] = (planet.symbol, planet.color)
+                pixel_written = True
+            if dist < inner_radius:
+                buffer[yi][xi] = (planet.fill, planet.color)
+            if dist < min_dist:
+                min_dist = dist
+                min_coords = (yi, xi)
+    if not pixel_written:
+        yi, xi = min_coords
+        if 0 < yi < height - 1 and 0 < xi < width - 1:
+            buffer[yi][xi] = (planet.symbol, planet.color)
+
+
+class TestRenderPlanet(unittest.TestCase):
+    def assert_matches_full_scan(self, planet, center_x, center_y, x_scale):
+        expected = blank_grid(60, 20)
+        actual = blank_grid(60, 20)
+        full_scan_render_planet(expected, planet, center_x, center_y, x_scale)
+        render_planet(actual, planet, center_x, center_y, x_scale)
+        self.assertEqual(actual, expected)
+
+    def test_matches_full_scan_random_planets(self):
+        rng = random.Random(1234)
+        for _ in range(200):
+            planet = Planet(
+                rng.uniform(0, 8), 0, 0,
+                symbol='#', fill='.', color='red',
+                line_width=rng.choice([1, 2, 3]),
+                z=rng.uniform(-150, 150),
+            )
+            self.assert_matches_full_scan(
+                planet,
+                rng.uniform(-20, 80),
+                rng.uniform(-10, 30),
+                rng.choice([1.0, 2.2, 3.7]),
+            )
+
+    def test_matches_full_scan_sub_cell_planet(self):
+        planet = Planet(1, 0, 0, symbol='#', z=-45)
+        for center_x, center_y in [(30.5, 10.5), (30.2, 9.8), (0.4, 5)]:
+            self.assert_matches_full_scan(planet, center_x, center_y, 2.2)
+
+    def test_bounding_box_off_screen(self):
+        self.assertEqual(bounding_box(-50, 10, 3, 60, 20, 2.2), (0, 0, 0, 0))
+        self.assertEqual(bounding_box(30, 10, 0, 60, 20, 2.2), (0, 0, 0, 0))
+
+    def test_bounding_box_clipped(self):
+        y_start, y_stop, x_start, x_stop = bounding_box(
+            0, 0, 3, 60, 20, 2.0
+        )
+        self.assertEqual((y_start, x_start), (0, 0))
+        self.assertLessEqual(y_stop, 20)
+        self.assertLessEqual(x_stop, 60)
+
+    def test_nearest_cell_clamps_and_rounds_half_down(self):
+        self.assertEqual(nearest_cell(10.5, 4.5, 60, 20), (4, 10))
+        self.assertEqual(nearest_cell(10.6, 4.4, 60, 20), (4, 11))
+        self.assertEqual(nearest_cell(-5, 40, 60, 20), (19, 0))
+
+
+class TestDepthBuffer(unittest.TestCase):
+    def test_ring_passes_behind_its_planet(self):
+        planet = Planet(
+            5, 0, 0, symbol='#', fill='.', has_ring=True, x=0, y=0, z=0
+        )
+        painted = rasterize_frame([planet], [], 50, 17, 2.2)
+        composited = rasterize_frame(
+            [planet], [], 50, 17, 2.2, depth_buffer=DepthBuffer()
+        )
+        # Inside the disc, the painter draws the whole ring over the planet
+        # but only the lower half is in front of it.
+        for offset in (-3, 3):
+            y = 8 + offset
+            x = int(25 + offset * 2.2)
+            self.assertEqual(painted[y][x][0], RING_CHAR)
+            self.assertEqual(
+                composited[y][x][0], RING_CHAR if offset > 0 else '.'
+            )
+        # Outside the disc the whole ring shows.
+        self.assertEqual(composited[2][int(25 - 6 * 2.2)][0], RING_CHAR)
+
+    def test_order_does_not_matter(self):
+        random.seed(5)
+        planets = []
+        add_random_solar_system(planets, 30, 30)
+        for planet in planets:
+            planet.x = random.uniform(-30, 30)
+            planet.y = random.uniform(-10, 10)
+            planet.z = random.uniform(-100, 100)
+            planet.has_ring = random.random() < 0.5
+        depth_buffer = DepthBuffer()
+        expected = rasterize_frame(
+            planets, [], 70, 24, 2.2, depth_buffer=depth_buffer
+        )
+        random.shuffle(planets)
+        self.assertEqual(
+            rasterize_frame(
+                planets, [], 70, 24, 2.2, depth_buffer=depth_buffer
+            ),
+            expected,
+        )
+
+    def test_nearer_surface_wins_per_cell(self):
+        far = Planet(6, 0, 0, symbol='F', fill='f', x=0, y=0, z=0)
+        near = Planet(2, 0, 0, symbol='N', fill='n', x=6, y=0, z=4)
+        painted = rasterize_frame([near, far], [], 60, 21, 2.0)
+        frame = rasterize_frame(
+            [near, far], [], 60, 21, 2.0, depth_buffer=DepthBuffer()
+        )
+        # The near planet covers the far one's edge, but not where the far
+        # one bulges further out.
+        self.assertEqual(frame[10][36][0], 'n')
+        self.assertEqual(painted[8][35][0], 'N')
+        self.assertEqual(frame[8][35][0], 'f')
+
+
+class TestSerializeFrame(unittest.TestCase):
+    def setUp(self):
+        self.buffer = [
+            [('a', 'red'), ('b', 'red'), ('c', 'blue'), (' ', None)],
+            [(' ', None), ('d', 'blue'), ('e', 'blue'), ('f', 'red')],
+        ]
+
+    def test_one_span_per_color_run(self):
+        text = serialize_frame(self.buffer, True)
+        self.assertEqual(text.plain, "abc \n def")
+        self.assertEqual(
+            text.spans,
+            [
+                Span(0, 2, 'red'),
+                Span(2, 3, 'blue'),
+                Span(6, 8, 'blue'),
+                Span(8, 9, 'red'),
+            ],
+        )
+
+    def test_monochrome_merges_colored_runs(self):
+        text = serialize_frame(self.buffer, False)
+        self.assertEqual(
+            text.spans, [Span(0, 3, 'white'), Span(6, 9, 'white')]
+        )
+
+    def test_matches_per_cell_markup(self):
+        markup = "\n".join(
+            "".join(
+                f"[{color}]{symbol}[/{color}]" if color else symbol
+                for symbol, color in row
+            )
+            for row in self.buffer
+        )
+        expected = Text.from_markup(markup)
+        actual = serialize_frame(self.buffer, True)
+        console = Console()
+        self.assertEqual(actual.plain, expected.plain)
+        for offset in range(len(actual)):
+            self.assertEqual(
+                actual.get_style_at_offset(console, offset),
+                expected.get_style_at_offset(console, offset),
+            )
@@ -0,0 +1,82 @@
+import os
+import signal
+import unittest
+
+from terminal_solar_system.runtime import AsyncRuntime
+from terminal_solar_system.scheduler import FrameScheduler
+
+
+class PipeInput:
+    def __init__(self):
+        self.read_fd, self.write_fd = os.pipe()
+
+    def fileno(self):
+        return self.read_fd
+
+    def send(self, keys):
+        os.write(self.write_fd, keys.encode())
+
+    def close(self):
+        os.close(self.read_fd)
+        os.close(self.write_fd)
+
+
+class TestAsyncRuntime(unittest.TestCase):
+    def setUp(self):
+        self.stdin = PipeInput()
+        self.addCleanup(self.stdin.close)
+        self.frames = 0
+        self.pressed = []
+
+    def draw_frame(self):
+        self.frames += 1
+        if self.frames == 2:
+            self.stdin.send("+x+ ")
+        elif self.frames == 4:
+            self.stdin.send("q")
+
+    def test_keys_are_dispatched_until_quit(self):
+        AsyncRuntime(
+            self.draw_frame,
+            FrameScheduler(200),
+            bindings={
+                '+': lambda: self.pressed.append("faster"),
+                ' ': lambda: self.pressed.append("pause"),
+            },
+            stdin=self.stdin,
+        ).run()
+        self.assertEqual(self.pressed, ["faster", "faster", "pause"])
+        self.assertGreaterEqual(self.frames, 4)
+
+    @unittest.skipUnless(hasattr(signal, "SIGWINCH"), "needs SIGWINCH")
+    def test_resize_calls_handler(self):
+        resized = []
+
+        def draw_frame():
+            self.frames += 1
+            if self.frames == 1:
+                os.kill(os.getpid(), signal.SIGWINCH)
+            elif resized:
+                self.stdin.send("q")
+
+        AsyncRuntime(
+            draw_frame,
+            FrameScheduler(200),
+            on_resize=lambda: resized.append(True),
+            stdin=self.stdin,
+        ).run()
+        self.assertEqual(resized, [True])
+
+    def test_frame_error_stops_loop(self):
+        def draw_frame():
+            raise RuntimeError("broken frame")
+
+        runtime = AsyncRuntime(
+            draw_frame, FrameScheduler(200), stdin=self.stdin
+        )
+        with self.assertRaises(RuntimeError):
+            runtime.run()
+
+
+if __name__ == "__main__":
+    unittest.main()
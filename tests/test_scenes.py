@@ -0,0 +1,160 @@
+import json
+import os
+import random
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from terminal_solar_system import scenes
+from terminal_solar_system.main import add_solar_system
+from terminal_solar_system.planets import BODY_DTYPE, Planet, PlanetSystem
+from terminal_solar_system.scenes import (
+    load_scene,
+    save_scene,
+    scene_records,
+)
+
+SCENES = os.path.join(os.path.dirname(__file__), os.pardir, "scenes")
+DRAWN = ("radius", "line_width", "has_ring", "symbol", "fill", "color")
+ORBIT = ("orbit_radius", "period", "inclination")
+
+
+def belt(count):
+    rng = np.random.default_rng(3)
+    records = np.zeros(count, dtype=BODY_DTYPE)
+    records["radius"] = rng.uniform(0.2, 1, count)
+    records["orbit_radius"] = rng.uniform(60, 120, count)
+    records["period"] = rng.uniform(5, 30, count)
+    records["angle"] = np.nan
+    records["line_width"] = 1
+    records["symbol"] = "."
+    records["fill"] = " "
+    records["color"] = "white"
+    records["parent"] = -1
+    return records
+
+
+class TestScenes(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def assertSameBodies(self, actual, expected, angles=True):
+        self.assertEqual(len(actual), len(expected))
+        names = DRAWN + ORBIT + (("angle",) if angles else ())
+        for a, b in zip(actual, expected):
+            for name in names:
+                self.assertEqual(getattr(a, name), getattr(b, name), name)
+
+    def test_toml_example_is_the_solar_system(self):
+        expected = []
+        add_solar_system(expected)
+        for container in ([], PlanetSystem()):
+            count = load_scene(
+                os.path.join(SCENES, "solar_system.toml"), container
+            )
+            self.assertEqual(count, len(expected))
+            self.assertSameBodies(container, expected, angles=False)
+
+    def test_json_round_trip(self):
+        expected = []
+        add_solar_system(expected)
+        save_scene(self.path("scene.json"), expected)
+        with open(self.path("scene.json"), encoding="utf-8") as file:
+            self.assertEqual(json.load(file)["bodies"][6]["has_ring"], True)
+        actual = []
+        load_scene(self.path("scene.json"), actual)
+        self.assertSameBodies(actual, expected)
+
+    def test_npy_round_trip(self):
+        expected = []
+        add_solar_system(expected)
+        save_scene(self.path("scene.npy"), expected)
+        for container in ([], PlanetSystem()):
+            load_scene(self.path("scene.npy"), container)
+            self.assertSameBodies(container, expected)
+
+    def test_npy_streams_into_system(self):
+        np.save(self.path("belt.npy"), belt(40000))
+        planets = PlanetSystem()
+        load_scene(self.path("belt.npy"), planets)
+        self.assertEqual(len(planets), 40000)
+        self.assertTrue(
+            ((0 <= planets.angle) & (planets.angle < 2 * np.pi)).all()
+        )
+        self.assertIs(planets[123]._system, planets)
+        planets.update(planets.time + 1)
+        self.assertTrue(np.any(planets.x != 0))
+        np.testing.assert_array_equal(
+            scene_records(planets)["orbit_radius"], belt(40000)["orbit_radius"]
+        )
+
+    def test_random_angles_follow_seed(self):
+        np.save(self.path("belt.npy"), belt(100))
+        angles = []
+        for _ in range(2):
+            random.seed(9)
+            planets = PlanetSystem()
+            load_scene(self.path("belt.npy"), planets)
+            angles.append(planets.angle.copy())
+        np.testing.assert_array_equal(*angles)
+
+    def test_large_belt_loads_quickly(self):
+        np.save(self.path("belt.npy"), belt(100000))
+        start = time.perf_counter()
+        load_scene(self.path("belt.npy"), PlanetSystem())
+        self.assertLess(time.perf_counter() - start, 1.0)
+
+    def test_parents_round_trip(self):
+        expected = []
+        add_solar_system(expected)
+        earth = expected[3]
+        moon = Planet(1, 8, 1.3, angle=0.0, parent=earth)
+        expected += [moon, Planet(0.5, 2, 0.4, angle=0.0, parent=moon)]
+        for name in ("scene.json", "scene.npy"):
+            save_scene(self.path(name), expected)
+            for container in ([], PlanetSystem()):
+                load_scene(self.path(name), container)
+                self.assertIs(container[10].parent, container[3])
+                self.assertIs(container[11].parent, container[10])
+                self.assertIsNone(container[3].parent)
+
+    def test_parents_across_chunks(self):
+        records = belt(50)
+        records["parent"][10:] = np.arange(40) // 2
+        np.save(self.path("moons.npy"), records)
+        planets = PlanetSystem([Planet(1, 0, 0)])
+        bodies = [Planet(1, 0, 0)]
+        with mock.patch.object(scenes, "SCENE_CHUNK_SIZE", 16):
+            load_scene(self.path("moons.npy"), planets)
+            load_scene(self.path("moons.npy"), bodies)
+        expected = np.where(records["parent"] >= 0, records["parent"] + 1, -1)
+        np.testing.assert_array_equal(planets.parent[1:], expected)
+        self.assertIs(planets[50].parent, planets[20])
+        self.assertIs(bodies[50].parent, bodies[20])
+        self.assertSameBodies(bodies[1:], planets[1:], angles=False)
+
+    def test_parent_must_come_first(self):
+        records = belt(3)
+        records["parent"][1] = 2
+        np.save(self.path("bad.npy"), records)
+        for container in ([], PlanetSystem()):
+            with self.assertRaises(ValueError):
+                load_scene(self.path("bad.npy"), container)
+
+    def test_rejects_other_arrays(self):
+        np.save(self.path("other.npy"), np.zeros(3))
+        with self.assertRaises(ValueError):
+            load_scene(self.path("other.npy"), [])
+        with self.assertRaises(ValueError):
+            load_scene(self.path("scene.yaml"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
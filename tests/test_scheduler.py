@@ -0,0 +1,72 @@
+import unittest
+
+from terminal_solar_system.scheduler import FrameScheduler, SimulationClock
+from tests.helpers import FakeClock
+
+
+class TestFrameScheduler(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock(100.0)
+        self.scheduler = FrameScheduler(
+            10, clock=self.clock, sleep=self.clock.sleep
+        )
+
+    def test_sleep_subtracts_work_time(self):
+        self.clock.now += 0.03
+        self.scheduler.wait()
+        self.assertAlmostEqual(self.clock.slept[-1], 0.07)
+        self.assertAlmostEqual(self.scheduler.work_time, 0.03)
+
+    def test_deadlines_do_not_drift(self):
+        for work in (0.01, 0.05, 0.02, 0.09):
+            self.clock.now += work
+            self.scheduler.wait()
+        self.assertAlmostEqual(self.clock.now, 100.4)
+        self.assertAlmostEqual(self.scheduler.achieved_fps, 10)
+
+    def test_overrun_skips_missed_deadlines(self):
+        self.clock.now += 0.35
+        self.scheduler.wait()
+        self.assertEqual(self.clock.slept, [])
+        self.assertEqual(self.scheduler.skipped, 2)
+        self.clock.now += 0.01
+        self.scheduler.wait()
+        self.assertAlmostEqual(self.clock.now, 100.4)
+
+    def test_advance_returns_delay_without_sleeping(self):
+        self.clock.now += 0.04
+        self.assertAlmostEqual(self.scheduler.advance(), 0.06)
+        self.assertEqual(self.clock.slept, [])
+        self.clock.now += 0.06 + 0.25
+        self.assertEqual(self.scheduler.advance(), 0.0)
+        self.assertEqual(self.scheduler.skipped, 1)
+
+    def test_str_reports_fps(self):
+        self.scheduler.wait()
+        self.assertIn("fps: 10.0/10", str(self.scheduler))
+
+
+class TestSimulationClock(unittest.TestCase):
+    def setUp(self):
+        self.wall = FakeClock(100.0)
+        self.clock = SimulationClock(self.wall)
+
+    def test_follows_wall_clock(self):
+        self.wall.now += 2
+        self.assertAlmostEqual(self.clock(), 102.0)
+
+    def test_pause_freezes_time(self):
+        self.wall.now += 1
+        self.clock.toggle_pause()
+        self.wall.now += 5
+        self.assertAlmostEqual(self.clock(), 101.0)
+        self.clock.toggle_pause()
+        self.wall.now += 1
+        self.assertAlmostEqual(self.clock(), 102.0)
+
+    def test_speed_change_does_not_jump(self):
+        self.wall.now += 1
+        self.clock.speed = 4
+        self.assertAlmostEqual(self.clock(), 101.0)
+        self.wall.now += 0.5
+        self.assertAlmostEqual(self.clock(), 103.0)
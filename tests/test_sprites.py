@@ -0,0 +1,65 @@
+import unittest
+
+from terminal_solar_system.framebuffer import blank_grid
+from terminal_solar_system.planets import Planet
+from terminal_solar_system.renderer import render_planet
+from terminal_solar_system.sprites import Sprite, SpriteCache
+
+
+class TestSprite(unittest.TestCase):
+    def test_empty_when_radius_not_positive(self):
+        self.assertEqual(len(Sprite(-2, 1, 2.2)), 0)
+
+    def test_heights_rise_towards_the_center(self):
+        sprite = Sprite(3, 1, 2.2)
+        self.assertEqual(sprite.extent, (4, 8))
+        self.assertEqual(len(sprite.fill_heights), len(sprite.fill_rows))
+        self.assertEqual(len(sprite.border_heights), len(sprite.border_rows))
+        self.assertAlmostEqual(max(sprite.fill_heights), 3.5)
+        self.assertLess(max(sprite.border_heights), min(sprite.fill_heights))
+
+    def test_symmetric(self):
+        sprite = Sprite(3, 1, 2.2)
+        cells = set(zip(sprite.border_rows, sprite.border_cols))
+        self.assertTrue(cells)
+        self.assertEqual(cells, {(-dy, -dx) for dy, dx in cells})
+
+
+class TestSpriteCache(unittest.TestCase):
+    def test_hits_and_misses(self):
+        cache = SpriteCache(quantum=0.5)
+        first = cache.get(3.1, 1, 2.2)
+        second = cache.get(2.9, 1, 2.2)
+        cache.get(3.4, 1, 2.2)
+        self.assertIs(first, second)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+        self.assertAlmostEqual(cache.hit_rate, 1 / 3)
+
+    def test_key_includes_line_width_and_scale(self):
+        cache = SpriteCache()
+        cache.get(3, 1, 2.2)
+        cache.get(3, 2, 2.2)
+        cache.get(3, 1, 2.0)
+        self.assertEqual(cache.misses, 3)
+
+    def test_evicts_least_recently_used(self):
+        cache = SpriteCache(maxsize=2, quantum=1)
+        small = cache.get(1, 1, 2.2)
+        cache.get(2, 1, 2.2)
+        cache.get(1, 1, 2.2)
+        cache.get(3, 1, 2.2)
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.get(1, 1, 2.2), small)
+        cache.get(2, 1, 2.2)
+        self.assertEqual(cache.misses, 4)
+
+    def test_stamp_matches_rasterizer_on_grid(self):
+        planet = Planet(3, 0, 0, symbol='#', fill='.', color='red', z=15)
+        for center_x, center_y in [(30, 10), (2, 1), (58, 19)]:
+            expected = blank_grid(60, 20)
+            actual = blank_grid(60, 20)
+            render_planet(expected, planet, center_x, center_y, 2.0)
+            render_planet(
+                actual, planet, center_x, center_y, 2.0, SpriteCache()
+            )
+            self.assertEqual(actual, expected)
@@ -0,0 +1,75 @@
+import os
+import subprocess
+import sys
+import unittest
+
+# Ceiling on the cumulative import time of the main module, about three
+# times what it takes without Rich or NumPy. Wall-clock times vary too much
+# between machines for the default run, so the check only runs with
+# TERMINAL_SOLAR_SYSTEM_TIMING=1 set; the tests on which modules are
+# imported always run.
+IMPORT_BUDGET_SECONDS = 0.25
+TIMING_TESTS = os.environ.get("TERMINAL_SOLAR_SYSTEM_TIMING") == "1"
+
+
+def import_times(module):
+    """Returns {module: cumulative microseconds} from `python -X importtime`.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestStartup(unittest.TestCase):
+    def test_main_does_not_import_rich_or_numpy(self):
+        times = import_times("terminal_solar_system.main")
+        self.assertIn("terminal_solar_system.main", times)
+        heavy = [
+            name for name in times
+            if name.split(".")[0] in ("rich", "numpy")
+        ]
+        self.assertEqual(heavy, [])
+
+    def test_monochrome_frame_does_not_import_rich(self):
+        code = (
+            "import io, sys\n"
+            "from terminal_solar_system.output import DiffWriter\n"
+            "from terminal_solar_system.renderer import rasterize_frame\n"
+            "from terminal_solar_system.main import add_solar_system\n"
+            "planets = []\n"
+            "add_solar_system(planets)\n"
+            "buffer = rasterize_frame(planets, [], 80, 24, 2.2)\n"
+            "DiffWriter(io.StringIO(), False).write_frame(buffer)\n"
+            "print('rich' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(result.stdout.strip(), "False")
+
+    @unittest.skipUnless(
+        TIMING_TESTS, "set TERMINAL_SOLAR_SYSTEM_TIMING=1 to time imports"
+    )
+    def test_import_time_budget(self):
+        times = import_times("terminal_solar_system.main")
+        self.assertLess(
+            times["terminal_solar_system.main"] / 1e6, IMPORT_BUDGET_SECONDS
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+
+from terminal_solar_system.config import STATS_COLOR
+from terminal_solar_system.stats import FrameStats, NullStats
+from tests.helpers import FakeClock
+
+
+class TestFrameStats(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock(10.0)
+
+    def run_frames(self, stats, count):
+        for _ in range(count):
+            stats.start()
+            self.clock.now += 0.002
+            stats.mark("update")
+            self.clock.now += 0.006
+            stats.mark("rasterize")
+            stats.count("culled", 3)
+            stats.finish()
+            self.clock.now += 0.042
+
+    def test_rolling_averages(self):
+        stats = FrameStats(window=10, clock=self.clock)
+        self.run_frames(stats, 25)
+        self.assertEqual(stats.frames, 25)
+        self.assertAlmostEqual(stats.fps, 20.0)
+        self.assertEqual(len(stats.stages["update"]), 10)
+        self.assertEqual(
+            stats.hud(),
+            "fps 20.0 | frame 8.0ms | update 2.0 | rasterize 6.0 | culled 3"
+        )
+
+    def test_counts(self):
+        stats = FrameStats(clock=self.clock)
+        self.run_frames(stats, 1)
+        stats.start()
+        stats.count("culled", 7)
+        stats.finish()
+        self.assertEqual(stats.counts, {"culled": 7})
+        self.assertTrue(stats.hud().endswith(" | culled 7"))
+
+    def test_overlay_copies_top_row(self):
+        stats = FrameStats(clock=self.clock)
+        self.run_frames(stats, 2)
+        buffer = [[(' ', None)] * 8 for _ in range(2)]
+        shown = stats.overlay(buffer)
+        self.assertEqual(shown[0][0], ('f', STATS_COLOR))
+        self.assertEqual(len(shown[0]), 8)
+        self.assertIs(shown[1], buffer[1])
+        self.assertEqual(buffer[0][0], (' ', None))
+
+    def test_overlay_without_hud(self):
+        buffer = [[(' ', None)]]
+        stats = FrameStats(show_hud=False, clock=self.clock)
+        self.assertIs(stats.overlay(buffer), buffer)
+
+    def test_metrics_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for name in ("metrics.csv", "metrics.jsonl"):
+                path = os.path.join(directory, name)
+                with FrameStats(metrics_path=path, clock=self.clock) as stats:
+                    self.run_frames(stats, 3)
+                with open(path, newline="") as file:
+                    if name.endswith(".csv"):
+                        rows = list(csv.DictReader(file))
+                    else:
+                        rows = [json.loads(line) for line in file]
+                self.assertEqual(len(rows), 3)
+                self.assertAlmostEqual(float(rows[2]["rasterize_ms"]), 6.0)
+                self.assertEqual(int(rows[2]["frame"]), 2)
+                self.assertEqual(int(rows[2]["culled"]), 3)
+
+    def test_null_stats(self):
+        buffer = [[(' ', None)]]
+        with NullStats() as stats:
+            stats.start()
+            stats.mark("update")
+            stats.count("culled", 1)
+            stats.finish()
+            self.assertIs(stats.overlay(buffer), buffer)
+        self.assertFalse(stats.enabled)
+
+
+if __name__ == "__main__":
+    unittest.main()
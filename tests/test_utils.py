@@ -0,0 +1,79 @@
+import math
+import unittest
+
+import numpy as np
+
+from terminal_solar_system.config import KEPLER_TOLERANCE
+from terminal_solar_system.utils import (
+    kepler_to_cartesian_arrays,
+    polar_to_cartesian_arrays,
+    solve_kepler,
+)
+
+
+def kepler_residual(anomaly, mean, eccentricity):
+    residual = anomaly - eccentricity * np.sin(anomaly) - mean
+    return np.abs((residual + math.pi) % (2 * math.pi) - math.pi)
+
+
+class TestSolveKepler(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(4)
+        self.mean = rng.uniform(0, 2 * math.pi, 1000)
+        self.eccentricity = rng.uniform(0, 0.99, 1000)
+
+    def test_cold_start_converges(self):
+        anomaly, steps = solve_kepler(self.mean, self.eccentricity)
+        self.assertTrue(
+            (
+                kepler_residual(anomaly, self.mean, self.eccentricity)
+                <= KEPLER_TOLERANCE
+            ).all()
+        )
+        self.assertTrue(((0 <= anomaly) & (anomaly < 2 * math.pi)).all())
+        self.assertGreater(steps, 0)
+
+    def test_warm_start_takes_few_steps(self):
+        anomaly, cold_steps = solve_kepler(self.mean, self.eccentricity)
+        mean = (self.mean + 0.04) % (2 * math.pi)
+        anomaly, steps = solve_kepler(mean, self.eccentricity, anomaly)
+        self.assertTrue(
+            (
+                kepler_residual(anomaly, mean, self.eccentricity)
+                <= KEPLER_TOLERANCE
+            ).all()
+        )
+        self.assertLessEqual(steps / len(mean), 2.5)
+        self.assertLess(steps, cold_steps)
+
+    def test_bad_guess_falls_back_to_cold_start(self):
+        mean = np.array([0.1, 3.0])
+        eccentricity = np.array([0.99, 0.99])
+        anomaly, _ = solve_kepler(mean, eccentricity, np.array([5.5, 0.2]))
+        residual = kepler_residual(anomaly, mean, eccentricity)
+        self.assertTrue((residual <= KEPLER_TOLERANCE).all())
+
+    def test_circular_orbit_anomaly_is_mean(self):
+        anomaly, steps = solve_kepler(self.mean, np.zeros(1000), self.mean)
+        np.testing.assert_array_equal(anomaly, self.mean)
+        self.assertEqual(steps, 0)
+
+
+class TestKeplerToCartesian(unittest.TestCase):
+    def test_circular_matches_polar(self):
+        theta = np.linspace(0, 6, 7)
+        expected = polar_to_cartesian_arrays(10.0, theta + 0.5, 0.3)
+        actual = kepler_to_cartesian_arrays(10.0, theta, 0.0, 0.5, 0.3)
+        for a, b in zip(actual, expected):
+            np.testing.assert_allclose(a, b, atol=1e-12)
+
+    def test_apsides(self):
+        x, y, z = kepler_to_cartesian_arrays(
+            10.0, np.array([0.0, math.pi]), 0.5, 0.0, 0.0
+        )
+        np.testing.assert_allclose(x, [5.0, -15.0])
+        np.testing.assert_allclose(z, [0.0, 0.0], atol=1e-12)
+
+
+if __name__ == "__main__":
+    unittest.main()